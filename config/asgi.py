@@ -5,6 +5,9 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
+
+The real-time chat stream (hr_bolim.realtime, /events/) is only served when the
+project runs under an ASGI server, e.g. ``uvicorn config.asgi:application``.
 """
 
 import os
@@ -10,8 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -74,12 +78,59 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DATABASE_ENGINE muhit o'zgaruvchisi: sqlite (standart) yoki postgresql
+
+DATABASE_ENGINE = os.environ.get('DATABASE_ENGINE', 'sqlite')
+
+if DATABASE_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DATABASE_NAME', 'hr_bolim'),
+            'USER': os.environ.get('DATABASE_USER', 'hr_bolim'),
+            'PASSWORD': os.environ.get('DATABASE_PASSWORD', ''),
+            'HOST': os.environ.get('DATABASE_HOST', '127.0.0.1'),
+            'PORT': os.environ.get('DATABASE_PORT', '5432'),
+            # Doimiy ulanishlar; qayta ishlatishdan oldin ulanish tekshiriladi
+            'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {},
+        }
+    }
+    DATABASE_POOL_SIZE = int(os.environ.get('DATABASE_POOL_SIZE', 0))
+    if DATABASE_POOL_SIZE:
+        # psycopg[pool] kerak. Pool bilan CONN_MAX_AGE ishlatilmaydi (0 bo'lishi shart)
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': min(2, DATABASE_POOL_SIZE),
+            'max_size': DATABASE_POOL_SIZE,
+            'timeout': 10,
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DATABASE_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # Yozuvchi tranzaksiya boshidanoq qulf oladi: parallel yozishda
+                # "database is locked" o'rniga busy_timeout bo'yicha navbat kutiladi
+                'transaction_mode': 'IMMEDIATE',
+            },
+            # Test bazasi faylda: xotiradagi (shared cache) bazada busy_timeout ishlamaydi va
+            # parallel thread testlari (hr_bolim.tests.test_apply_concurrency) "table is locked" oladi
+            'TEST': {'NAME': os.environ.get('DATABASE_TEST_NAME', BASE_DIR / 'test_db.sqlite3')},
+        }
     }
-}
+
+# SQLite ulanishi ochilganda bajariladigan PRAGMA'lar (hr_bolim.db); {} - o'chirilgan
+SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,
+    'mmap_size': 128 * 1024 * 1024,
+} if os.environ.get('SQLITE_TUNED', '1') == '1' else {}
+# journal_mode=WAL baza faylining o'zida saqlanadi - git'dagi db.sqlite3 har bir
+# manage.py ishga tushishida o'zgarmasligi uchun faqat SQLITE_WAL=1 bo'lsa yoqiladi
+if SQLITE_PRAGMAS and os.environ.get('SQLITE_WAL', '0') == '1':
+    SQLITE_PRAGMAS = {'journal_mode': 'WAL', 'synchronous': 'NORMAL', **SQLITE_PRAGMAS}
 
 
 # Password validation
@@ -124,4 +175,130 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 AUTH_USER_MODEL = "hr_bolim.User"
 
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Full-text search (hr_bolim.search)
+SEARCH_RESULT_LIMIT = 500
+
+# Write-behind counters (hr_bolim.counters)
+COUNTER_FLUSH_INTERVAL = 10
+COUNTER_FLUSH_THRESHOLD = 100
+
+# Real-time push (hr_bolim.realtime)
+REALTIME_BROKER = 'hr_bolim.realtime.InProcessBroker'
+REALTIME_KEEPALIVE = 15
+
+# Page/object cache for public job pages (hr_bolim.pagecache)
+PAGE_CACHE_TIMEOUT = 300
+
+# Cache (hr_bolim.cache_backends)
+# CACHE_BACKEND muhit o'zgaruvchisi:
+#   locmem - har bir jarayonning o'z keshi (development, testlar)
+#   file   - bitta serverdagi barcha gunicorn worker'lari uchun umumiy
+#   redis  - bir nechta server uchun; ``redis`` paketi kerak
+CACHE_BACKENDS = {
+    'locmem': ('hr_bolim.cache_backends.LocMemCache', 'hr-bolim'),
+    'file': ('hr_bolim.cache_backends.FileBasedCache', str(BASE_DIR / 'cache')),
+    'redis': ('hr_bolim.cache_backends.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': os.environ.get('CACHE_LOCATION', CACHE_BACKENDS[CACHE_BACKEND][1]),
+        'KEY_PREFIX': 'hr_bolim',
+        'TIMEOUT': 300,
+        'OPTIONS': {'MAX_ENTRIES': 10000} if CACHE_BACKEND != 'redis' else {},
+    },
+}
+CACHE_METRICS_PUBLISH_EVERY = 100
+
+# Write-behind counters (hr_bolim.counters) o'z keshida: culling yo'q, incr atomar.
+#   locmem - har bir jarayon o'z buferini yozadi (lock bilan atomar)
+#   redis  - umumiy (INCRBY)
+# file backend'da incr oddiy get+set - parallel worker'lar oshirishlarni yo'qotadi, shuning uchun qabul qilinmaydi.
+COUNTER_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'hr-bolim-counters'),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+COUNTER_CACHE_BACKEND = os.environ.get('COUNTER_CACHE_BACKEND', 'redis' if CACHE_BACKEND == 'redis' else 'locmem')
+if COUNTER_CACHE_BACKEND not in COUNTER_CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"COUNTER_CACHE_BACKEND={COUNTER_CACHE_BACKEND!r}: hisoblagichlar uchun faqat locmem yoki redis"
+    )
+CACHES['counters'] = {
+    'BACKEND': COUNTER_CACHE_BACKENDS[COUNTER_CACHE_BACKEND][0],
+    'LOCATION': os.environ.get('COUNTER_CACHE_LOCATION', COUNTER_CACHE_BACKENDS[COUNTER_CACHE_BACKEND][1]),
+    'KEY_PREFIX': 'hr_bolim',
+    'TIMEOUT': None,
+    # Yozilmagan ko'rishlar hech qachon chiqarib yuborilmasin
+    'OPTIONS': {'MAX_ENTRIES': sys.maxsize} if COUNTER_CACHE_BACKEND == 'locmem' else {},
+}
+
+# Sessiyalar keshdan o'qiladi, bazaga ham yoziladi (kesh tozalansa yo'qolmaydi)
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Batched audit log writer (hr_bolim.audit)
+AUDIT_LOG_ASYNC = True
+AUDIT_LOG_BATCH_SIZE = 100
+AUDIT_LOG_QUEUE_SIZE = 10000
+AUDIT_LOG_FLUSH_INTERVAL = 1.0
+
+# Request throttling (hr_bolim.throttle): endpoint -> {kalit turi: (limit, oyna soniyalarda)}
+THROTTLE_RATES = {
+    'login': {'ip': (20, 300), 'username': (5, 300)},
+    'register': {'ip': (10, 3600)},
+    'employer_register': {'ip': (10, 3600)},
+    'complaint': {'ip': (5, 3600)},
+    'chat_send': {'user': (30, 60), 'ip': (120, 60)},
+}
+# Ishonchli reverse proxy'lar (IP yoki CIDR): REMOTE_ADDR shulardan biri bo'lsa, mijoz
+# IP'si X-Forwarded-For'dan olinadi (hr_bolim.throttle). Bo'sh - sarlavhaga ishonilmaydi
+THROTTLE_TRUSTED_PROXIES = [
+    proxy.strip() for proxy in os.environ.get('THROTTLE_TRUSTED_PROXIES', '').split(',') if proxy.strip()
+]
+
+# Account deletion executor (hr_bolim.deletion)
+DELETION_GRACE_DAYS = 30
+DELETION_BATCH_SIZE = 500
+# Bo'lak ishlovi bundan uzoq davom etmasligi kerak - aks holda so'rovni boshqa executor oladi
+DELETION_LEASE_SECONDS = 600
+
+# Candidate-job matching (hr_bolim.matching): bitta termin uchun o'qiladigan eng og'ir postinglar soni
+MATCHING_POSTINGS_PER_TERM = 2000
+
+# Saved-search alerts (hr_bolim.alerts)
+SITE_URL = os.environ.get('SITE_URL', 'http://localhost:8000')
+SAVED_SEARCH_LIMIT = 20
+SAVED_SEARCH_DIGEST_MAX_JOBS = 10
+
+# Email: SMTP sozlamalari muhitdan; testlar uchun EMAIL_BACKEND=django.core.mail.backends.locmem.EmailBackend
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', '0') == '1'
+EMAIL_TIMEOUT = 30
+EMAIL_FILE_PATH = os.environ.get('EMAIL_FILE_PATH', BASE_DIR / 'sent_emails')
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@hr-bolim.uz')
+
+# Outbound email queue (hr_bolim.outbox): soniyalarda
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_LEASE_SECONDS = 300
+OUTBOX_DIGEST_DELAY = 600
+OUTBOX_RETRY_BASE = 60
+OUTBOX_RETRY_MAX = 6 * 3600
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_KEEP_DAYS = 30
+
+# Background task queue (hr_bolim.taskqueue, manage.py runworker)
+# TASKS_EAGER=1 - worker'siz: vazifalar commit'dan keyin shu jarayonda bajariladi
+TASKS_EAGER = os.environ.get('TASKS_EAGER', '0') == '1'
+TASKS_POOL = os.environ.get('TASKS_POOL', 'thread')
+TASKS_CONCURRENCY = int(os.environ.get('TASKS_CONCURRENCY', 4))
+TASKS_LEASE_SECONDS = 60
+TASKS_RETRY_BASE = 30
+TASKS_RETRY_MAX = 3600
+TASKS_KEEP_DAYS = 7
+TASKS_METRICS_INTERVAL = 60
@@ -1,17 +1,21 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin
 from .models import (
     User, Department, Job, Application, Contact, ConsentLog, PrivacyPolicy, DataDeletionRequest, AuditLog,
     # Candidate models
-    CandidateProfile, Experience, Education, Resume, SavedJob,
+    CandidateProfile, Experience, Education, Resume, SavedJob, SavedSearch,
     # Employer models  
     Company, CompanyProfile, EmployerJob, CandidateApplication, Interview,
     # Message model
     Message,
+    OutboundEmail, Task,
 )
 from django.utils.html import format_html
 import json
 from django.http import HttpResponse
+from django.utils import timezone
+from . import feed, stats, pagecache, deletion, matching, alerts, taskqueue
+from .search import employer_job_index, job_index
 
 # User Admin
 @admin.register(User)
@@ -73,11 +77,17 @@ class JobAdmin(admin.ModelAdmin):
     @admin.action(description="Ishlarni yopish (Close)")
     def close_jobs(self, request, queryset):
         queryset.update(status='closed')
+        feed.sync_queryset('job', queryset)
+        job_index.sync_queryset(queryset.select_related('department'))
+        pagecache.invalidate()
         self.message_user(request, "Tanlangan ishlar yopildi.")
 
     @admin.action(description="Ishlarni ochish (Open)")
     def open_jobs(self, request, queryset):
         queryset.update(status='open')
+        feed.sync_queryset('job', queryset)
+        job_index.sync_queryset(queryset.select_related('department'))
+        pagecache.invalidate()
         self.message_user(request, "Tanlangan ishlar ochildi.")
 
 # GDPR Admin
@@ -95,14 +105,26 @@ class PrivacyPolicyAdmin(admin.ModelAdmin):
 
 @admin.register(DataDeletionRequest)
 class DataDeletionRequestAdmin(admin.ModelAdmin):
-    list_display = ('user', 'requested_at', 'status', 'processed_at')
+    list_display = ('user', 'requested_at', 'status', 'stage', 'progress', 'processed_at')
     list_filter = ('status', 'requested_at')
-    actions = ['mark_completed', 'mark_rejected']
-
-    @admin.action(description="So'rovni bajarildi deb belgilash")
-    def mark_completed(self, request, queryset):
-        queryset.update(status='completed', processed_at=timezone.now())
-        self.message_user(request, "So'rovlar bajarildi deb belgilandi.")
+    readonly_fields = ('stage', 'progress', 'started_at', 'last_error')
+    actions = ['process_now', 'mark_rejected']
+
+    @admin.action(description="So'rovni hozir bajarish (ma'lumotlarni o'chirish)")
+    def process_now(self, request, queryset):
+        # Katta hisoblar uchun process_deletion_requests buyrug'i afzal
+        skipped = 0
+        for deletion_request in queryset.filter(status__in=['pending', 'processing']):
+            try:
+                processed = deletion.process(deletion_request)
+            except deletion.ClaimLost:
+                processed = False
+            skipped += not processed
+        if skipped:
+            self.message_user(
+                request, f"{skipped} ta so'rovni boshqa jarayon bajaryapti - o'tkazib yuborildi.", messages.WARNING,
+            )
+        self.message_user(request, "So'rovlar bajarildi.")
 
     @admin.action(description="So'rovni rad etilgan deb belgilash")
     def mark_rejected(self, request, queryset):
@@ -157,6 +179,40 @@ class SavedJobAdmin(admin.ModelAdmin):
     list_filter = ('saved_at',)
     search_fields = ('user__email', 'job__title')
 
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('user', 'query', 'location', 'employment_type', 'is_active', 'created_at', 'last_digest_at')
+    list_filter = ('is_active', 'employment_type', 'created_at')
+    search_fields = ('user__email', 'query', 'location')
+    raw_id_fields = ('user', 'company', 'department')
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('to_email', 'subject', 'kind', 'digest', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status', 'kind', 'digest', 'created_at')
+    search_fields = ('to_email', 'subject')
+    raw_id_fields = ('user',)
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
+    actions = ['retry_now']
+
+    @admin.action(description="Qayta yuborish (navbatga qaytarish)")
+    def retry_now(self, request, queryset):
+        count = queryset.exclude(status='sent').update(status='pending', attempts=0, next_attempt_at=timezone.now())
+        self.message_user(request, f"{count} ta xat navbatga qaytarildi.")
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'priority', 'attempts', 'scheduled_at', 'locked_by', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'unique_key')
+    readonly_fields = ('locked_by', 'lease_until', 'heartbeat_at', 'started_at', 'finished_at', 'last_error', 'created_at')
+    actions = ['retry_now']
+
+    @admin.action(description="Qayta bajarish (navbatga qaytarish)")
+    def retry_now(self, request, queryset):
+        count = sum(taskqueue.retry(task_row) for task_row in queryset.filter(status='failed'))
+        self.message_user(request, f"{count} ta vazifa navbatga qaytarildi.")
+
 # Employer Models
 @admin.register(Company)
 class CompanyAdmin(admin.ModelAdmin):
@@ -168,11 +224,13 @@ class CompanyAdmin(admin.ModelAdmin):
     @admin.action(description="Kompaniyalarni tasdiqlash")
     def verify_companies(self, request, queryset):
         queryset.update(is_verified=True)
+        pagecache.invalidate()
         self.message_user(request, "Kompaniyalar tasdiqlandi.")
 
     @admin.action(description="Kompaniyalarni tasdiqlashdan olish")
     def unverify_companies(self, request, queryset):
         queryset.update(is_verified=False)
+        pagecache.invalidate()
         self.message_user(request, "Kompaniyalar tasdiqlashdan olindi.")
 
 @admin.register(CompanyProfile)
@@ -190,17 +248,35 @@ class EmployerJobAdmin(admin.ModelAdmin):
 
     @admin.action(description="Ishlarni faollashtirish")
     def activate_jobs(self, request, queryset):
+        activated = list(queryset.exclude(status='active').values_list('pk', flat=True))
         queryset.update(status='active')
+        for pk in activated:
+            alerts.match_job(pk)
+        feed.sync_queryset('employer_job', queryset)
+        employer_job_index.sync_queryset(queryset)
+        matching.sync_jobs(queryset)
+        pagecache.invalidate()
+        stats.rebuild_totals(queryset.values_list('company_id', flat=True).distinct())
         self.message_user(request, "Ishlar faollashtirildi.")
 
     @admin.action(description="Ishlarni pauza qilish")
     def pause_jobs(self, request, queryset):
         queryset.update(status='paused')
+        feed.sync_queryset('employer_job', queryset)
+        employer_job_index.sync_queryset(queryset)
+        matching.sync_jobs(queryset)
+        pagecache.invalidate()
+        stats.rebuild_totals(queryset.values_list('company_id', flat=True).distinct())
         self.message_user(request, "Ishlar pauza qilindi.")
 
     @admin.action(description="Ishlarni yopish")
     def close_jobs(self, request, queryset):
         queryset.update(status='closed')
+        feed.sync_queryset('employer_job', queryset)
+        employer_job_index.sync_queryset(queryset)
+        matching.sync_jobs(queryset)
+        pagecache.invalidate()
+        stats.rebuild_totals(queryset.values_list('company_id', flat=True).distinct())
         self.message_user(request, "Ishlar yopildi.")
 
 @admin.register(CandidateApplication)
@@ -212,12 +288,14 @@ class CandidateApplicationAdmin(admin.ModelAdmin):
 
     @admin.action(description="Arizalarni qabul qilish")
     def accept_applications(self, request, queryset):
-        queryset.update(status='accepted')
+        queryset.exclude(status='accepted').update(status='accepted', hired_at=timezone.now())
+        stats.rebuild(queryset.values_list('job__company_id', flat=True).distinct())
         self.message_user(request, "Arizalar qabul qilindi.")
 
     @admin.action(description="Arizalarni rad etish")
     def reject_applications(self, request, queryset):
-        queryset.update(status='rejected')
+        queryset.update(status='rejected', hired_at=None)
+        stats.rebuild(queryset.values_list('job__company_id', flat=True).distinct())
         self.message_user(request, "Arizalar rad etildi.")
 
 @admin.register(Interview)
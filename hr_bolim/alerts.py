@@ -0,0 +1,273 @@
+"""
+Saved-search alerts.
+
+Saqlangan qidiruv (SavedSearch) kalitlar to'plamiga aylantiriladi va
+teskari indeksga (SavedSearchKey) yoziladi:
+
+- ``q:<token>``       - so'rovdagi har bir token (jobs_list'dagi kabi prefix),
+- ``type:<qiymat>``   - ish turi,
+- ``company:<id>``    - kompaniya,
+- ``*``               - kalitsiz (faqat maosh filtri yoki umuman filtrsiz) qidiruv.
+
+EmployerJob faol bo'lganda vakansiya ham o'z kalitlariga aylantiriladi
+(matndagi tokenlarning barcha prefikslari va h.k.). Bitta so'rov ``key IN
+(...)`` bo'yicha har bir qidiruvning nechta kaliti mos kelganini sanaydi;
+soni SavedSearch.required_keys ga teng bo'lganlar - barcha shartlari
+bajarilgan qidiruvlar. Maosh oralig'i va joylashuv shu nomzodlar ustida
+tekshiriladi - joylashuv jobs_list'dagi ``location__icontains`` kabi butun
+qator bo'yicha (tokenlarga bo'linmaydi, transliteratsiya qilinmaydi).
+Shunday qilib har bir saqlangan so'rovni qayta bajarish shart emas.
+
+Mosliklar SavedSearchMatch'ga yoziladi va ``send_search_alerts`` buyrug'i
+ularni foydalanuvchi bo'yicha bitta dayjest xatga yig'ib, hr_bolim.outbox
+navbatiga qo'yadi.
+"""
+from collections import OrderedDict
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.urls import reverse
+from django.utils import timezone
+
+from . import facets, outbox, taskqueue
+from .models import (
+    CandidateProfile, Company, Department, EmployerJob, SavedSearch, SavedSearchKey, SavedSearchMatch,
+)
+from .search import MIN_TOKEN_LENGTH, tokenize
+
+MATCH_ALL = '*'
+# Kalit ustuniga sig'ishi uchun tokenlar shu uzunlikkacha qisqartiriladi
+MAX_TOKEN_LENGTH = 60
+
+
+def _tokens(text):
+    return {token[:MAX_TOKEN_LENGTH] for token in tokenize(text)}
+
+
+def _prefixes(text):
+    return {
+        token[:size]
+        for token in _tokens(text)
+        for size in range(MIN_TOKEN_LENGTH, len(token) + 1)
+    }
+
+
+def search_keys(search):
+    keys = {f"q:{token}" for token in _tokens(search.query)}
+    if search.employment_type:
+        keys.add(f"type:{search.employment_type}")
+    if search.company_id:
+        keys.add(f"company:{search.company_id}")
+    return keys or {MATCH_ALL}
+
+
+def job_keys(job):
+    # search.employer_job_index bilan bir xil matn: sarlavha, talablar, vazifalar
+    text = ' '.join([job.title, job.requirements or '', job.responsibilities or ''])
+    keys = {f"q:{prefix}" for prefix in _prefixes(text)}
+    keys.add(f"type:{job.employment_type}")
+    keys.add(f"company:{job.company_id}")
+    keys.add(MATCH_ALL)
+    return keys
+
+
+def location_matches(search_location, job_location):
+    """filter_feed'dagi ``location__icontains`` bilan bir xil shart."""
+    location = facets.clean_text(search_location)
+    return not location or location.upper() in (job_location or '').upper()
+
+
+# ----------------------------------------------------------------
+# Saved searches
+# ----------------------------------------------------------------
+
+def index_search(search):
+    keys = search_keys(search)
+    with transaction.atomic():
+        SavedSearchKey.objects.filter(search=search).delete()
+        SavedSearchKey.objects.bulk_create([SavedSearchKey(search=search, key=key) for key in keys])
+        SavedSearch.objects.filter(pk=search.pk).update(required_keys=len(keys))
+    search.required_keys = len(keys)
+
+
+def rebuild(apps=global_apps):
+    """Barcha qidiruvlarning kalitlarini qayta yozadi (kalit formati o'zgarganda).
+
+    ``apps`` migratsiyalarda tarixiy modellar bilan ishlash uchun.
+    """
+    Search = apps.get_model('hr_bolim', 'SavedSearch')
+    Key = apps.get_model('hr_bolim', 'SavedSearchKey')
+    count = 0
+    for search in Search.objects.order_by('pk').iterator():
+        keys = search_keys(search)
+        with transaction.atomic():
+            Key.objects.filter(search=search).delete()
+            Key.objects.bulk_create([Key(search=search, key=key) for key in keys])
+            Search.objects.filter(pk=search.pk).update(required_keys=len(keys))
+        count += 1
+    return count
+
+
+def _int(value):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+def create_from_params(user, params, name=''):
+    """jobs_list GET parametrlaridan SavedSearch. Mavjud bo'lmagan bo'lim/kompaniya e'tiborsiz qoldiriladi."""
+    department_id, company_id = _int(params.get('department')), _int(params.get('company'))
+    experience = (params.get('experience') or '').strip()
+    search = SavedSearch(
+        user=user,
+        name=name.strip()[:150],
+        query=(params.get('q') or '').strip()[:200],
+        location=(params.get('location') or '').strip()[:150],
+        department_id=department_id if department_id and Department.objects.filter(pk=department_id).exists() else None,
+        company_id=company_id if company_id and Company.objects.filter(pk=company_id).exists() else None,
+        employment_type=(params.get('type') or '').strip()[:20],
+        salary_min=_int(params.get('salary_min')),
+        salary_max=_int(params.get('salary_max')),
+        experience='' if experience == 'all' else experience[:20],
+    )
+    search.save()
+    return search
+
+
+def limit_reached(user):
+    return SavedSearch.objects.filter(user=user).count() >= getattr(settings, 'SAVED_SEARCH_LIMIT', 20)
+
+
+# ----------------------------------------------------------------
+# Matching
+# ----------------------------------------------------------------
+
+def matching_searches(job):
+    """Vakansiyaga mos keladigan faol SavedSearch id'lari."""
+    keys = job_keys(job)
+    candidates = [
+        row['search_id']
+        for row in (
+            SavedSearchKey.objects.filter(key__in=keys)
+            .values('search_id', 'search__required_keys')
+            .annotate(matched=Count('id'))
+        )
+        if row['matched'] == row['search__required_keys']
+    ]
+    if not candidates:
+        return []
+    # jobs_list: salary_min -> salary_max >= min, salary_max -> salary_min <= max (NULL mos kelmaydi)
+    searches = SavedSearch.objects.filter(pk__in=candidates, is_active=True, user__is_active=True)
+    if job.salary_max is None:
+        searches = searches.filter(salary_min__isnull=True)
+    else:
+        searches = searches.filter(Q(salary_min__isnull=True) | Q(salary_min__lte=job.salary_max))
+    if job.salary_min is None:
+        searches = searches.filter(salary_max__isnull=True)
+    else:
+        searches = searches.filter(Q(salary_max__isnull=True) | Q(salary_max__gte=job.salary_min))
+    return [pk for pk, location in searches.values_list('pk', 'location') if location_matches(location, job.location)]
+
+
+@taskqueue.task(priority=5, max_attempts=5)
+def match_job(job_id):
+    """Yangi mosliklar soni. Avval mos kelgan qidiruvlar qayta yozilmaydi."""
+    job = EmployerJob.objects.filter(pk=job_id, status='active').first()
+    if job is None:
+        return 0
+    search_ids = matching_searches(job)
+    created = SavedSearchMatch.objects.bulk_create(
+        [SavedSearchMatch(search_id=pk, job=job) for pk in search_ids], ignore_conflicts=True
+    )
+    return len(created)
+
+
+def job_saved(job, previous_status):
+    """EmployerJob faol holatga o'tganda (yaratilganda yoki qayta faollashtirilganda)."""
+    if job.status == 'active' and previous_status != 'active':
+        taskqueue.enqueue(match_job, unique_key=f"alerts.match_job:{job.pk}", job_id=job.pk)
+
+
+# ----------------------------------------------------------------
+# Digests
+# ----------------------------------------------------------------
+
+def _digest_body(user, groups):
+    site = getattr(settings, 'SITE_URL', '').rstrip('/')
+    lines = [f"Assalomu alaykum, {user.get_full_name() or user.username}!", "",
+             "Saqlangan qidiruvlaringiz bo'yicha yangi vakansiyalar:", ""]
+    for search, matches in groups.values():
+        lines.append(f"== {search} ==")
+        for match in matches:
+            job = match.job
+            lines.append(f"- {job.title} ({job.company.company_name}, {job.location})")
+            lines.append(f"  {site}{reverse('job_detail', args=[job.pk])}")
+        lines.append(f"Barchasi: {site}{search.get_absolute_url()}")
+        lines.append("")
+    lines.append("Xabarnomalarni saqlangan qidiruvlar sahifasida o'chirishingiz mumkin.")
+    return '\n'.join(lines)
+
+
+def pending_matches():
+    return (
+        SavedSearchMatch.objects.filter(notified_at__isnull=True)
+        .select_related('search__user', 'job__company')
+        .order_by('search__user_id', 'search_id', '-matched_at')
+    )
+
+
+def build_digests(matches):
+    """[(user, [match, ...], (mavzu, matn) yoki None)] - har bir foydalanuvchiga bitta xat.
+
+    Yopilgan vakansiyalar, o'chirilgan qidiruvlar va email'siz yoki
+    ishlov berishni cheklagan foydalanuvchilar uchun xat tuzilmaydi -
+    mosliklar baribir yuborilgan deb belgilanadi.
+    """
+    per_search = getattr(settings, 'SAVED_SEARCH_DIGEST_MAX_JOBS', 10)
+    users = OrderedDict()
+    for match in matches:
+        users.setdefault(match.search.user_id, (match.search.user, []))[1].append(match)
+
+    restricted = set(
+        CandidateProfile.objects.filter(user_id__in=list(users), is_processing_restricted=True)
+        .values_list('user_id', flat=True)
+    )
+    digests = []
+    for user_id, (user, matches) in users.items():
+        groups = OrderedDict()
+        for match in matches:
+            if match.job.status != 'active' or not match.search.is_active:
+                continue
+            group = groups.setdefault(match.search_id, (match.search, []))[1]
+            if len(group) < per_search:
+                group.append(match)
+        message = None
+        if groups and user.email and user.is_active and user_id not in restricted:
+            total = sum(len(group) for _search, group in groups.values())
+            message = (
+                f"{total} ta yangi vakansiya saqlangan qidiruvlaringiz bo'yicha",
+                _digest_body(user, groups),
+            )
+        digests.append((user, matches, message))
+    return digests
+
+
+def send_digests(limit=None):
+    """Dayjestlarni outbox navbatiga qo'yadi. (navbatga qo'yilgan xatlar, belgilangan mosliklar)."""
+    matches = list(pending_matches()[:limit] if limit else pending_matches())
+    queued = 0
+    with transaction.atomic():
+        for user, _matches, message in build_digests(matches):
+            if message is not None:
+                subject, body = message
+                outbox.notify(user, subject, body, kind='search_alert')
+                queued += 1
+
+        now = timezone.now()
+        SavedSearchMatch.objects.filter(pk__in=[match.pk for match in matches]).update(notified_at=now)
+        SavedSearch.objects.filter(pk__in={match.search_id for match in matches}).update(last_digest_at=now)
+    return queued, len(matches)
@@ -0,0 +1,103 @@
+"""
+Employer funnel analytics.
+
+Voronka (ko'rishlar -> arizalar -> intervyular -> ishga olish) va ishga olish
+vaqti JobStatsDaily kunlik qatorlaridan hisoblanadi (hr_bolim.stats ularni
+yuritadi). So'rov (company, date) indeksi bo'yicha faqat jamlangan qatorlarni
+o'qiydi, shuning uchun 12 oylik grafik arizalar jadvalini skan qilmaydi.
+"""
+from datetime import timedelta
+
+from django.db.models import DateField, F, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from .models import JobStatsDaily
+
+PERIODS = ('day', 'week', 'month')
+DEFAULT_DAYS = {'day': 30, 'week': 12 * 7, 'month': 365}
+
+FUNNEL_FIELDS = ('views', 'applications', 'interviews', 'hires', 'hire_seconds')
+
+
+def _bucket_start(date, period):
+    if period == 'week':
+        return date - timedelta(days=date.weekday())
+    if period == 'month':
+        return date.replace(day=1)
+    return date
+
+
+def _next_bucket(date, period):
+    if period == 'week':
+        return date + timedelta(days=7)
+    if period == 'month':
+        return (date.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return date + timedelta(days=1)
+
+
+def _rate(part, whole):
+    return round(part * 100 / whole, 1) if whole else 0
+
+
+def _with_rates(row):
+    row['apply_rate'] = _rate(row['applications'], row['views'])
+    row['interview_rate'] = _rate(row['interviews'], row['applications'])
+    row['hire_rate'] = _rate(row['hires'], row['interviews'])
+    row['avg_days_to_hire'] = round(row['hire_seconds'] / row['hires'] / 86400, 1) if row['hires'] else None
+    return row
+
+
+def funnel(company, period='week', days=None, job=None, today=None):
+    """Davr bo'yicha voronka: ``{'period', 'buckets': [...], 'totals': {...}}``.
+
+    Bo'sh davrlar ham (nollar bilan) qaytariladi - grafik uzilmasligi uchun.
+    """
+    if period not in PERIODS:
+        period = 'week'
+    today = today or timezone.localdate()
+    start = _bucket_start(today - timedelta(days=(days or DEFAULT_DAYS[period]) - 1), period)
+
+    rows = JobStatsDaily.objects.filter(company=company, date__gte=start, date__lte=today)
+    if job is not None:
+        rows = rows.filter(job=job)
+    bucket = F('date') if period == 'day' else Trunc('date', period, output_field=DateField())
+    rows = (
+        rows.annotate(bucket=bucket).values('bucket')
+        .annotate(**{field: Sum(field) for field in FUNNEL_FIELDS})
+        .order_by('bucket')
+    )
+    by_bucket = {row['bucket']: row for row in rows}
+
+    buckets = []
+    totals = dict.fromkeys(FUNNEL_FIELDS, 0)
+    current = start
+    while current <= today:
+        row = by_bucket.get(current) or dict.fromkeys(FUNNEL_FIELDS, 0)
+        values = {field: row[field] or 0 for field in FUNNEL_FIELDS}
+        for field in FUNNEL_FIELDS:
+            totals[field] += values[field]
+        buckets.append(_with_rates({'start': current, **values}))
+        current = _next_bucket(current, period)
+
+    return {'period': period, 'buckets': buckets, 'totals': _with_rates(totals)}
+
+
+def time_to_hire(company, days=365, today=None, limit=10):
+    """Vakansiyalar bo'yicha o'rtacha ishga olish vaqti (kunlarda), eng ko'p ishga olganlari boshida."""
+    today = today or timezone.localdate()
+    rows = (
+        JobStatsDaily.objects.filter(company=company, date__gt=today - timedelta(days=days), hires__gt=0)
+        .values('job_id', 'job__title')
+        .annotate(hires=Sum('hires'), hire_seconds=Sum('hire_seconds'))
+        .order_by('-hires', 'job_id')[:limit]
+    )
+    return [
+        {
+            'job_id': row['job_id'],
+            'title': row['job__title'],
+            'hires': row['hires'],
+            'avg_days': round(row['hire_seconds'] / row['hires'] / 86400, 1),
+        }
+        for row in rows
+    ]
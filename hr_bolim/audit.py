@@ -0,0 +1,140 @@
+"""
+Batched AuditLog writer.
+
+``audit.log(action, user=None, ip_address=None)`` so'rov ichida bazaga
+yozmaydi: yozuv jarayon ichidagi chegaralangan navbatga qo'yiladi, fon
+thread'i esa navbatni AUDIT_LOG_BATCH_SIZE tadan ``bulk_create`` bilan
+yozadi (yoki AUDIT_LOG_FLUSH_INTERVAL soniyada bir marta).
+
+- navbat to'lsa (AUDIT_LOG_QUEUE_SIZE) yozuv so'rov ichida sinxron yoziladi -
+  hech narsa tashlab yuborilmaydi;
+- jarayon tugayotganda (atexit) navbat oxirigacha yoziladi;
+- AUDIT_LOG_ASYNC = False bo'lsa har bir yozuv darhol yoziladi (masalan
+  tranzaksiya ichida yaratilgan foydalanuvchilar bilan ishlaydigan buyruqlar).
+
+created_at yozilgan vaqt bo'yicha (auto_now_add), ya'ni hodisadan
+AUDIT_LOG_FLUSH_INTERVAL gacha keyin bo'lishi mumkin.
+"""
+import atexit
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+
+from .models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWriter:
+
+    def __init__(self):
+        self._queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+        # Fon thread'i va flush() bir vaqtda yozmasligi uchun
+        self._write_lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return getattr(settings, 'AUDIT_LOG_ASYNC', True)
+
+    @property
+    def batch_size(self):
+        return getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 100)
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 1.0)
+
+    def log(self, action, user=None, ip_address=None):
+        entry = AuditLog(user=user, action=action[:255], ip_address=ip_address)
+        if not self.enabled:
+            self._write([entry])
+            return
+        self._start()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._write([entry])
+
+    def _start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=getattr(settings, 'AUDIT_LOG_QUEUE_SIZE', 10000))
+            self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            batch.extend(self._drain(self.batch_size - 1))
+            try:
+                close_old_connections()
+                self._write(batch)
+            except Exception:
+                logger.exception("Audit writer failed, %d entries dropped", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _drain(self, limit=None):
+        entries = []
+        while limit is None or len(entries) < limit:
+            try:
+                entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return entries
+
+    def _write(self, entries):
+        with self._write_lock:
+            try:
+                AuditLog.objects.bulk_create(entries, batch_size=self.batch_size)
+            except DatabaseError:
+                # Masalan, navbatdagi yozuv foydalanuvchisi o'chirilgan - qolganlari yo'qolmasin
+                logger.exception("Audit batch of %d failed, retrying one by one", len(entries))
+                for entry in entries:
+                    try:
+                        AuditLog.objects.bulk_create([entry])
+                    except DatabaseError:
+                        logger.exception("Audit entry dropped: %s", entry.action)
+
+    def flush(self):
+        """Navbatdagi barcha yozuvlarni hozir yozadi va fon thread'i olib
+        ketgan partiya yozilishini ham kutadi."""
+        if self._queue is None:
+            return 0
+        entries = self._drain()
+        try:
+            if entries:
+                self._write(entries)
+        finally:
+            for _ in entries:
+                self._queue.task_done()
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        return len(entries)
+
+
+writer = AuditWriter()
+
+
+def log(action, user=None, ip_address=None):
+    writer.log(action, user=user, ip_address=ip_address)
+
+
+def flush():
+    return writer.flush()
+
+
+atexit.register(flush)
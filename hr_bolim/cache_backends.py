@@ -0,0 +1,145 @@
+"""
+Cache backends with hit/miss metrics.
+
+Django'ning standart backend'lari (LocMem, FileBased, Redis) ustidan yupqa
+qatlam: har bir ``get``/``get_many`` natijasi hit yoki miss sifatida
+sanaladi. Sonlar avval jarayon ichida yig'iladi va har
+CACHE_METRICS_PUBLISH_EVERY o'qishda (hamda jarayon tugayotganda) keshning
+o'zidagi ``cachemetrics:*`` kalitlariga qo'shiladi - umumiy backend (file,
+redis) bo'lsa, barcha worker'lar yig'indisi ko'rinadi.
+
+Qaysi backend ishlatilishi CACHE_BACKEND muhit o'zgaruvchisi bilan tanlanadi
+(config/settings.py).
+"""
+import atexit
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache.backends import filebased, locmem, redis
+
+logger = logging.getLogger(__name__)
+
+METRIC_NAMES = ('hits', 'misses')
+
+_all_metrics = weakref.WeakSet()
+
+
+class CacheMetrics:
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._local = dict.fromkeys(METRIC_NAMES, 0)
+        self._pending = 0
+        self._lock = threading.Lock()
+        # get_many() va incr() ichki get() chaqiruvlari ikki marta sanalmasligi uchun
+        self._suspended = threading.local()
+        _all_metrics.add(self)
+
+    @property
+    def publish_every(self):
+        return getattr(settings, 'CACHE_METRICS_PUBLISH_EVERY', 100)
+
+    @property
+    def suspended(self):
+        return getattr(self._suspended, 'depth', 0) > 0
+
+    @contextmanager
+    def suspend(self):
+        self._suspended.depth = getattr(self._suspended, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._suspended.depth -= 1
+
+    def record(self, hits=0, misses=0):
+        if self.suspended:
+            return
+        with self._lock:
+            self._local['hits'] += hits
+            self._local['misses'] += misses
+            self._pending += hits + misses
+            due = self._pending >= self.publish_every
+        if due:
+            self.publish()
+
+    def publish(self):
+        with self._lock:
+            local, self._local = self._local, dict.fromkeys(METRIC_NAMES, 0)
+            self._pending = 0
+        with self.suspend():
+            for name, n in local.items():
+                if n:
+                    key = f'cachemetrics:{name}'
+                    self.cache.add(key, 0, None)
+                    try:
+                        self.cache.incr(key, n)
+                    except ValueError:
+                        # Kalit add() va incr() orasida o'chib ketgan
+                        self.cache.set(key, n, None)
+
+    def snapshot(self):
+        """Barcha jarayonlar bo'yicha jami: ``{'hits', 'misses', 'hit_rate'}``."""
+        self.publish()
+        with self.suspend():
+            values = self.cache.get_many([f'cachemetrics:{name}' for name in METRIC_NAMES])
+        result = {name: values.get(f'cachemetrics:{name}', 0) for name in METRIC_NAMES}
+        total = result['hits'] + result['misses']
+        result['hit_rate'] = round(result['hits'] * 100 / total, 1) if total else 0
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._local = dict.fromkeys(METRIC_NAMES, 0)
+            self._pending = 0
+        self.cache.delete_many([f'cachemetrics:{name}' for name in METRIC_NAMES])
+
+
+class MetricsMixin:
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = CacheMetrics(self)
+
+    def get(self, key, default=None, version=None):
+        sentinel = object()
+        value = super().get(key, sentinel, version=version)
+        if value is sentinel:
+            self.metrics.record(misses=1)
+            return default
+        self.metrics.record(hits=1)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        with self.metrics.suspend():
+            values = super().get_many(keys, version=version)
+        self.metrics.record(hits=len(values), misses=len(keys) - len(values))
+        return values
+
+    def incr(self, key, delta=1, version=None):
+        with self.metrics.suspend():
+            return super().incr(key, delta, version=version)
+
+
+class LocMemCache(MetricsMixin, locmem.LocMemCache):
+    pass
+
+
+class FileBasedCache(MetricsMixin, filebased.FileBasedCache):
+    pass
+
+
+class RedisCache(MetricsMixin, redis.RedisCache):
+    """``redis`` paketi kerak (requirements.txt da yo'q - faqat CACHE_BACKEND=redis bo'lsa o'rnatiladi)."""
+
+
+@atexit.register
+def _publish_all():
+    for metrics in list(_all_metrics):
+        try:
+            metrics.publish()
+        except Exception:
+            logger.exception("Cache metrics publish failed")
@@ -0,0 +1,75 @@
+"""
+Chat history with id-based cursors.
+
+Message.id vaqt bo'yicha o'suvchi, shuning uchun u cursor sifatida ishlatiladi:
+- ``before=<id>`` - eski xabarlarga qaytish (eng yangi sahifa birinchi),
+- ``after=<id>`` - oxirgi ko'rilgan id'dan keyingi yangi xabarlar (polling).
+"""
+from django.db import transaction
+from django.db.models import Q
+
+from . import realtime
+from .models import Conversation, Message
+
+PAGE_SIZE = 50
+
+
+def thread(user, other_user):
+    return Message.objects.filter(
+        Q(sender=user, recipient=other_user) |
+        Q(sender=other_user, recipient=user)
+    )
+
+
+def history(user, other_user, before=None, after=None, limit=PAGE_SIZE):
+    """(messages, has_more) - xabarlar har doim eskidan yangiga tartiblangan.
+
+    ``after`` berilsa, ``has_more`` undan keyin yana xabarlar borligini,
+    aks holda ``before`` dan oldin eskiroq xabarlar borligini bildiradi.
+    """
+    messages_qs = thread(user, other_user)
+    if after is not None:
+        page = list(messages_qs.filter(id__gt=after).order_by('id')[:limit + 1])
+        return page[:limit], len(page) > limit
+
+    if before is not None:
+        messages_qs = messages_qs.filter(id__lt=before)
+    page = list(messages_qs.order_by('-id')[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+    page.reverse()
+    return page, has_more
+
+
+def mark_read_until(user, other_user, messages):
+    """Faqat foydalanuvchiga yetkazilgan (``messages`` ichidagi) eng oxirgi
+    xabargacha bo'lgan kiruvchi xabarlarni o'qilgan deb belgilaydi."""
+    last_id = max((m.id for m in messages if m.sender_id == other_user.id), default=None)
+    if last_id is None:
+        return 0
+    updated = Message.objects.filter(
+        sender=other_user, recipient=user, is_read=False, id__lte=last_id
+    ).update(is_read=True)
+    if updated:
+        Conversation.mark_read(user, other_user, updated)
+        transaction.on_commit(lambda: realtime.publish_read(user.id, other_user.id, last_id))
+    return updated
+
+
+def serialize(message):
+    return {
+        'id': message.id,
+        'sender_id': message.sender_id,
+        'recipient_id': message.recipient_id,
+        'content': message.content,
+        'attachment': message.attachment.url if message.attachment else None,
+        'is_read': message.is_read,
+        'timestamp': message.timestamp.isoformat(),
+    }
+
+
+def parse_cursor(value):
+    try:
+        return int(value) if value not in (None, '') else None
+    except ValueError:
+        return None
@@ -0,0 +1,175 @@
+"""
+Write-behind counters.
+
+Sahifa ko'rishlar soni har bir so'rovda UPDATE qilinmaydi: oshirishlar
+alohida ``counters`` keshida (``counter:<model>:<field>:<pk>`` kalitlari,
+cache.incr) yig'iladi va vaqti-vaqti bilan ``F(field) + n`` ko'rinishidagi
+guruhlangan UPDATE'lar bilan yoziladi. Bir xil n qiymatiga ega barcha
+qatorlar bitta so'rov bilan yangilanadi.
+
+``counters`` keshi culling qilmaydi (yozilmagan ko'rish chiqarib
+yuborilmaydi) va incr'i atomar bo'lishi shart: locmem (jarayon ichida
+lock) yoki redis (INCRBY, barcha worker'lar uchun umumiy). incr'i
+get+set bo'lgan backend (file, db) bilan modul import qilinmaydi.
+
+Bufer quyidagi hollarda yoziladi:
+- oxirgi yozishdan beri COUNTER_FLUSH_INTERVAL soniya o'tgan bo'lsa,
+- shu jarayondagi oshirishlar COUNTER_FLUSH_THRESHOLD ga yetgan bo'lsa,
+- jarayon tugayotganda (atexit).
+
+Har bir jarayon faqat o'zi oshirgan kalitlarni yozadi; bir vaqtda faqat
+bitta jarayon yozishi uchun keshdagi qulf (cache.add) ishlatiladi.
+Yozishda keshdan o'qilgan n bazaga qo'shiladi va keyin keshdan ayiriladi
+(cache.decr) - shu orada kelgan oshirishlar yo'qolmaydi.
+
+``on_flush(pks, n)`` - muvaffaqiyatli UPDATE'dan keyin chaqiriladi (masalan
+vakansiya ko'rishlarini JobStatsDaily kunlik qatorlariga yozish uchun).
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError
+from django.db.models import F
+from django.utils.connection import ConnectionProxy
+
+from . import stats
+from .models import CandidateProfile, CompanyProfile, EmployerJob
+
+logger = logging.getLogger(__name__)
+
+LOCK_TIMEOUT = 60
+CACHE_ALIAS = 'counters'
+
+cache = ConnectionProxy(caches, CACHE_ALIAS)
+
+
+def check_backend():
+    backend = caches[CACHE_ALIAS]
+    if type(backend).incr is BaseCache.incr:
+        raise ImproperlyConfigured(
+            f"CACHES[{CACHE_ALIAS!r}]: {type(backend).__name__}.incr atomar emas (get+set) - "
+            "parallel worker'lar ko'rishlarni yo'qotadi. locmem yoki redis ishlating."
+        )
+
+
+check_backend()
+
+
+class BufferedCounter:
+
+    def __init__(self, model, field, on_flush=None):
+        self.model = model
+        self.field = field
+        self.on_flush = on_flush
+        self.prefix = f"counter:{model._meta.label_lower}:{field}"
+        self._dirty = set()
+        self._total = 0
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, 'COUNTER_FLUSH_INTERVAL', 10)
+
+    @property
+    def flush_threshold(self):
+        return getattr(settings, 'COUNTER_FLUSH_THRESHOLD', 100)
+
+    def _key(self, pk):
+        return f"{self.prefix}:{pk}"
+
+    def incr(self, pk, n=1):
+        key = self._key(pk)
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key, n)
+        except ValueError:
+            # Kalit add() dan keyin tashqaridan o'chirilgan (masalan redis FLUSHDB)
+            cache.set(key, n, None)
+        with self._lock:
+            self._dirty.add(pk)
+            self._total += n
+            due = (
+                self._total >= self.flush_threshold or
+                time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def pending(self, pk):
+        """Hali bazaga yozilmagan oshirishlar (sahifada ko'rsatish uchun)."""
+        return cache.get(self._key(pk)) or 0
+
+    def flush(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            self._total = 0
+            self._last_flush = time.monotonic()
+        if not dirty:
+            return 0
+
+        lock_key = f"{self.prefix}:lock"
+        if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+            # Boshqa jarayon yozmoqda - keyingi safar urinamiz
+            with self._lock:
+                self._dirty |= dirty
+            return 0
+        try:
+            return self._flush(dirty)
+        finally:
+            cache.delete(lock_key)
+
+    def _flush(self, dirty):
+        keys = {self._key(pk): pk for pk in dirty}
+        by_amount = defaultdict(list)
+        for key, n in cache.get_many(list(keys)).items():
+            if n:
+                by_amount[n].append(keys[key])
+        flushed = 0
+        for n, pks in by_amount.items():
+            try:
+                self.model.objects.filter(pk__in=pks).update(**{self.field: F(self.field) + n})
+            except DatabaseError:
+                # Oshirishlar keshda qoladi, keyingi yozishda qayta urinamiz
+                logger.exception("Counter flush failed for %s.%s", self.model.__name__, self.field)
+                with self._lock:
+                    self._dirty.update(pks)
+            else:
+                for pk in pks:
+                    try:
+                        cache.decr(self._key(pk), n)
+                    except ValueError:
+                        pass
+                flushed += len(pks)
+                self._after_flush(pks, n)
+        return flushed
+
+    def _after_flush(self, pks, n):
+        if self.on_flush is None:
+            return
+        try:
+            self.on_flush(pks, n)
+        except DatabaseError:
+            # Asosiy hisoblagich yozilgan - qayta buferlash ikki marta sanashga olib keladi
+            logger.exception("Counter on_flush failed for %s.%s", self.model.__name__, self.field)
+
+
+job_views = BufferedCounter(EmployerJob, 'view_count', on_flush=stats.record_job_views)
+company_profile_views = BufferedCounter(CompanyProfile, 'profile_views')
+candidate_profile_views = BufferedCounter(CandidateProfile, 'profile_views')
+
+COUNTERS = [job_views, company_profile_views, candidate_profile_views]
+
+
+def flush_all():
+    return sum(counter.flush() for counter in COUNTERS)
+
+
+atexit.register(flush_all)
@@ -0,0 +1,31 @@
+"""
+Database connection tuning.
+
+SQLite uchun SQLITE_PRAGMAS har bir yangi ulanishda (connection_created
+signali, hr_bolim.signals) qo'llanadi:
+
+- journal_mode=WAL (faqat SQLITE_WAL=1 bo'lsa) - o'quvchilar yozuvchini
+  kutmaydi; fayl darajasida saqlanadi, ya'ni bir marta o'rnatilgach barcha
+  ulanishlarga ta'sir qiladi va baza faylini o'zgartiradi;
+- synchronous=NORMAL (WAL bilan birga) - har bir commit'da fsync qilinmaydi;
+- busy_timeout - qulf band bo'lsa darhol xato o'rniga kutish (ms);
+- mmap_size - o'qishlar xotiraga akslantirilgan fayl orqali.
+"""
+from django.conf import settings
+
+# SQLite'ning o'z standart qiymatlari (bench_db_writes --untuned uchun)
+SQLITE_DEFAULTS = {
+    'journal_mode': 'DELETE',
+    'synchronous': 'FULL',
+    'busy_timeout': 5000,
+    'mmap_size': 0,
+}
+
+
+def apply_sqlite_pragmas(connection, pragmas=None):
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', {}) if pragmas is None else pragmas
+    if not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
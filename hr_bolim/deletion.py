@@ -0,0 +1,247 @@
+"""
+Data-deletion executor for DataDeletionRequest.
+
+DELETION_GRACE_DAYS kun o'tgan ``pending`` so'rovlar (va uzilib qolgan
+``processing`` so'rovlar) quyidagi bosqichlarda bajariladi:
+
+1. ``messages``     - foydalanuvchi yuborgan xabarlar matni almashtiriladi,
+                      ilovalari o'chiriladi (suhbatdoshning yozishmasi saqlanadi);
+2. ``applications`` - arizalar (va intervyular), rezyume fayllari bilan;
+3. ``profile``      - rezyumelar, profil, tajriba, ta'lim, saqlangan ishlar va
+                      qidiruvlar (mosliklari bilan);
+4. ``logs``         - AuditLog'dan foydalanuvchi va IP olib tashlanadi,
+                      shu email'dan yuborilgan shikoyatlar va foydalanuvchiga
+                      navbatdagi/yuborilgan xatlar (OutboundEmail) o'chiriladi;
+5. ``account``      - User qatori anonimlashtiriladi va bloklanadi.
+
+ConsentLog saqlanadi - rozilik berilganining isboti sifatida.
+
+Har bir bosqich DELETION_BATCH_SIZE qatorlik alohida tranzaksiyalarda
+bajariladi (katta hisob bazani uzoq qulflamaydi). Avval fayllar, keyin
+qatorlar o'chiriladi - jarayon istalgan joyda uzilsa, qayta ishga tushirish
+qolgan qatorlarni shunchaki davom ettiradi (storage.delete() yo'q faylda xato
+bermaydi).
+
+Bitta so'rovni bir vaqtda faqat bitta executor bajaradi (cron, buyruq yoki
+admin): ``claim()`` uni compare-and-swap ``UPDATE ... WHERE status='pending'``
+(yoki lease'i tugagan ``processing``) bilan band qiladi. ``started_at`` lease
+vazifasini ham bajaradi - har bir bo'lakda shu executor o'qigan qiymat bo'yicha
+yangilanadi; qiymat o'zgargan bo'lsa (DELETION_LEASE_SECONDS o'tib, so'rovni
+boshqa executor olib qo'ygan) ClaimLost ko'tariladi va bo'lak bekor qilinadi.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import (
+    Application, AuditLog, CandidateApplication, CandidateProfile, Contact, DataDeletionRequest, Education,
+    Experience, Message, OutboundEmail, Resume, SavedJob, SavedSearch, SavedSearchMatch, User, UserInformation,
+)
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[o'chirilgan]"
+
+
+class ClaimLost(Exception):
+    """So'rov lease'i tugagan va uni boshqa executor band qilgan."""
+
+
+def _batch_size():
+    return getattr(settings, 'DELETION_BATCH_SIZE', 500)
+
+
+def _lease():
+    return timedelta(seconds=getattr(settings, 'DELETION_LEASE_SECONDS', 600))
+
+
+def due(now=None):
+    """Bajarilishi kerak bo'lgan so'rovlar."""
+    now = now or timezone.now()
+    grace = timedelta(days=getattr(settings, 'DELETION_GRACE_DAYS', 30))
+    return DataDeletionRequest.objects.filter(
+        Q(status='processing') | Q(status='pending', requested_at__lte=now - grace)
+    ).order_by('requested_at', 'id')
+
+
+def claim(deletion_request, now=None):
+    """So'rovni shu executor uchun band qiladi. False - boshqa executor
+    bajaryapti yoki so'rov allaqachon tugagan/rad etilgan."""
+    now = now or timezone.now()
+    claimable = Q(status='pending') | Q(status='processing') & (
+        Q(started_at__isnull=True) | Q(started_at__lt=now - _lease())
+    )
+    if not DataDeletionRequest.objects.filter(claimable, pk=deletion_request.pk).update(
+        status='processing', started_at=now,
+    ):
+        return False
+    deletion_request.refresh_from_db(fields=['status', 'started_at', 'stage', 'progress'])
+    return True
+
+
+def _owned(deletion_request):
+    return DataDeletionRequest.objects.filter(
+        pk=deletion_request.pk, status='processing', started_at=deletion_request.started_at,
+    )
+
+
+def _heartbeat(deletion_request, **changes):
+    """Lease'ni uzaytiradi va ``changes`` ni saqlaydi; so'rov boshqa executor'da bo'lsa ClaimLost."""
+    now = timezone.now()
+    if not _owned(deletion_request).update(started_at=now, **changes):
+        raise ClaimLost(f"Data deletion request {deletion_request.pk} was claimed by another executor")
+    deletion_request.started_at = now
+
+
+def _delete_files(queryset, pks, fields):
+    for row in queryset.model.objects.filter(pk__in=pks).values_list(*fields):
+        for name in row:
+            if name:
+                default_storage.delete(name)
+
+
+def _chunks(deletion_request, stage, queryset, handle):
+    """``queryset`` bo'sh bo'lguncha DELETION_BATCH_SIZE tadan ``handle(pks)``;
+    progress har bir bo'lak bilan bitta tranzaksiyada saqlanadi."""
+    batch_size = _batch_size()
+    while True:
+        with transaction.atomic():
+            pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return
+            handle(pks)
+            progress = deletion_request.progress
+            progress[stage] = progress.get(stage, 0) + len(pks)
+            _heartbeat(deletion_request, progress=progress)
+
+
+def _delete_rows(deletion_request, stage, queryset, file_fields=()):
+    def handle(pks):
+        if file_fields:
+            _delete_files(queryset, pks, file_fields)
+        # queryset.delete() har bir qator uchun post_delete yuboradi (statistika yangilanadi)
+        queryset.model.objects.filter(pk__in=pks).delete()
+
+    _chunks(deletion_request, stage, queryset, handle)
+
+
+# ----------------------------------------------------------------
+# Stages
+# ----------------------------------------------------------------
+
+def _messages(deletion_request, user):
+    sent = Message.objects.filter(sender=user).exclude(
+        Q(content=REDACTED) & (Q(attachment='') | Q(attachment__isnull=True))
+    )
+
+    def handle(pks):
+        _delete_files(sent, pks, ('attachment',))
+        Message.objects.filter(pk__in=pks).update(content=REDACTED, attachment='')
+
+    _chunks(deletion_request, 'messages', sent, handle)
+
+
+def _applications(deletion_request, user):
+    _delete_rows(deletion_request, 'applications', CandidateApplication.objects.filter(candidate=user),
+                 ('resume_file',))
+    _delete_rows(deletion_request, 'applications', Application.objects.filter(user=user), ('resume_file',))
+
+
+def _profile(deletion_request, user):
+    _delete_rows(deletion_request, 'profile', Resume.objects.filter(user=user), ('file',))
+    _delete_rows(deletion_request, 'profile', CandidateProfile.objects.filter(user=user),
+                 ('profile_picture', 'resume_file'))
+    for model in (Experience, Education, SavedJob, UserInformation):
+        _delete_rows(deletion_request, 'profile', model.objects.filter(user=user))
+    # Mosliklar alohida bo'laklarda - qidiruv o'chirilganda kaskad katta bo'lmasin
+    _delete_rows(deletion_request, 'profile', SavedSearchMatch.objects.filter(search__user=user))
+    _delete_rows(deletion_request, 'profile', SavedSearch.objects.filter(user=user))
+
+
+def _logs(deletion_request, user):
+    _chunks(deletion_request, 'logs', AuditLog.objects.filter(user=user),
+            lambda pks: AuditLog.objects.filter(pk__in=pks).update(user=None, ip_address=None))
+    if user.email:
+        _delete_rows(deletion_request, 'logs', Contact.objects.filter(email__iexact=user.email))
+    _delete_rows(deletion_request, 'logs', OutboundEmail.objects.filter(user=user))
+
+
+def _account(deletion_request, user):
+    with transaction.atomic():
+        user.username = f"deleted-{user.pk}"
+        user.email = ''
+        user.first_name = ''
+        user.last_name = ''
+        user.phone = None
+        user.is_active = False
+        user.is_delete = True
+        user.set_unusable_password()
+        user.save()
+        progress = deletion_request.progress
+        progress['account'] = 1
+        _heartbeat(deletion_request, progress=progress)
+
+
+STAGES = (
+    ('messages', _messages),
+    ('applications', _applications),
+    ('profile', _profile),
+    ('logs', _logs),
+    ('account', _account),
+)
+STAGE_NAMES = [name for name, _handler in STAGES]
+
+
+def process(deletion_request):
+    """Bitta so'rovni oxirigacha (yoki uzilgan joyidan) bajaradi.
+
+    False - so'rovni band qilib bo'lmadi (boshqa executor bajaryapti).
+    """
+    if not claim(deletion_request):
+        return False
+
+    user = User.objects.get(pk=deletion_request.user_id)
+    done = STAGE_NAMES.index(deletion_request.stage) + 1 if deletion_request.stage else 0
+    for name, handler in STAGES[done:]:
+        try:
+            handler(deletion_request, user)
+        except ClaimLost:
+            raise
+        except Exception as exc:
+            _owned(deletion_request).update(last_error=f"{name}: {exc}")
+            raise
+        deletion_request.stage = name
+        _heartbeat(deletion_request, stage=name)
+
+    deletion_request.status = 'completed'
+    deletion_request.processed_at = timezone.now()
+    deletion_request.last_error = ''
+    if not _owned(deletion_request).update(status='completed', processed_at=deletion_request.processed_at,
+                                           last_error=''):
+        raise ClaimLost(f"Data deletion request {deletion_request.pk} was claimed by another executor")
+    return True
+
+
+def process_due(limit=None, now=None):
+    """(bajarilganlar, xatolar) soni. Xato bergan so'rov keyingi ishga tushirishda davom etadi."""
+    completed = failed = 0
+    requests = due(now)
+    if limit:
+        requests = requests[:limit]
+    for deletion_request in requests:
+        try:
+            if not process(deletion_request):
+                continue
+        except ClaimLost:
+            logger.warning("Data deletion request %s was taken over by another executor", deletion_request.pk)
+        except Exception:
+            logger.exception("Data deletion request %s failed", deletion_request.pk)
+            failed += 1
+        else:
+            completed += 1
+    return completed, failed
@@ -0,0 +1,204 @@
+"""
+Faceted counts for the jobs list filters.
+
+Barcha facetlar (ish turi, tajriba, joylashuv, maosh oralig'i, bo'lim,
+kompaniya) JobFeedEntry queryset'i ustida GROUP BY so'rovi bilan hisoblanadi.
+Har bir facet o'zidan boshqa barcha filtrlar bilan sanaladi (disjunctive
+faceting): ish turi tanlanganda ham boshqa turlar soni ko'rinib turadi.
+Faol filtri bo'lmagan facetlar bitta umumiy so'rovdan olinadi, har bir faol
+facet filtri uchun bitta qo'shimcha so'rov. Natija filtrlar qiymatidan tuzilgan kalit bo'yicha
+keshlanadi (matnli filtrlar clean_text() bilan - filtrning o'zi ham aynan
+shu qiymatni ishlatadi); lenta o'zgarganda kesh versiyasi oshiriladi (invalidate()).
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Value, When
+from django.db.models.functions import Coalesce
+
+from . import feed
+from .models import Department, EmployerJob, Job
+
+CACHE_TIMEOUT = 300
+VERSION_KEY = 'facets:version'
+TOP_LOCATIONS = 10
+TOP_COMPANIES = 10
+
+FILTER_PARAMS = ('q', 'location', 'department', 'company', 'type', 'salary_min', 'salary_max', 'experience')
+
+# facet -> uni cheklaydigan feed.filter_feed() argumentlari
+FACET_FILTERS = {
+    'employment_type': ('emp_type',),
+    'experience': ('experience',),
+    'department': ('department_id',),
+    'company': ('company_id',),
+    'location': ('location',),
+    'salary': ('salary_min', 'salary_max'),
+}
+
+# (kalit, yorliq, min, max) - maosh Coalesce(salary_max, salary_min) bo'yicha
+SALARY_BANDS = (
+    ('lt5', "5 mln gacha", None, 5_000_000),
+    ('5-10', "5 - 10 mln", 5_000_000, 10_000_000),
+    ('10-20', "10 - 20 mln", 10_000_000, 20_000_000),
+    ('20+', "20 mln dan yuqori", 20_000_000, None),
+)
+
+
+def clean_text(value):
+    """Matnli filtr qiymati: chetdagi va takroriy bo'shliqlarsiz.
+
+    Kalit va filtr bir xil qiymatdan tuziladi: "Тошкент" va "Toshkent"
+    icontains uchun turli so'rovlar, shuning uchun transliteratsiya qilinmaydi.
+    """
+    return ' '.join((value or '').split())
+
+
+def query_key(params):
+    """GET parametrlaridan kesh kaliti (cursor hisobga olinmaydi)."""
+    parts = []
+    for name in FILTER_PARAMS:
+        value = clean_text(params.get(name))
+        if not value or (name == 'experience' and value == 'all'):
+            continue
+        parts.append(f"{name}={value}")
+    return hashlib.md5('&'.join(parts).encode()).hexdigest()
+
+
+def invalidate():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, None)
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(VERSION_KEY, version, None)
+    return version
+
+
+def _salary_band():
+    salary = Coalesce('salary_max', 'salary_min')
+    whens = []
+    for key, _label, low, high in SALARY_BANDS:
+        condition = {}
+        if low is not None:
+            condition['salary__gte'] = low
+        if high is not None:
+            condition['salary__lt'] = high
+        whens.append(When(then=Value(key), **condition))
+    return salary, Case(*whens, default=Value(''), output_field=CharField())
+
+
+def _buckets(entries):
+    """Bitta GROUP BY so'rovi: jami va har bir facet bo'yicha sonlar."""
+    salary, band = _salary_band()
+    rows = (
+        entries.order_by()
+        .annotate(salary=salary)
+        .annotate(salary_band=band)
+        .values('employment_type', 'experience_required', 'location', 'salary_band',
+                'department_id', 'company_id', 'company__company_name')
+        .annotate(n=Count('id'))
+    )
+
+    total = 0
+    buckets = {name: {} for name in FACET_FILTERS}
+    for row in rows:
+        n = row['n']
+        total += n
+        employment_type = buckets['employment_type']
+        employment_type[row['employment_type']] = employment_type.get(row['employment_type'], 0) + n
+        if row['experience_required']:
+            experience = buckets['experience']
+            experience[row['experience_required']] = experience.get(row['experience_required'], 0) + n
+        if row['salary_band']:
+            salary_bands = buckets['salary']
+            salary_bands[row['salary_band']] = salary_bands.get(row['salary_band'], 0) + n
+        if row['department_id']:
+            departments = buckets['department']
+            departments[row['department_id']] = departments.get(row['department_id'], 0) + n
+        if row['company_id']:
+            companies = buckets['company']
+            name, count = companies.get(row['company_id'], (row['company__company_name'], 0))
+            companies[row['company_id']] = (name, count + n)
+        location = (row['location'] or '').strip()
+        if location:
+            locations = buckets['location']
+            key = location.lower()
+            label, count = locations.get(key, (location, 0))
+            locations[key] = (label, count + n)
+    return total, buckets
+
+
+def _active(name, value):
+    # feed.filter_feed bilan bir xil: bo'sh qiymat va experience='all' - filtr yo'q
+    return bool(value) and not (name == 'experience' and value == 'all')
+
+
+def compute(entries, filters=None):
+    """Facet bucket'larini hisoblaydi.
+
+    ``entries`` - qidiruv so'rovi bilan cheklangan, lekin filtrlanmagan lenta;
+    ``filters`` - feed.filter_feed() argumentlari. Har bir facet o'z filtrisiz
+    sanaladi; ``total`` - barcha filtrlar qo'llangandagi natijalar soni.
+    """
+    filters = filters or {}
+    active = {name for name, value in filters.items() if _active(name, value)}
+    total, shared = _buckets(feed.filter_feed(entries, **filters))
+
+    buckets = {}
+    for facet, own in FACET_FILTERS.items():
+        if active.isdisjoint(own):
+            buckets[facet] = shared[facet]
+        else:
+            others = {name: value for name, value in filters.items() if name not in own}
+            buckets[facet] = _buckets(feed.filter_feed(entries, **others))[1][facet]
+
+    type_labels = dict(Job.EMPLOYMENT_TYPE)
+    type_labels.update(EmployerJob.EMPLOYMENT_TYPE)
+    experience_choices = Job._meta.get_field('experience_required').choices
+
+    return {
+        'total': total,
+        'employment_type': [
+            {'value': value, 'label': label, 'count': buckets['employment_type'].get(value, 0)}
+            for value, label in type_labels.items()
+        ],
+        'experience': [
+            {'value': value, 'label': label, 'count': buckets['experience'].get(value, 0)}
+            for value, label in experience_choices
+        ],
+        'department': [
+            {'value': dept.id, 'label': dept.name, 'count': buckets['department'].get(dept.id, 0)}
+            for dept in Department.objects.order_by('name')
+        ],
+        'company': [
+            {'value': pk, 'label': name, 'count': count}
+            for pk, (name, count) in sorted(
+                buckets['company'].items(), key=lambda item: -item[1][1]
+            )[:TOP_COMPANIES]
+        ],
+        'location': [
+            {'value': label, 'label': label, 'count': count}
+            for label, count in sorted(buckets['location'].values(), key=lambda item: -item[1])[:TOP_LOCATIONS]
+        ],
+        'salary': [
+            {'value': key, 'label': label, 'min': low or '', 'max': high or '',
+             'count': buckets['salary'].get(key, 0)}
+            for key, label, low, high in SALARY_BANDS
+        ],
+    }
+
+
+def get_facets(entries, filters, params):
+    """compute() natijasi, query_key() bo'yicha keshlangan."""
+    key = f"facets:{_version()}:{query_key(params)}"
+    result = cache.get(key)
+    if result is None:
+        result = compute(entries, filters)
+        cache.set(key, result, CACHE_TIMEOUT)
+    return result
@@ -0,0 +1,183 @@
+"""
+Unified job feed: Job va EmployerJob bitta jadvalda (JobFeedEntry).
+
+Lenta ma'lumotlar bazasi tomonida (published_at, id) bo'yicha tartiblanadi va
+keyset (cursor) usulida sahifalanadi, shuning uchun sahifa narxi katalog
+hajmiga bog'liq emas.
+"""
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+from .models import EmployerJob, Job, JobFeedEntry
+
+PAGE_SIZE = 20
+
+
+def entry_values(kind, job):
+    """Job / EmployerJob instance'idan JobFeedEntry maydonlari.
+
+    Faqat atributlarga murojaat qiladi, shuning uchun migratsiyalardagi
+    tarixiy modellar bilan ham ishlaydi. Yopiq vakansiya uchun None.
+    """
+    if kind == 'job':
+        if job.status != 'open':
+            return None
+        return {
+            'title': job.title,
+            'location': job.loaction or '',
+            'employment_type': job.employment_type,
+            'experience_required': job.experience_required,
+            'salary_min': job.salary_min,
+            'salary_max': job.salary_max,
+            'department_id': job.department_id,
+            'company_id': None,
+            'published_at': job.posted_at,
+        }
+    if job.status != 'active':
+        return None
+    return {
+        'title': job.title,
+        'location': job.location or '',
+        'employment_type': job.employment_type,
+        'experience_required': None,
+        'salary_min': job.salary_min,
+        'salary_max': job.salary_max,
+        'department_id': None,
+        'company_id': job.company_id,
+        'published_at': job.created_at,
+    }
+
+
+def sync_job(kind, job, manager=None):
+    manager = manager or JobFeedEntry.objects
+    values = entry_values(kind, job)
+    if values is None:
+        manager.filter(kind=kind, object_id=job.pk).delete()
+    else:
+        manager.update_or_create(kind=kind, object_id=job.pk, defaults=values)
+
+
+def remove_job(kind, pk):
+    JobFeedEntry.objects.filter(kind=kind, object_id=pk).delete()
+
+
+def sync_queryset(kind, queryset):
+    """queryset.update() signal yubormaydi - admin action'lardan keyin chaqiriladi."""
+    for job in queryset.iterator(chunk_size=500):
+        sync_job(kind, job)
+
+
+def rebuild(job_model=Job, employer_job_model=EmployerJob, manager=None):
+    manager = manager or JobFeedEntry.objects
+    manager.all().delete()
+    entries = []
+    for kind, model in (('job', job_model), ('employer_job', employer_job_model)):
+        for job in model.objects.iterator(chunk_size=500):
+            values = entry_values(kind, job)
+            if values is not None:
+                entries.append(manager.model(kind=kind, object_id=job.pk, **values))
+    manager.bulk_create(entries, batch_size=500)
+    return len(entries)
+
+
+# ----------------------------------------------------------------
+# Cursor
+# ----------------------------------------------------------------
+
+def encode_cursor(entry):
+    raw = f"{entry.published_at.isoformat()}|{entry.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        published_at, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(published_at), int(pk)
+    except (ValueError, UnicodeError):
+        return None
+
+
+# ----------------------------------------------------------------
+# Queries
+# ----------------------------------------------------------------
+
+def filter_feed(queryset, location=None, department_id=None, company_id=None, emp_type=None,
+                salary_min=None, salary_max=None, experience=None):
+    """jobs_list_view filtrlari.
+
+    Avvalgidek, vakansiya turida mavjud bo'lmagan maydon bo'yicha filtr
+    (bo'lim, tajriba - faqat Job'da bor) EmployerJob yozuvlariga qo'llanmaydi.
+    """
+    if location:
+        queryset = queryset.filter(location__icontains=location)
+    if department_id:
+        queryset = queryset.filter(Q(department_id=department_id) | Q(kind='employer_job'))
+    if company_id:
+        queryset = queryset.filter(company_id=company_id)
+    if emp_type:
+        queryset = queryset.filter(employment_type=emp_type)
+    if salary_min:
+        queryset = queryset.filter(salary_max__gte=salary_min)
+    if salary_max:
+        queryset = queryset.filter(salary_min__lte=salary_max)
+    if experience and experience != 'all':
+        queryset = queryset.filter(Q(experience_required=experience) | Q(kind='employer_job'))
+    return queryset
+
+
+def restrict_to(queryset, job_ids, employer_job_ids):
+    return queryset.filter(
+        Q(kind='job', object_id__in=list(job_ids)) |
+        Q(kind='employer_job', object_id__in=list(employer_job_ids))
+    )
+
+
+def page(queryset, cursor=None, size=PAGE_SIZE):
+    """(entries, next_cursor) - keyset pagination (published_at, id) DESC."""
+    queryset = queryset.order_by('-published_at', '-id')
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        published_at, pk = position
+        queryset = queryset.filter(
+            Q(published_at__lt=published_at) | Q(published_at=published_at, id__lt=pk)
+        )
+    entries = list(queryset[:size + 1])
+    next_cursor = encode_cursor(entries[size - 1]) if len(entries) > size else None
+    return entries[:size], next_cursor
+
+
+def ranked_page(queryset, scores, cursor=None, size=PAGE_SIZE):
+    """Qidiruv rejimi: natijalar relevantlik bo'yicha.
+
+    ``scores`` - {(kind, object_id): score}, uning hajmi SEARCH_RESULT_LIMIT
+    bilan chegaralangan, shuning uchun bu yerda offset cursor yetarli.
+    """
+    try:
+        offset = max(int(cursor or 0), 0)
+    except ValueError:
+        offset = 0
+    keys = list(queryset.values_list('kind', 'object_id'))
+    keys.sort(key=lambda key: scores.get(key, 0), reverse=True)
+    next_cursor = str(offset + size) if len(keys) > offset + size else None
+    return keys[offset:offset + size], next_cursor
+
+
+def hydrate(keys):
+    """(kind, object_id) juftliklarini haqiqiy Job / EmployerJob obyektlariga
+    aylantiradi - har bir tur uchun bitta so'rov."""
+    job_ids = [pk for kind, pk in keys if kind == 'job']
+    employer_job_ids = [pk for kind, pk in keys if kind == 'employer_job']
+    jobs = Job.objects.select_related('department').in_bulk(job_ids) if job_ids else {}
+    employer_jobs = (
+        EmployerJob.objects.select_related('company').in_bulk(employer_job_ids)
+        if employer_job_ids else {}
+    )
+    result = []
+    for kind, pk in keys:
+        job = (jobs if kind == 'job' else employer_jobs).get(pk)
+        if job is not None:
+            result.append(job)
+    return result
@@ -0,0 +1,161 @@
+"""
+GDPR data-portability export.
+
+``export_stream(user)`` foydalanuvchining barcha shaxsiy ma'lumotlarini ZIP
+arxiv sifatida bo'laklab qaytaradi (StreamingHttpResponse uchun generator):
+
+- ``data/<nom>.jsonl`` - har bir model uchun, har qatorda bitta yozuv;
+- ``files/<saqlash yo'li>`` - yuklangan fayllar (rezyumelar, xabar
+  ilovalari, profil rasmi, kompaniya logotipi);
+- ``manifest.json`` - yozuvlar soni va topilmagan fayllar.
+
+Querysetlar ``.iterator()`` bilan o'qiladi, fayllar FILE_CHUNK_SIZE
+bo'laklarda ko'chiriladi, ZIP esa seek qilinmaydigan oqimga yoziladi - xotira
+sarfi xabarlar yoki fayllar hajmiga bog'liq emas.
+
+ASGI'da ``export_stream_async()`` ishlatilsin: Django sync iteratorni
+ASGI ostida avval to'liq ro'yxatga yig'adi (butun ZIP xotirada bo'lardi).
+"""
+import json
+import zipfile
+
+from asgiref.sync import sync_to_async
+
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import (
+    Application, AuditLog, CandidateApplication, CandidateProfile, Company, CompanyProfile, ConsentLog, Contact,
+    DataDeletionRequest, Education, Experience, Interview, Message, OutboundEmail, Resume, SavedJob, SavedSearch,
+    SavedSearchMatch, User, UserInformation,
+)
+
+CHUNK_SIZE = 500
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def _values(queryset, exclude=(), extra=()):
+    fields = [f.attname for f in queryset.model._meta.concrete_fields if f.attname not in exclude]
+    return queryset.values(*fields, *extra)
+
+
+def datasets(user):
+    """(nom, qatorlar queryset'i, fayl maydonlari) ro'yxati."""
+    messages = Message.objects.filter(Q(sender=user) | Q(recipient=user)).order_by('id')
+    return [
+        ('user', _values(User.objects.filter(pk=user.pk), exclude=('password',)), ()),
+        ('user_information', _values(UserInformation.objects.filter(user=user)), ()),
+        ('candidate_profile', _values(CandidateProfile.objects.filter(user=user)),
+         ('profile_picture', 'resume_file')),
+        ('experiences', _values(user.experiences.order_by('id')), ()),
+        ('educations', _values(user.educations.order_by('id')), ()),
+        ('resumes', _values(user.resumes.order_by('id')), ('file',)),
+        ('saved_jobs', _values(user.saved_jobs.order_by('id'), extra=('job__title',)), ()),
+        ('saved_searches', _values(SavedSearch.objects.filter(user=user).order_by('id')), ()),
+        ('saved_search_matches', _values(
+            SavedSearchMatch.objects.filter(search__user=user).order_by('id'), extra=('job__title',),
+        ), ()),
+        ('applications', _values(Application.objects.filter(user=user).order_by('id'), extra=('job__title',)),
+         ('resume_file',)),
+        ('employer_applications', _values(
+            CandidateApplication.objects.filter(candidate=user).order_by('id'),
+            extra=('job__title', 'job__company__company_name'),
+        ), ('resume_file',)),
+        ('interviews', _values(Interview.objects.filter(application__candidate=user).order_by('id')), ()),
+        # Faqat o'zi yuborgan ilovalar: qabul qilingan fayllar yuboruvchining ma'lumoti
+        ('messages_sent', _values(messages.filter(sender=user), extra=('recipient__username',)), ('attachment',)),
+        ('messages_received', _values(messages.filter(recipient=user), extra=('sender__username',)), ()),
+        ('consent_logs', _values(ConsentLog.objects.filter(user=user).order_by('id')), ()),
+        ('data_deletion_requests', _values(DataDeletionRequest.objects.filter(user=user).order_by('id')), ()),
+        ('audit_logs', _values(AuditLog.objects.filter(user=user).order_by('id')), ()),
+        ('outbound_emails', _values(OutboundEmail.objects.filter(user=user).order_by('id')), ()),
+        ('complaints', _values(
+            Contact.objects.filter(email__iexact=user.email).order_by('id') if user.email else Contact.objects.none()
+        ), ()),
+        ('company', _values(Company.objects.filter(user=user)), ()),
+        ('company_profile', _values(CompanyProfile.objects.filter(company__user=user)), ('logo',)),
+    ]
+
+
+class _Sink:
+    """ZipFile yozadigan seek qilinmaydigan oqim; yozilganlar drain() bilan olinadi."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _generate(user):
+    sink = _Sink()
+    manifest = {
+        'user': user.username,
+        'exported_at': timezone.now().isoformat(),
+        'datasets': {},
+        'files': 0,
+        'missing_files': [],
+    }
+    files = set()
+
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, rows, file_fields in datasets(user):
+            count = 0
+            with archive.open(f'data/{name}.jsonl', 'w', force_zip64=True) as entry:
+                for row in rows.iterator(chunk_size=CHUNK_SIZE):
+                    entry.write(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False).encode() + b'\n')
+                    files.update(row[field] for field in file_fields if row[field])
+                    count += 1
+                    if count % CHUNK_SIZE == 0:
+                        yield sink.drain()
+            manifest['datasets'][name] = count
+            yield sink.drain()
+
+        for path in sorted(files):
+            try:
+                source = default_storage.open(path, 'rb')
+            except OSError:
+                manifest['missing_files'].append(path)
+                continue
+            with source, archive.open(f'files/{path}', 'w', force_zip64=True) as entry:
+                for chunk in iter(lambda: source.read(FILE_CHUNK_SIZE), b''):
+                    entry.write(chunk)
+                    yield sink.drain()
+            manifest['files'] += 1
+
+        archive.writestr('manifest.json', json.dumps(manifest, ensure_ascii=False, indent=2))
+    yield sink.drain()
+
+
+def export_stream(user):
+    return (chunk for chunk in _generate(user) if chunk)
+
+
+async def export_stream_async(user):
+    """export_stream() ning async varianti: har bir bo'lak sync_to_async orqali olinadi."""
+    chunks = export_stream(user)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            chunk = await next_chunk(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        # Mijoz uzilsa ham ochiq fayl va kursorlar yopilsin
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def export_filename(user):
+    return f"my_data_export_{timezone.localdate():%Y%m%d}.zip"
@@ -0,0 +1,105 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from hr_bolim import db
+from hr_bolim.models import AuditLog, User
+
+BENCH_ACTION = 'bench-db-writes'
+
+
+class Command(BaseCommand):
+    help = (
+        "Parallel worker'lar bilan yozish tezligini o'lchaydi: har bir operatsiya alohida "
+        "tranzaksiyada AuditLog qatori qo'shadi va bitta umumiy qatorni yangilaydi "
+        "(login audit + last_login kabi). Sinov qatorlari oxirida o'chiriladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, nargs='*', default=[1, 4, 8], help="Worker'lar soni (bir nechta)")
+        parser.add_argument('--writes', type=int, default=200, help="Har bir worker uchun operatsiyalar soni")
+        parser.add_argument(
+            '--untuned', action='store_true',
+            help="SQLite: SQLITE_PRAGMAS o'rniga SQLite standart sozlamalari bilan (taqqoslash uchun)",
+        )
+
+    def handle(self, *args, **options):
+        if options['untuned'] and connection.vendor != 'sqlite':
+            raise CommandError("--untuned faqat SQLite uchun")
+        pragmas = db.SQLITE_DEFAULTS if options['untuned'] else None
+
+        self.user = User.objects.create(username=BENCH_ACTION, email=f'{BENCH_ACTION}@example.com')
+        try:
+            # journal_mode faylga yoziladi - uni almashtirish uchun boshqa ulanish ochiq bo'lmasligi kerak
+            connection.close()
+            settings_override = override_settings(SQLITE_PRAGMAS=pragmas) if pragmas else override_settings()
+            with settings_override:
+                self.stdout.write(f"{connection.vendor}: {self.describe()}")
+                for workers in options['workers']:
+                    self.report(workers, options['writes'], self.run(workers, options['writes']))
+        finally:
+            connection.close()
+            AuditLog.objects.filter(action=BENCH_ACTION).delete()
+            User.objects.filter(pk=self.user.pk).delete()
+
+    def describe(self):
+        if connection.vendor != 'sqlite':
+            settings_dict = connection.settings_dict
+            pool = settings_dict['OPTIONS'].get('pool')
+            return f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}, pool={pool or 'yoq'}"
+        with connection.cursor() as cursor:
+            values = []
+            for name in db.SQLITE_DEFAULTS:
+                cursor.execute(f"PRAGMA {name}")
+                values.append(f"{name}={cursor.fetchone()[0]}")
+        connection.close()
+        return ', '.join(values)
+
+    def run(self, workers, writes):
+        latencies = []
+        errors = []
+        barrier = threading.Barrier(workers)
+
+        def worker():
+            local = []
+            try:
+                barrier.wait()
+                for _ in range(writes):
+                    started = time.perf_counter()
+                    try:
+                        with transaction.atomic():
+                            AuditLog.objects.create(user=self.user, action=BENCH_ACTION, ip_address='127.0.0.1')
+                            User.objects.filter(pk=self.user.pk).update(last_login=timezone.now())
+                    except DatabaseError as exc:
+                        errors.append(str(exc))
+                    else:
+                        local.append(time.perf_counter() - started)
+            finally:
+                latencies.extend(local)
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started, sorted(latencies), errors
+
+    def report(self, workers, writes, result):
+        elapsed, latencies, errors = result
+        done = len(latencies)
+        p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0
+        line = (
+            f"{workers:>3} worker: {done}/{workers * writes} tranzaksiya, {elapsed:.2f} s, "
+            f"{done / elapsed:.0f} tx/s, p50 {p50:.1f} ms, p95 {p95:.1f} ms"
+        )
+        if errors:
+            self.stdout.write(self.style.WARNING(f"{line}, {len(errors)} xato ({errors[0]})"))
+        else:
+            self.stdout.write(self.style.SUCCESS(line))
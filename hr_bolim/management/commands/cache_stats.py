@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Kesh hit/miss statistikasi (hr_bolim.cache_backends)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Hisoblagichlarni nolga tushirish")
+
+    def handle(self, *args, **options):
+        for alias in settings.CACHES:
+            cache = caches[alias]
+            metrics = getattr(cache, 'metrics', None)
+            if metrics is None:
+                self.stdout.write(f"{alias}: {type(cache).__name__} metrikasiz backend")
+                continue
+            if options['reset']:
+                metrics.reset()
+                self.stdout.write(self.style.SUCCESS(f"{alias}: hisoblagichlar tozalandi"))
+                continue
+            snapshot = metrics.snapshot()
+            self.stdout.write(
+                f"{alias} ({type(cache).__name__}): {snapshot['hits']} hit, "
+                f"{snapshot['misses']} miss, hit rate {snapshot['hit_rate']}%"
+            )
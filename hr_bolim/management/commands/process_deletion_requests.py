@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from hr_bolim import deletion
+from hr_bolim.models import DataDeletionRequest
+
+
+class Command(BaseCommand):
+    help = (
+        "Muddati o'tgan hisobni o'chirish so'rovlarini bajaradi (hr_bolim.deletion). "
+        "Uzilib qolgan so'rovlar oxirgi tugagan bosqichdan davom ettiriladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, help="Bir ishga tushirishda ko'pi bilan shuncha so'rov")
+        parser.add_argument('--request', type=int, nargs='*', help="Faqat shu so'rov id'lari (muddatidan qat'i nazar)")
+
+    def handle(self, *args, **options):
+        if options['request']:
+            requests = DataDeletionRequest.objects.filter(
+                pk__in=options['request'], status__in=['pending', 'processing'],
+            )
+            for deletion_request in requests:
+                if deletion.process(deletion_request):
+                    self.stdout.write(f"#{deletion_request.pk}: {deletion_request.progress}")
+                else:
+                    self.stdout.write(f"#{deletion_request.pk}: boshqa jarayon bajaryapti, o'tkazib yuborildi")
+            return
+
+        completed, failed = deletion.process_due(limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f"{completed} ta so'rov bajarildi"))
+        if failed:
+            raise CommandError(f"{failed} ta so'rov xato bilan to'xtadi (last_error maydoniga qarang)")
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from hr_bolim import stats
+
+
+class Command(BaseCommand):
+    help = "Kompaniya statistikasini (CompanyStats, CompanyStatsDaily, JobStatsDaily) noldan qayta hisoblaydi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--company', type=int, nargs='*', help="Faqat shu kompaniya id'lari")
+
+    def handle(self, *args, **options):
+        companies, days, job_days = stats.rebuild(options['company'] or None)
+        self.stdout.write(self.style.SUCCESS(
+            f"{companies} ta kompaniya, {days} ta kunlik va {job_days} ta vakansiya-kun qatori qayta hisoblandi"
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from hr_bolim import facets, feed
+
+
+class Command(BaseCommand):
+    help = "Job va EmployerJob umumiy lentasini (JobFeedEntry) noldan qayta quradi"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = feed.rebuild()
+        facets.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Lentaga {count} ta ochiq vakansiya yozildi"))
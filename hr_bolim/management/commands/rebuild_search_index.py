@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from hr_bolim import talent
+from hr_bolim.models import EmployerJob, Job
+from hr_bolim.search import employer_job_index, job_index
+
+
+class Command(BaseCommand):
+    help = "Vakansiyalar va nomzodlar full-text indekslarini noldan qayta quradi"
+
+    def handle(self, *args, **options):
+        if not job_index.supported:
+            self.stdout.write(self.style.WARNING("Ushbu ma'lumotlar bazasi full-text indeksni qo'llab-quvvatlamaydi."))
+            return
+
+        jobs = job_index.rebuild(Job.objects.select_related('department'))
+        employer_jobs = employer_job_index.rebuild(EmployerJob.objects.all())
+        candidates = talent.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Indekslandi: {jobs} ta Job, {employer_jobs} ta EmployerJob, {candidates} ta nomzod"
+        ))
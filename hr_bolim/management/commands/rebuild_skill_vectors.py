@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from hr_bolim import matching
+
+
+class Command(BaseCommand):
+    help = "Ko'nikmalar lug'ati va vakansiya/nomzod skill vektorlarini (SkillVector) noldan qayta quradi"
+
+    def handle(self, *args, **options):
+        n_jobs, n_candidates = matching.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"{n_jobs} ta faol vakansiya va {n_candidates} ta nomzod vektori yozildi"
+        ))
@@ -0,0 +1,125 @@
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from hr_bolim import taskqueue
+
+logger = logging.getLogger('hr_bolim.taskqueue')
+
+
+class Command(BaseCommand):
+    help = (
+        "Fon vazifalari worker'i (hr_bolim.taskqueue): Task navbatidagi vazifalarni band qiladi va "
+        "thread yoki process pool'da bajaradi. SIGTERM/SIGINT'da yangi vazifa olmaydi, "
+        "bajarilayotganlarini tugatib chiqadi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, help="Parallel vazifalar soni (TASKS_CONCURRENCY)")
+        parser.add_argument('--pool', choices=('thread', 'process'), help="Pool turi (TASKS_POOL)")
+        parser.add_argument('--task', action='append', dest='tasks', help="Faqat shu vazifa(lar)ni bajarish")
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="Navbat bo'sh bo'lganda kutish (soniya)")
+        parser.add_argument('--burst', action='store_true', help="Navbat bo'shagach chiqish")
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency'] or getattr(settings, 'TASKS_CONCURRENCY', 4)
+        pool = options['pool'] or getattr(settings, 'TASKS_POOL', 'thread')
+        poll = options['poll_interval']
+        metrics_interval = getattr(settings, 'TASKS_METRICS_INTERVAL', 60)
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+
+        unknown = set(options['tasks'] or ()) - set(taskqueue.REGISTRY)
+        if unknown:
+            self.stderr.write(f"Noma'lum vazifalar: {', '.join(sorted(unknown))}")
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_args: stop.set())
+
+        if pool == 'process':
+            # Bolalar jarayoni ulanishlarni meros qilib olmasin; spawn - har biri o'zi django.setup() qiladi
+            connections.close_all()
+            executor = ProcessPoolExecutor(
+                concurrency, mp_context=multiprocessing.get_context('spawn'), initializer=django.setup,
+            )
+        else:
+            executor = ThreadPoolExecutor(concurrency, thread_name_prefix='task')
+
+        running = {}
+        metrics = taskqueue.WorkerMetrics()
+        # To'xtash paytida ham bajarilayotgan vazifalarning lease'i uzaytirib turiladi
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(worker, running, finished), name='task-heartbeat', daemon=True,
+        )
+        heartbeat.start()
+        self.stdout.write(f"Worker {worker}: {pool} pool, {concurrency} ta parallel vazifa")
+
+        last_report = last_purge = time.monotonic()
+        try:
+            while not stop.is_set() or running:
+                claimed = []
+                free = concurrency - len(running)
+                if free and not stop.is_set():
+                    claimed = taskqueue.claim(worker, free, names=options['tasks'])
+                    for task_row in claimed:
+                        running[executor.submit(taskqueue.execute, task_row.pk, worker)] = task_row.pk
+
+                if running:
+                    done, _pending = wait(list(running), timeout=poll, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task_id = running.pop(future)
+                        try:
+                            name, ok, seconds = future.result()
+                        except Exception:
+                            logger.exception("Task #%s crashed the pool", task_id)
+                            continue
+                        if name:
+                            metrics.record(name, ok, seconds)
+                elif options['burst'] and not claimed:
+                    break
+                elif not claimed:
+                    stop.wait(poll)
+
+                now = time.monotonic()
+                if now - last_report >= metrics_interval:
+                    self._report(metrics)
+                    metrics.reset()
+                    last_report = now
+                if now - last_purge >= 3600:
+                    taskqueue.purge()
+                    last_purge = now
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+            finished.set()
+            self._report(metrics)
+
+    def _heartbeat(self, worker, running, finished):
+        interval = getattr(settings, 'TASKS_LEASE_SECONDS', 60) / 3
+        try:
+            while not finished.wait(interval):
+                try:
+                    taskqueue.heartbeat(worker, list(running.values()))
+                except Exception:
+                    logger.exception("Task heartbeat failed")
+        finally:
+            connections.close_all()
+
+    def _report(self, metrics):
+        for name, row in metrics.snapshot().items():
+            self.stdout.write(
+                f"{name}: {row['done']} ta bajarildi, {row['failed']} ta xato, "
+                f"{row['per_second']}/s, o'rtacha {row['avg_ms']} ms"
+            )
@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from hr_bolim import outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "OutboundEmail navbatidagi muddati kelgan xatlarni paketlab, bitta SMTP ulanishi orqali "
+        "yuboradi (hr_bolim.outbox). --loop bilan doimiy worker sifatida ishlaydi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help="Bitta paketdagi xatlar soni (OUTBOX_BATCH_SIZE)")
+        parser.add_argument('--loop', action='store_true', help="Navbat bo'shagach kutib, qayta tekshiradi")
+        parser.add_argument('--interval', type=float, default=10.0, help="--loop: tekshirishlar orasidagi soniyalar")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, errors = outbox.send_pending(batch_size=options['batch_size'])
+            purged = outbox.purge()
+            if sent or errors or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(
+                    f"{sent} ta xat yuborildi, {errors} ta xato, {purged} ta eski yozuv o'chirildi"
+                ))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from hr_bolim import alerts
+
+
+class Command(BaseCommand):
+    help = (
+        "Saqlangan qidiruvlarga mos kelgan yangi vakansiyalar bo'yicha har bir foydalanuvchiga "
+        "bitta dayjest xatni navbatga qo'yadi (cron orqali, masalan kuniga bir marta). "
+        "Xatlarni send_outbound_emails yuboradi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, help="Bir ishga tushirishda ko'rib chiqiladigan mosliklar soni")
+
+    def handle(self, *args, **options):
+        queued, matches = alerts.send_digests(limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f"{queued} ta dayjest navbatga qo'yildi ({matches} ta moslik)"))
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from hr_bolim import taskqueue
+
+
+class Command(BaseCommand):
+    help = "Fon vazifalari metrikalari (hr_bolim.taskqueue): tur bo'yicha throughput, navbat va kechikish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--minutes', type=int, default=60, help="Throughput oralig'i (daqiqa)")
+
+    def handle(self, *args, **options):
+        rows = taskqueue.stats(since=timezone.now() - timedelta(minutes=options['minutes']))
+        if not rows:
+            self.stdout.write("Vazifalar yo'q")
+            return
+        for name, row in rows.items():
+            self.stdout.write(
+                f"{name}: {row['done']} bajarildi, {row['failed']} xato ({row['per_minute']}/daqiqa, "
+                f"o'rtacha {row.get('avg_ms', '-')} ms); navbatda {row['queued']}, "
+                f"bajarilmoqda {row['running']}, eng uzoq kutish {row.get('max_wait_s', 0)} s"
+            )
@@ -0,0 +1,315 @@
+"""
+Candidate-job matching over precomputed skill vectors.
+
+Har bir faol vakansiya (sarlavha + talablar) va har bir nomzod profili
+(ko'nikmalar + kasb) siyrak TF vektorga aylantiriladi va SkillVector
+jadvalida (termin, og'irlik) qatorlari sifatida saqlanadi. Vektor obyekt
+saqlanganda fon vazifasida qayta hisoblanadi (signals -> hr_bolim.taskqueue),
+o'zgarmagan bo'lsa - yozilmaydi.
+
+Moslik - TF-IDF kosinus yaqinligi:
+
+    score = sum_t  c(t) * j(t) * idf(t)^2,   idf(t) = ln((N + 1) / (df(t) + 1)) + 1
+
+bu yerda c, j - L2 bo'yicha normallangan TF vektorlar, N - faol
+vakansiyalar soni, df(t) - SkillTerm.job_df. IDF so'rov vaqtida
+hisoblanadi: yangi vakansiya boshqa vektorlarni qayta yozishni talab
+qilmaydi. Siyrak skalyar ko'paytma SQL'da, (term, kind, weight) indeksi
+bo'yicha har bir terminning eng og'ir postinglari ustida bajariladi -
+so'rov narxi katalog hajmiga bog'liq emas.
+"""
+import math
+from collections import Counter
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from . import taskqueue, talent
+from .models import CandidateApplication, CandidateProfile, EmployerJob, SkillTerm, SkillVector
+from .search import tokenize
+
+# Bitta hujjatdan saqlanadigan eng ko'p terminlar (eng kattalari qoladi)
+MAX_TERMS = 40
+MAX_TERM_LENGTH = 64
+
+# Ko'nikmani bildirmaydigan so'zlar (o'zbek, rus translit, ingliz)
+STOPWORDS = frozenset("""
+    va bilan uchun yoki ham bu shu bir kabi yil yillik tajriba tajribasi bilish bilimi
+    kerak zarur talab talablar ish ishlash yaxshi darajada asosiy kamida dan gacha ga
+    ni ning da lik
+    and or the with of in on for to an be is are as at by from our we you your
+    year years experience knowledge skills skill good strong ability understanding plus
+    i v na po ot do s k za opyt znanie rabota
+""".split())
+
+# Bir xil ko'nikmaning turli yozilishlari
+ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'golang': 'go',
+    'k8s': 'kubernetes',
+    'reactjs': 'react',
+    'vuejs': 'vue',
+    'nodejs': 'node',
+    'mssql': 'sqlserver',
+    'excell': 'excel',
+}
+
+
+def terms(text):
+    """Matndagi ko'nikma terminlari (normallangan, stop-so'zlarsiz)."""
+    result = []
+    for token in tokenize(text):
+        token = ALIASES.get(token, token)
+        if token in STOPWORDS or token.isdigit() or len(token) > MAX_TERM_LENGTH:
+            continue
+        result.append(token)
+    return result
+
+
+def _vector(counts):
+    """Sublinear TF, eng katta MAX_TERMS ta termin, L2 normallash."""
+    if not counts:
+        return {}
+    weights = {term: 1 + math.log(n) for term, n in counts.items()}
+    top = sorted(weights.items(), key=lambda item: (-item[1], item[0]))[:MAX_TERMS]
+    norm = math.sqrt(sum(w * w for _term, w in top))
+    return {term: w / norm for term, w in top}
+
+
+def job_vector(job):
+    """Faol bo'lmagan vakansiya uchun bo'sh vektor (tavsiyalarda ko'rinmaydi)."""
+    if job.status != 'active':
+        return {}
+    counts = Counter(terms(job.title) * 2)
+    counts.update(terms(job.requirements))
+    return _vector(counts)
+
+
+def candidate_vector(profile):
+    """Ishlov berish cheklangan profil matchingga kirmaydi."""
+    if profile.is_processing_restricted:
+        return {}
+    counts = Counter(terms(profile.skills) * 2)
+    counts.update(terms(profile.profession))
+    return _vector(counts)
+
+
+# ----------------------------------------------------------------
+# Index maintenance
+# ----------------------------------------------------------------
+
+def _store(kind, object_id, vector, apps=global_apps):
+    Term = apps.get_model('hr_bolim', 'SkillTerm')
+    Vector = apps.get_model('hr_bolim', 'SkillVector')
+
+    with transaction.atomic():
+        postings = Vector.objects.filter(kind=kind, object_id=object_id)
+        old = {
+            term: (term_id, weight)
+            for term, term_id, weight in postings.values_list('term__term', 'term_id', 'weight')
+        }
+        if old.keys() == vector.keys() and all(math.isclose(old[t][1], w) for t, w in vector.items()):
+            return
+
+        missing = vector.keys() - old.keys()
+        if missing:
+            Term.objects.bulk_create([Term(term=term) for term in missing], ignore_conflicts=True)
+        ids = dict(Term.objects.filter(term__in=vector).values_list('term', 'id'))
+
+        postings.delete()
+        Vector.objects.bulk_create([
+            Vector(kind=kind, object_id=object_id, term_id=ids[term], weight=weight)
+            for term, weight in vector.items()
+        ])
+
+        if kind == 'job':
+            if missing:
+                Term.objects.filter(term__in=missing).update(job_df=F('job_df') + 1)
+            removed = [old[term][0] for term in old.keys() - vector.keys()]
+            if removed:
+                Term.objects.filter(pk__in=removed).update(job_df=Greatest(F('job_df') - 1, 0))
+
+
+def update_job(job):
+    _store('job', job.pk, job_vector(job))
+
+
+def update_candidate(profile):
+    _store('candidate', profile.pk, candidate_vector(profile))
+
+
+def remove_job(pk):
+    _store('job', pk, {})
+
+
+def remove_candidate(pk):
+    _store('candidate', pk, {})
+
+
+@taskqueue.task(priority=3)
+def sync_job(job_id):
+    """Vakansiya vektorini bazadagi holatiga keltiradi (o'chirilgan bo'lsa - olib tashlaydi)."""
+    job = EmployerJob.objects.filter(pk=job_id).first()
+    if job is None:
+        remove_job(job_id)
+    else:
+        update_job(job)
+
+
+@taskqueue.task(priority=3)
+def sync_candidate(profile_id):
+    profile = CandidateProfile.objects.filter(pk=profile_id).first()
+    if profile is None:
+        remove_candidate(profile_id)
+    else:
+        update_candidate(profile)
+
+
+def schedule_job(job_id):
+    taskqueue.enqueue(sync_job, unique_key=f"matching.job:{job_id}", job_id=job_id)
+
+
+def schedule_candidate(profile_id):
+    taskqueue.enqueue(sync_candidate, unique_key=f"matching.candidate:{profile_id}", profile_id=profile_id)
+
+
+def sync_jobs(queryset):
+    """queryset.update() signal yubormaydi - admin action'lardan keyin chaqiriladi."""
+    for job in queryset.iterator(chunk_size=500):
+        update_job(job)
+
+
+def rebuild(apps=global_apps):
+    """Lug'at va barcha vektorlarni noldan quradi. (vakansiyalar, nomzodlar) soni."""
+    Term = apps.get_model('hr_bolim', 'SkillTerm')
+    Vector = apps.get_model('hr_bolim', 'SkillVector')
+    Job = apps.get_model('hr_bolim', 'EmployerJob')
+    Profile = apps.get_model('hr_bolim', 'CandidateProfile')
+
+    vectors = []
+    df = Counter()
+    for job in Job.objects.filter(status='active').iterator(chunk_size=500):
+        vector = job_vector(job)
+        if vector:
+            vectors.append(('job', job.pk, vector))
+            df.update(vector.keys())
+    n_jobs = len(vectors)
+    for profile in Profile.objects.filter(is_processing_restricted=False).iterator(chunk_size=500):
+        vector = candidate_vector(profile)
+        if vector:
+            vectors.append(('candidate', profile.pk, vector))
+
+    with transaction.atomic():
+        Vector.objects.all().delete()
+        Term.objects.all().delete()
+        vocabulary = set(df)
+        for _kind, _pk, vector in vectors:
+            vocabulary.update(vector)
+        Term.objects.bulk_create([Term(term=term, job_df=df[term]) for term in sorted(vocabulary)],
+                                 batch_size=500)
+        ids = dict(Term.objects.values_list('term', 'id'))
+        Vector.objects.bulk_create((
+            Vector(kind=kind, object_id=pk, term_id=ids[term], weight=weight)
+            for kind, pk, vector in vectors for term, weight in vector.items()
+        ), batch_size=1000)
+    return n_jobs, len(vectors) - n_jobs
+
+
+# ----------------------------------------------------------------
+# Scoring
+# ----------------------------------------------------------------
+
+def _query_vector(kind, object_id):
+    """[(term_id, og'irlik, idf^2)] - manba vektor va IDF bitta so'rovda."""
+    sql = (
+        f"SELECT q.term_id, q.weight, t.job_df, "
+        f"(SELECT COUNT(*) FROM {EmployerJob._meta.db_table} WHERE status = 'active') "
+        f"FROM {SkillVector._meta.db_table} q JOIN {SkillTerm._meta.db_table} t ON t.id = q.term_id "
+        f"WHERE q.kind = %s AND q.object_id = %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [kind, object_id])
+        rows = cursor.fetchall()
+    return [
+        (term_id, weight, (math.log((total + 1) / (df + 1)) + 1) ** 2)
+        for term_id, weight, df, total in rows
+    ]
+
+
+def _scores(source_kind, source_id, target_kind, limit, exclude_sql='', exclude_params=()):
+    """[(target object_id, score, cosine)] - eng moslari birinchi.
+
+    Tartib IDF bilan og'irlangan skor bo'yicha; ``cosine`` - IDF'siz
+    kosinus (0..1), foiz sifatida ko'rsatish uchun.
+
+    Har bir termin uchun faqat og'irligi eng katta MATCHING_POSTINGS_PER_TERM
+    ta posting o'qiladi (impact-ordered postings, indeks bo'yicha): keng
+    tarqalgan termin minglab qatorlarni skanerlashga majbur qilmaydi.
+    Shu termin kichik og'irlikka ega hujjatlar uchun skor taxminiy bo'ladi.
+    """
+    query = _query_vector(source_kind, source_id)
+    if not query:
+        return []
+    per_term = getattr(settings, 'MATCHING_POSTINGS_PER_TERM', 2000)
+    parts, params = [], []
+    for i, (term_id, weight, idf2) in enumerate(query):
+        parts.append(
+            f"SELECT * FROM (SELECT object_id, weight * %s AS score, weight * %s AS cosine "
+            f"FROM {SkillVector._meta.db_table} WHERE term_id = %s AND kind = %s "
+            f"ORDER BY weight DESC, object_id DESC LIMIT %s) p{i}"
+        )
+        params += [weight * idf2, weight, term_id, target_kind, per_term]
+    sql = (
+        f"SELECT d.object_id, SUM(d.score) AS score, SUM(d.cosine) AS cosine "
+        f"FROM ({' UNION ALL '.join(parts)}) d "
+        f"WHERE 1 = 1 {exclude_sql} "
+        f"GROUP BY d.object_id "
+        f"ORDER BY score DESC, d.object_id DESC "
+        f"LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, *exclude_params, limit])
+        return cursor.fetchall()
+
+
+def _percent(cosine):
+    return min(100, round(cosine * 100))
+
+
+def recommended_jobs(profile, limit=5):
+    """Nomzod uchun eng mos faol vakansiyalar: [(EmployerJob, foiz)].
+
+    Nomzod allaqachon topshirgan vakansiyalar chiqarib tashlanadi.
+    """
+    rows = _scores(
+        'candidate', profile.pk, 'job', limit,
+        f"AND d.object_id NOT IN (SELECT job_id FROM {CandidateApplication._meta.db_table} WHERE candidate_id = %s)",
+        [profile.user_id],
+    )
+    if not rows:
+        return []
+    jobs = EmployerJob.objects.select_related('company').in_bulk([row[0] for row in rows])
+    return [(jobs[pk], _percent(cosine)) for pk, _score, cosine in rows if pk in jobs]
+
+
+def top_candidates(job, limit=10):
+    """Vakansiya uchun eng mos nomzodlar: [(CandidateProfile, foiz)].
+
+    Nomzodlar qidiruvidagi kabi faqat ko'rinadigan profillar (talent.visible) -
+    ochiq rezyumesiz yoki ishlov berishni cheklaganlar chiqmaydi.
+    """
+    visible_sql, visible_params = talent.visible().values('pk').query.sql_with_params()
+    rows = _scores('job', job.pk, 'candidate', limit, f"AND d.object_id IN ({visible_sql})", visible_params)
+    if not rows:
+        return []
+    profiles = talent.visible(CandidateProfile.objects.select_related('user')).in_bulk(
+        [row[0] for row in rows]
+    )
+    return [(profiles[pk], _percent(cosine)) for pk, _score, cosine in rows if pk in profiles]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-03-02 10:15
+
+from django.db import migrations
+
+from hr_bolim.search import employer_job_index, job_index
+
+
+def create_search_indexes(apps, schema_editor):
+    job_index.create(schema_editor)
+    employer_job_index.create(schema_editor)
+
+    Job = apps.get_model('hr_bolim', 'Job')
+    EmployerJob = apps.get_model('hr_bolim', 'EmployerJob')
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        job_index.rebuild(Job.objects.select_related('department'), schema_editor.connection)
+        employer_job_index.rebuild(EmployerJob.objects.all(), schema_editor.connection)
+
+
+def drop_search_indexes(apps, schema_editor):
+    job_index.drop(schema_editor)
+    employer_job_index.drop(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0012_alter_user_role'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
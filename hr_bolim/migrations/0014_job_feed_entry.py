@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-03-04 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from hr_bolim import feed
+
+
+def populate_feed(apps, schema_editor):
+    feed.rebuild(
+        job_model=apps.get_model('hr_bolim', 'Job'),
+        employer_job_model=apps.get_model('hr_bolim', 'EmployerJob'),
+        manager=apps.get_model('hr_bolim', 'JobFeedEntry').objects,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0013_job_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('job', 'Job'), ('employer_job', 'EmployerJob')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('location', models.CharField(blank=True, max_length=200)),
+                ('employment_type', models.CharField(max_length=50)),
+                ('experience_required', models.CharField(blank=True, max_length=20, null=True)),
+                ('salary_min', models.DecimalField(blank=True, decimal_places=0, max_digits=12, null=True)),
+                ('salary_max', models.DecimalField(blank=True, decimal_places=0, max_digits=12, null=True)),
+                ('published_at', models.DateTimeField()),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='hr_bolim.company')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='hr_bolim.department')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-published_at', '-id'], name='feed_published_idx')],
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(populate_feed, migrations.RunPython.noop),
+    ]
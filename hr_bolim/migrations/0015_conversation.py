@@ -0,0 +1,54 @@
+# Generated by Django 6.0 on 2026-03-06 14:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_conversations(apps, schema_editor):
+    Message = apps.get_model('hr_bolim', 'Message')
+    Conversation = apps.get_model('hr_bolim', 'Conversation')
+
+    conversations = {}
+    for message in Message.objects.order_by('timestamp', 'id').iterator(chunk_size=1000):
+        pair = tuple(sorted((message.sender_id, message.recipient_id)))
+        conversation = conversations.get(pair)
+        if conversation is None:
+            conversation = Conversation(user_low_id=pair[0], user_high_id=pair[1])
+            conversations[pair] = conversation
+        conversation.last_message_id = message.id
+        conversation.last_activity = message.timestamp
+        if not message.is_read:
+            if message.recipient_id == pair[0]:
+                conversation.unread_low += 1
+            else:
+                conversation.unread_high += 1
+    Conversation.objects.bulk_create(conversations.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0014_job_feed_entry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_activity', models.DateTimeField(default=django.utils.timezone.now)),
+                ('unread_low', models.PositiveIntegerField(default=0)),
+                ('unread_high', models.PositiveIntegerField(default=0)),
+                ('last_message', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='hr_bolim.message')),
+                ('user_high', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user_low', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user_low', '-last_activity'], name='conversation_low_activity_idx'), models.Index(fields=['user_high', '-last_activity'], name='conversation_high_activity_idx')],
+                'unique_together': {('user_low', 'user_high')},
+            },
+        ),
+        migrations.RunPython(populate_conversations, migrations.RunPython.noop),
+    ]
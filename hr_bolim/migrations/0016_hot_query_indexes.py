@@ -0,0 +1,69 @@
+# Generated by Django 6.0 on 2026-03-09 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0015_conversation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['-created_at'], name='auditlog_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateapplication',
+            index=models.Index(fields=['job', 'status', '-applied_at'], name='application_job_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateapplication',
+            index=models.Index(fields=['job', '-applied_at'], name='application_job_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateapplication',
+            index=models.Index(fields=['candidate', '-applied_at'], name='application_candidate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidateapplication',
+            index=models.Index(fields=['candidate', 'status'], name='application_cand_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consentlog',
+            index=models.Index(fields=['-given_at'], name='consentlog_given_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employerjob',
+            index=models.Index(fields=['status', '-created_at'], name='employerjob_status_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employerjob',
+            index=models.Index(fields=['company', 'status'], name='employerjob_company_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employerjob',
+            index=models.Index(fields=['company', '-created_at'], name='employerjob_company_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employerjob',
+            index=models.Index(fields=['company', '-view_count'], name='employerjob_company_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['-scheduled_date'], name='interview_scheduled_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', '-posted_at'], name='job_status_posted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['sender', 'recipient', 'id'], name='message_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['recipient', 'sender'], name='message_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0 on 2026-03-10 10:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from hr_bolim import stats
+
+
+def populate_stats(apps, schema_editor):
+    stats.rebuild_totals(apps=apps)
+    stats.rebuild_daily(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0016_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyStats',
+            fields=[
+                ('company', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='hr_bolim.company')),
+                ('jobs_total', models.IntegerField(default=0)),
+                ('jobs_active', models.IntegerField(default=0)),
+                ('applications_total', models.IntegerField(default=0)),
+                ('applications_new', models.IntegerField(default=0)),
+                ('applications_reviewed', models.IntegerField(default=0)),
+                ('applications_interview', models.IntegerField(default=0)),
+                ('applications_rejected', models.IntegerField(default=0)),
+                ('applications_accepted', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CompanyStatsDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('jobs_posted', models.IntegerField(default=0)),
+                ('applications', models.IntegerField(default=0)),
+                ('hires', models.IntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='hr_bolim.company')),
+            ],
+            options={
+                'unique_together': {('company', 'date')},
+            },
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
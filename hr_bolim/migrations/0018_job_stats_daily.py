@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-03-10 14:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from hr_bolim import stats
+
+
+def populate_job_stats(apps, schema_editor):
+    stats.rebuild_job_daily(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0017_company_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobStatsDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.IntegerField(default=0)),
+                ('applications', models.IntegerField(default=0)),
+                ('interviews', models.IntegerField(default=0)),
+                ('hires', models.IntegerField(default=0)),
+                ('hire_seconds', models.BigIntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_daily_stats', to='hr_bolim.company')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='hr_bolim.employerjob')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company', 'date'], name='jobstats_company_date_idx')],
+                'unique_together': {('job', 'date')},
+            },
+        ),
+        migrations.RunPython(populate_job_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0 on 2026-03-21 10:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from hr_bolim import matching
+
+
+def build_skill_vectors(apps, schema_editor):
+    matching.rebuild(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0019_data_deletion_progress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64, unique=True)),
+                ('job_df', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SkillVector',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('job', 'Vakansiya'), ('candidate', 'Nomzod')], max_length=10)),
+                ('object_id', models.PositiveIntegerField()),
+                ('weight', models.FloatField()),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='hr_bolim.skillterm')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'kind', 'weight', 'object_id'], name='skillvector_term_idx')],
+                'unique_together': {('kind', 'object_id', 'term')},
+            },
+        ),
+        migrations.RunPython(build_skill_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-03-23 11:40
+
+from django.db import migrations
+
+from hr_bolim import talent
+from hr_bolim.search import candidate_index
+
+
+def create_candidate_index(apps, schema_editor):
+    candidate_index.create(schema_editor)
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        talent.rebuild(apps=apps, connection=schema_editor.connection)
+
+
+def drop_candidate_index(apps, schema_editor):
+    candidate_index.drop(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0020_skill_vectors'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_candidate_index, drop_candidate_index),
+    ]
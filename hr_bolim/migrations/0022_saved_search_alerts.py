@@ -0,0 +1,61 @@
+# Generated by Django 6.0 on 2026-03-25 09:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0021_candidate_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=150)),
+                ('query', models.CharField(blank=True, max_length=200)),
+                ('location', models.CharField(blank=True, max_length=150)),
+                ('employment_type', models.CharField(blank=True, max_length=20)),
+                ('salary_min', models.PositiveIntegerField(blank=True, null=True)),
+                ('salary_max', models.PositiveIntegerField(blank=True, null=True)),
+                ('experience', models.CharField(blank=True, max_length=20)),
+                ('required_keys', models.PositiveSmallIntegerField(default=0, editable=False)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_digest_at', models.DateTimeField(blank=True, null=True)),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='hr_bolim.company')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='hr_bolim.department')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SavedSearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100)),
+                ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keys', to='hr_bolim.savedsearch')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['key', 'search'], name='savedsearchkey_key_idx')],
+                'unique_together': {('search', 'key')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('matched_at', models.DateTimeField(auto_now_add=True)),
+                ('notified_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_matches', to='hr_bolim.employerjob')),
+                ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='hr_bolim.savedsearch')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['search'], name='savedsearchmatch_pending_idx')],
+                'unique_together': {('search', 'job')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-03-27 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0024_background_tasks'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Navbatda'), ('running', 'Bajarilmoqda'), ('done', 'Bajarildi'), ('failed', 'Xato'), ('superseded', 'Almashtirildi')], default='queued', max_length=10),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-03-27 11:40
+
+from django.db import migrations
+
+from hr_bolim import alerts
+
+
+def reindex_saved_searches(apps, schema_editor):
+    # loc:<token> kalitlari olib tashlandi - joylashuv endi icontains bilan tekshiriladi
+    alerts.rebuild(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0025_task_superseded_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex_saved_searches, migrations.RunPython.noop),
+    ]
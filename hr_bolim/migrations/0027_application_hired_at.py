@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-03-30 09:20
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_hired_at(apps, schema_editor):
+    # Eski qabul qilingan arizalar uchun eng yaqin taxmin - oxirgi o'zgarish vaqti
+    Application = apps.get_model('hr_bolim', 'CandidateApplication')
+    Application.objects.filter(status='accepted').update(hired_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0026_saved_search_location_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidateapplication',
+            name='hired_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_hired_at, migrations.RunPython.noop),
+    ]
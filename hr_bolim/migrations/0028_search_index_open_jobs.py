@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-03-31 10:30
+
+from django.db import migrations
+
+from hr_bolim.search import employer_job_index, job_index
+
+
+def reindex_open_jobs(apps, schema_editor):
+    # Yopiq/faol bo'lmagan vakansiyalar endi indekslanmaydi
+    Job = apps.get_model('hr_bolim', 'Job')
+    EmployerJob = apps.get_model('hr_bolim', 'EmployerJob')
+    job_index.rebuild(Job.objects.select_related('department'), schema_editor.connection)
+    employer_job_index.rebuild(EmployerJob.objects.all(), schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr_bolim', '0027_application_hired_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex_open_jobs, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,26 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.db.models.functions import Greatest
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import urlencode
+
+
+class CounterFieldsMixin:
+    """``counter_fields`` faqat F() bilan yangilanadi (hr_bolim.counters, hr_bolim.stats).
+
+    Oddiy save() ularni xotiradagi eskirgan qiymat bilan qayta yozmasligi
+    uchun mavjud qatorni saqlashda bu maydonlar update_fields'dan chiqariladi.
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
 
 #Users modeli
 
@@ -86,6 +106,12 @@ class Job(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deadline = models.DateTimeField(blank=True,null=True)
 
+    class Meta:
+        indexes = [
+            # home_view: status='open' ORDER BY -posted_at
+            models.Index(fields=['status', '-posted_at'], name='job_status_posted_idx'),
+        ]
+
     def __str__(self):
         return self.title
     
@@ -146,6 +172,12 @@ class ConsentLog(models.Model):
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # admin_gdpr_logs: ORDER BY -given_at
+            models.Index(fields=['-given_at'], name='consentlog_given_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.email} - {self.consent_type}"
 
@@ -163,9 +195,16 @@ class PrivacyPolicy(models.Model):
 
 
 class DataDeletionRequest(models.Model):
+    """Hisobni o'chirish so'rovi.
+
+    hr_bolim.deletion uni bosqichma-bosqich bajaradi: ``stage`` - oxirgi
+    tugagan bosqich, ``progress`` - bosqichlar bo'yicha qayta ishlangan
+    qatorlar soni. Jarayon uzilsa, keyingi ishga tushirishda shu joydan davom etadi.
+    """
 
     STATUS_CHOICES = (
         ("pending", "Pending"),
+        ("processing", "Processing"),
         ("completed", "Completed"),
         ("rejected", "Rejected"),
     )
@@ -175,6 +214,10 @@ class DataDeletionRequest(models.Model):
     processed_at = models.DateTimeField(blank=True, null=True)
 
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    stage = models.CharField(max_length=20, blank=True, default='')
+    progress = models.JSONField(default=dict, blank=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
 
     def __str__(self):
         return f"{self.user.email} - {self.status}"
@@ -187,6 +230,11 @@ class AuditLog(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at'], name='auditlog_created_idx'),
+        ]
+
     def __str__(self):
         return self.action
 
@@ -194,7 +242,9 @@ class AuditLog(models.Model):
 # Candidate (Job Seeker) Models
 # ----------------------------------------------------------------
 
-class CandidateProfile(models.Model):
+class CandidateProfile(CounterFieldsMixin, models.Model):
+    counter_fields = ('profile_views',)
+
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='candidate_profile')
     profile_picture = models.ImageField(upload_to='profile_pics/', blank=True, null=True)
     profession = models.CharField(max_length=150, blank=True, null=True, help_text="Ex: Software Engineer")
@@ -304,9 +354,82 @@ class Message(models.Model):
     is_read = models.BooleanField(default=False)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # chat.history(): sender/recipient juftligi bo'yicha id cursor
+            models.Index(fields=['sender', 'recipient', 'id'], name='message_thread_idx'),
+            # O'qilmagan xabarlar soni va mark_read_until() - faqat is_read=False qatorlar
+            models.Index(fields=['recipient', 'sender'], condition=models.Q(is_read=False), name='message_unread_idx'),
+        ]
+
     def __str__(self):
         return f"From {self.sender} to {self.recipient}"
 
+class ConversationQuerySet(models.QuerySet):
+    def for_user(self, user):
+        return self.filter(
+            models.Q(user_low=user) | models.Q(user_high=user)
+        ).select_related('user_low', 'user_high', 'last_message').order_by('-last_activity', '-id')
+
+class Conversation(models.Model):
+    """Ikki foydalanuvchi orasidagi yozishma indeksi.
+
+    Juftlik tartiblangan holda saqlanadi (user_low.id < user_high.id), shuning
+    uchun har bir juftlik uchun faqat bitta qator bo'ladi. Message yaratilganda
+    signal orqali yangilanadi; inbox bitta so'rov bilan chiziladi.
+    """
+    user_low = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    user_high = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    last_message = models.ForeignKey(Message, on_delete=models.SET_NULL, blank=True, null=True, related_name='+')
+    last_activity = models.DateTimeField(default=timezone.now)
+    unread_low = models.PositiveIntegerField(default=0)
+    unread_high = models.PositiveIntegerField(default=0)
+
+    objects = ConversationQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ('user_low', 'user_high')
+        indexes = [
+            models.Index(fields=['user_low', '-last_activity'], name='conversation_low_activity_idx'),
+            models.Index(fields=['user_high', '-last_activity'], name='conversation_high_activity_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_low} <-> {self.user_high}"
+
+    @staticmethod
+    def _pair(user_id, other_id):
+        return (user_id, other_id) if user_id < other_id else (other_id, user_id)
+
+    @classmethod
+    def record_message(cls, message):
+        low, high = cls._pair(message.sender_id, message.recipient_id)
+        unread_field = 'unread_low' if message.recipient_id == low else 'unread_high'
+        conversation, created = cls.objects.get_or_create(
+            user_low_id=low, user_high_id=high,
+            defaults={'last_message': message, 'last_activity': message.timestamp, unread_field: 1},
+        )
+        if not created:
+            cls.objects.filter(pk=conversation.pk).update(
+                last_message=message,
+                last_activity=message.timestamp,
+                **{unread_field: models.F(unread_field) + 1},
+            )
+
+    @classmethod
+    def mark_read(cls, user, other_user, count=None):
+        """``count`` ta xabar o'qildi; None bo'lsa hisoblagich nolga tushadi."""
+        low, high = cls._pair(user.id, other_user.id)
+        unread_field = 'unread_low' if user.id == low else 'unread_high'
+        value = 0 if count is None else Greatest(models.F(unread_field) - count, 0)
+        cls.objects.filter(user_low_id=low, user_high_id=high).update(**{unread_field: value})
+
+    def other_user(self, user):
+        return self.user_high if user.id == self.user_low_id else self.user_low
+
+    def unread_for(self, user):
+        return self.unread_low if user.id == self.user_low_id else self.unread_high
+
 # ----------------------------------------------------------------
 # Employer Models
 # ----------------------------------------------------------------
@@ -330,7 +453,9 @@ class Company(models.Model):
     def __str__(self):
         return self.company_name
 
-class CompanyProfile(models.Model):
+class CompanyProfile(CounterFieldsMixin, models.Model):
+    counter_fields = ('total_jobs_posted', 'total_applications', 'profile_views')
+
     company = models.OneToOneField(Company, on_delete=models.CASCADE, related_name='profile')
     logo = models.ImageField(upload_to='company_logos/', blank=True, null=True)
     description = models.TextField()
@@ -352,7 +477,9 @@ class CompanyProfile(models.Model):
     def __str__(self):
         return f"{self.company.company_name} Profile"
 
-class EmployerJob(models.Model):
+class EmployerJob(CounterFieldsMixin, models.Model):
+    counter_fields = ('view_count', 'application_count')
+
     STATUS_CHOICES = (
         ("draft", "Draft"),
         ("active", "Active"),
@@ -389,9 +516,29 @@ class EmployerJob(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # status='active' ORDER BY -created_at
+            models.Index(fields=['status', '-created_at'], name='employerjob_status_recent_idx'),
+            # employer_jobs va kompaniya statistikasi
+            models.Index(fields=['company', 'status'], name='employerjob_company_status_idx'),
+            models.Index(fields=['company', '-created_at'], name='employerjob_company_recent_idx'),
+            models.Index(fields=['company', '-view_count'], name='employerjob_company_views_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title} at {self.company.company_name}"
 
+class CandidateApplicationQuerySet(models.QuerySet):
+    def for_company(self, company):
+        return self.filter(job__company=company)
+
+    def for_employer_listing(self):
+        """Ro'yxat sahifalari uchun: nomzod, profil, vakansiya va intervyu bitta JOIN bilan."""
+        return self.select_related(
+            'candidate__candidate_profile', 'job__company', 'interview'
+        ).order_by('-applied_at', '-id')
+
 class CandidateApplication(models.Model):
     STATUS_CHOICES = (
         ("new", "Yangi"),
@@ -415,13 +562,37 @@ class CandidateApplication(models.Model):
     
     applied_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Faqat 'accepted' holatiga o'tganda qo'yiladi (hr_bolim.signals) - ishga olingan sana statistikasi uchun
+    hired_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = CandidateApplicationQuerySet.as_manager()
 
     class Meta:
         unique_together = ('job', 'candidate')
+        indexes = [
+            # job__company=... [status=...] ORDER BY -applied_at
+            models.Index(fields=['job', 'status', '-applied_at'], name='application_job_status_idx'),
+            models.Index(fields=['job', '-applied_at'], name='application_job_applied_idx'),
+            # my_applications / candidate_dashboard
+            models.Index(fields=['candidate', '-applied_at'], name='application_candidate_idx'),
+            models.Index(fields=['candidate', 'status'], name='application_cand_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.candidate.email} - {self.job.title}"
 
+class InterviewQuerySet(models.QuerySet):
+    def for_company(self, company):
+        return self.filter(application__job__company=company)
+
+    def for_candidate(self, user):
+        return self.filter(application__candidate=user)
+
+    def for_listing(self):
+        return self.select_related(
+            'application__candidate', 'application__job__company'
+        ).order_by('-scheduled_date', '-id')
+
 class Interview(models.Model):
     STATUS_CHOICES = (
         ("scheduled", "Rejalashtirilgan"),
@@ -446,6 +617,354 @@ class Interview(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = InterviewQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-scheduled_date'], name='interview_scheduled_idx'),
+        ]
+
     def __str__(self):
         return f"Interview for {self.application.job.title}"
 
+
+# ----------------------------------------------------------------
+# Unified job feed
+# ----------------------------------------------------------------
+
+class JobFeedEntry(models.Model):
+    """Job va EmployerJob'ning denormalizatsiya qilingan umumiy lentasi.
+
+    Faqat ochiq vakansiyalar saqlanadi; qatorlar signallar orqali
+    hr_bolim.feed.sync_job() bilan yangilanadi.
+    """
+    KIND_CHOICES = (
+        ("job", "Job"),
+        ("employer_job", "EmployerJob"),
+    )
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=200)
+    location = models.CharField(max_length=200, blank=True)
+    employment_type = models.CharField(max_length=50)
+    experience_required = models.CharField(max_length=20, blank=True, null=True)
+    salary_min = models.DecimalField(max_digits=12, decimal_places=0, blank=True, null=True)
+    salary_max = models.DecimalField(max_digits=12, decimal_places=0, blank=True, null=True)
+    department = models.ForeignKey(Department, on_delete=models.CASCADE, blank=True, null=True)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, blank=True, null=True)
+    published_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('kind', 'object_id')
+        indexes = [
+            models.Index(fields=['-published_at', '-id'], name='feed_published_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
+
+
+# ----------------------------------------------------------------
+# Company statistics rollups
+# ----------------------------------------------------------------
+
+class CompanyStats(models.Model):
+    """Kompaniya bo'yicha jamlangan hisoblagichlar (employer_dashboard, employer_statistics).
+
+    Qatorlar hr_bolim.stats orqali signallarda F() bilan yangilanadi;
+    ``rebuild_company_stats`` buyrug'i ularni noldan qayta hisoblaydi.
+    Ayirishda vaqtincha manfiy qiymat CHECK xatosiga olib kelmasligi uchun
+    maydonlar IntegerField.
+    """
+    company = models.OneToOneField(Company, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    jobs_total = models.IntegerField(default=0)
+    jobs_active = models.IntegerField(default=0)
+    applications_total = models.IntegerField(default=0)
+    applications_new = models.IntegerField(default=0)
+    applications_reviewed = models.IntegerField(default=0)
+    applications_interview = models.IntegerField(default=0)
+    applications_rejected = models.IntegerField(default=0)
+    applications_accepted = models.IntegerField(default=0)
+
+    def application_stats(self):
+        """Holatlar bo'yicha arizalar soni (faqat 0 dan kattalari)."""
+        stats = []
+        for status, label in CandidateApplication.STATUS_CHOICES:
+            count = getattr(self, f'applications_{status}')
+            if count:
+                stats.append({'status': status, 'label': label, 'count': count})
+        return stats
+
+    def __str__(self):
+        return f"{self.company_id} stats"
+
+
+class CompanyStatsDaily(models.Model):
+    """Kunlik soni: e'lon qilingan vakansiyalar, arizalar va ishga olishlar.
+
+    O'chirilgan yozuvlar o'z kunidan ayiriladi, shuning uchun qatorlar
+    stats.rebuild_daily() natijasiga mos keladi.
+    """
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    jobs_posted = models.IntegerField(default=0)
+    applications = models.IntegerField(default=0)
+    hires = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ('company', 'date')
+
+    def __str__(self):
+        return f"{self.company_id} {self.date}"
+
+
+class JobStatsDaily(models.Model):
+    """Vakansiya bo'yicha kunlik voronka: ko'rishlar -> arizalar -> intervyular -> ishga olish.
+
+    Intervyu scheduled_date kuniga, ishga olish ariza qabul qilingan kunga
+    yoziladi. hire_seconds - shu kundagi ishga olishlar uchun ariza
+    berilganidan qabul qilingungacha o'tgan vaqtlar yig'indisi.
+    """
+    job = models.ForeignKey(EmployerJob, on_delete=models.CASCADE, related_name='daily_stats')
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='job_daily_stats')
+    date = models.DateField()
+    views = models.IntegerField(default=0)
+    applications = models.IntegerField(default=0)
+    interviews = models.IntegerField(default=0)
+    hires = models.IntegerField(default=0)
+    hire_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('job', 'date')
+        indexes = [
+            # analytics.funnel(): company=... AND date >= ...
+            models.Index(fields=['company', 'date'], name='jobstats_company_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.date}"
+
+
+# ----------------------------------------------------------------
+# Candidate-job matching
+# ----------------------------------------------------------------
+
+class SkillTerm(models.Model):
+    """Ko'nikmalar lug'ati (hr_bolim.matching).
+
+    job_df - shu termin uchraydigan faol vakansiyalar soni; IDF so'rov
+    vaqtida shundan hisoblanadi, shuning uchun vektorlarni qayta yozish
+    shart emas.
+    """
+    term = models.CharField(max_length=64, unique=True)
+    job_df = models.IntegerField(default=0)
+
+    def __str__(self):
+        return self.term
+
+
+class SkillVector(models.Model):
+    """Siyrak TF vektorning bitta komponenti (L2 bo'yicha normallangan).
+
+    kind='job' -> object_id = EmployerJob.pk (faqat faol vakansiyalar),
+    kind='candidate' -> object_id = CandidateProfile.pk (ishlov berish
+    cheklanmagan profillar).
+    """
+    KIND_CHOICES = (
+        ('job', 'Vakansiya'),
+        ('candidate', 'Nomzod'),
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    term = models.ForeignKey(SkillTerm, on_delete=models.CASCADE, related_name='postings')
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ('kind', 'object_id', 'term')
+        indexes = [
+            # Skorlash: termin postinglari og'irlik kamayishi tartibida (matching._scores)
+            models.Index(fields=['term', 'kind', 'weight', 'object_id'], name='skillvector_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.term_id}={self.weight:.3f}"
+
+
+# ----------------------------------------------------------------
+# Saved-search alerts
+# ----------------------------------------------------------------
+
+class SavedSearch(models.Model):
+    """jobs_list_view qidiruvi (so'rov + filtrlar) - yangi vakansiyalar haqida xabar berish uchun.
+
+    Bo'lim va tajriba filtrlari jobs_list'dagidek EmployerJob'ga
+    qo'llanmaydi; ular faqat qidiruvni qayta ochish havolasi uchun saqlanadi.
+    required_keys - SavedSearchKey qatorlari soni (hr_bolim.alerts).
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
+    name = models.CharField(max_length=150, blank=True)
+    query = models.CharField(max_length=200, blank=True)
+    location = models.CharField(max_length=150, blank=True)
+    department = models.ForeignKey(Department, on_delete=models.CASCADE, null=True, blank=True)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, null=True, blank=True)
+    employment_type = models.CharField(max_length=20, blank=True)
+    salary_min = models.PositiveIntegerField(null=True, blank=True)
+    salary_max = models.PositiveIntegerField(null=True, blank=True)
+    experience = models.CharField(max_length=20, blank=True)
+    required_keys = models.PositiveSmallIntegerField(default=0, editable=False)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_digest_at = models.DateTimeField(null=True, blank=True)
+
+    def params(self):
+        """jobs_list GET parametrlari."""
+        values = {
+            'q': self.query,
+            'location': self.location,
+            'department': self.department_id,
+            'company': self.company_id,
+            'type': self.employment_type,
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max,
+            'experience': self.experience,
+        }
+        return {name: value for name, value in values.items() if value not in (None, '')}
+
+    def get_absolute_url(self):
+        return f"{reverse('jobs_list')}?{urlencode(self.params())}"
+
+    def __str__(self):
+        return self.name or self.query or "Barcha vakansiyalar"
+
+
+class SavedSearchKey(models.Model):
+    """Teskari indeks: kalit (``q:<token>``, ``type:..``, ``company:..``
+    yoki ``*``) -> saqlangan qidiruv."""
+    search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='keys')
+    key = models.CharField(max_length=100)
+
+    class Meta:
+        unique_together = ('search', 'key')
+        indexes = [
+            models.Index(fields=['key', 'search'], name='savedsearchkey_key_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.search_id}: {self.key}"
+
+
+class SavedSearchMatch(models.Model):
+    """Qidiruvga mos kelgan vakansiya; notified_at - dayjestga kiritilgan vaqt."""
+    search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='matches')
+    job = models.ForeignKey(EmployerJob, on_delete=models.CASCADE, related_name='search_matches')
+    matched_at = models.DateTimeField(auto_now_add=True)
+    notified_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('search', 'job')
+        indexes = [
+            models.Index(fields=['search'], condition=models.Q(notified_at__isnull=True),
+                         name='savedsearchmatch_pending_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.search_id} -> {self.job_id}"
+
+
+# ----------------------------------------------------------------
+# Outbound email queue
+# ----------------------------------------------------------------
+
+class OutboundEmail(models.Model):
+    """Yuborilishi kerak bo'lgan xat (hr_bolim.outbox).
+
+    So'rov ichida faqat qator yoziladi (biznes o'zgarishi bilan bitta
+    tranzaksiyada), SMTP'ga ``send_outbound_emails`` worker'i ulanadi.
+    digest=True xatlar bir xil qabul qiluvchi uchun bitta xatga
+    birlashtiriladi. next_attempt_at - navbatdagi urinish vaqti;
+    ``sending`` holatida esa worker "lease"ining tugash vaqti.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Kutilmoqda'),
+        ('sending', 'Yuborilmoqda'),
+        ('sent', 'Yuborildi'),
+        ('failed', 'Xato'),
+    )
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='outbound_emails')
+    to_email = models.EmailField()
+    kind = models.CharField(max_length=30, blank=True)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    digest = models.BooleanField(default=False)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Worker: status IN ('pending', 'sending') AND next_attempt_at <= now ORDER BY next_attempt_at
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_due_idx'),
+            models.Index(fields=['to_email', 'status'], name='outbound_recipient_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.to_email}: {self.subject}"
+
+
+# ----------------------------------------------------------------
+# Background tasks
+# ----------------------------------------------------------------
+
+class Task(models.Model):
+    """Fon vazifasi (hr_bolim.taskqueue, ``runworker`` bajaradi).
+
+    Worker vazifani band qilganda lease_until'ni belgilaydi va uni
+    heartbeat bilan uzaytirib turadi; lease muddati o'tgan ``running``
+    vazifa (worker to'xtab qolgan) boshqa worker tomonidan qayta olinadi.
+    unique_key - navbatda turgan bir xil vazifalarni takrorlamaslik uchun.
+    """
+    STATUS_CHOICES = (
+        ('queued', 'Navbatda'),
+        ('running', 'Bajarilmoqda'),
+        ('done', 'Bajarildi'),
+        ('failed', 'Xato'),
+        # Qayta urinish kerak bo'lganda navbatda shu unique_key'li yangi nusxa bor edi
+        ('superseded', 'Almashtirildi'),
+    )
+    name = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict, blank=True)
+    priority = models.SmallIntegerField(default=0)
+    unique_key = models.CharField(max_length=150, null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    scheduled_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    lease_until = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Navbat: status='queued' AND scheduled_at <= now ORDER BY priority DESC, scheduled_at
+            models.Index(fields=['status', '-priority', 'scheduled_at'], name='task_queue_idx'),
+            # Muddati o'tgan lease'lar: status='running' AND lease_until < now
+            models.Index(fields=['status', 'lease_until'], name='task_lease_idx'),
+            # Metrikalar: name bo'yicha finished_at oralig'i
+            models.Index(fields=['name', 'finished_at'], name='task_metrics_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['unique_key'], condition=models.Q(status='queued'), name='task_unique_queued',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,80 @@
+"""
+Email notifications for application events.
+
+Xatlar hr_bolim.outbox navbatiga yoziladi (SMTP so'rovni kutdirmaydi):
+
+- intervyu rejalashtirilganda yoki vaqti o'zgarganda - darhol;
+- ariza holati o'zgarganda - dayjest sifatida;
+- yangi chat xabari - dayjest sifatida (OUTBOX_DIGEST_DELAY ichida kelgan
+  xabarlar bitta xatga yig'iladi).
+"""
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import outbox
+
+# 'interview' holati yo'q: u uchun interview_scheduled() alohida xat yuboradi
+STATUS_MESSAGES = {
+    'reviewed': "Arizangiz ko'rib chiqildi.",
+    'rejected': "Afsuski, arizangiz rad etildi. Boshqa vakansiyalarga topshirishingiz mumkin.",
+    'accepted': "Tabriklaymiz! Arizangiz qabul qilindi.",
+}
+
+
+def _url(name, *args):
+    return f"{getattr(settings, 'SITE_URL', '').rstrip('/')}{reverse(name, args=args)}"
+
+
+def _name(user):
+    return user.get_full_name() or user.username
+
+
+def interview_scheduled(interview, rescheduled=False):
+    application = interview.application
+    job = application.job
+    when = timezone.localtime(interview.scheduled_date).strftime('%d.%m.%Y %H:%M')
+    lines = [
+        f"Assalomu alaykum, {_name(application.candidate)}!",
+        "",
+        f"{job.company.company_name} kompaniyasi \"{job.title}\" vakansiyasi bo'yicha "
+        + ("intervyu vaqtini o'zgartirdi." if rescheduled else "sizni intervyuga taklif qildi."),
+        "",
+        f"Vaqt: {when} ({interview.duration_minutes} daqiqa)",
+        f"Turi: {interview.get_interview_type_display()}",
+    ]
+    if interview.location_link:
+        lines.append(f"Havola: {interview.location_link}")
+    if interview.notes:
+        lines += ["", interview.notes]
+    lines += ["", f"Arizalaringiz: {_url('my_applications')}"]
+    subject = "Intervyu vaqti o'zgardi" if rescheduled else "Intervyuga taklif"
+    outbox.notify(application.candidate, f"{subject}: {job.title}", '\n'.join(lines), kind='interview')
+
+
+def application_status_changed(application, previous_status):
+    if previous_status is None or previous_status == application.status:
+        return
+    text = STATUS_MESSAGES.get(application.status)
+    if text is None:
+        return
+    job = application.job
+    body = '\n'.join([
+        f"\"{job.title}\" ({job.company.company_name}) - {text}",
+        f"Arizalaringiz: {_url('my_applications')}",
+    ])
+    outbox.notify(application.candidate, f"Ariza holati: {application.get_status_display()}", body,
+                  kind='application_status', digest=True)
+
+
+def message_received(message):
+    sender, recipient = message.sender, message.recipient
+    chat_url = 'employer_chat_detail' if recipient.role == 'employer' else 'chat_detail'
+    body = '\n'.join([
+        f"{_name(sender)} sizga xabar yubordi:",
+        "",
+        message.content[:500] if message.content else "[fayl]",
+        "",
+        f"Javob berish: {_url(chat_url, sender.pk)}",
+    ])
+    outbox.notify(recipient, f"Yangi xabar: {_name(sender)}", body, kind='message', digest=True)
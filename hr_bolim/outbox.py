@@ -0,0 +1,226 @@
+"""
+Outbound email queue.
+
+Bildirishnomalar so'rov ichida SMTP'ga yuborilmaydi: ``enqueue()``
+OutboundEmail qatorini biznes o'zgarishi bilan bitta tranzaksiyada yozadi
+(rollback bo'lsa xat ham yo'qoladi). ``send_outbound_emails`` worker'i:
+
+1. muddati kelgan xatlarni OUTBOX_BATCH_SIZE tadan band qiladi -
+   ``sending`` holatiga o'tkazadi, next_attempt_at esa OUTBOX_LEASE_SECONDS
+   ga suriladi (worker uzilib qolsa, xat lease tugagach qayta olinadi);
+2. ``digest=True`` xatlarni qabul qiluvchi bo'yicha bitta xatga yig'adi;
+3. hammasini bitta ``get_connection()`` ulanishi orqali yuboradi;
+4. yuborilmagan xatni OUTBOX_RETRY_BASE * 2^(urinish-1) soniyadan keyin
+   (OUTBOX_RETRY_MAX bilan cheklangan) qayta urinadi, OUTBOX_MAX_ATTEMPTS
+   urinishdan keyin ``failed`` deb belgilaydi.
+
+``runworker`` ishlayotgan bo'lsa, navbatga qo'yilgan xat ``outbox.deliver``
+fon vazifasini xat muddatiga rejalashtiradi - alohida cron shart emas.
+
+Digest xatlar OUTBOX_DIGEST_DELAY soniya kutadi: shu oraliqda kelgan
+boshqa bildirishnomalar bilan birga yuboriladi (chatdagi o'nta xabar -
+bitta email). PostgreSQL'da bir nechta worker parallel ishlashi mumkin
+(SKIP LOCKED), SQLite'da bitta worker ishlatilsin.
+"""
+import logging
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection as db_connection, transaction
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from . import taskqueue
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue(to_email, subject, body, user=None, kind='', digest=False):
+    """Xatni navbatga qo'yadi. Manzil bo'sh bo'lsa - None."""
+    if not to_email:
+        return None
+    delay = _setting('OUTBOX_DIGEST_DELAY', 600) if digest else 0
+    email = OutboundEmail.objects.create(
+        user=user,
+        to_email=to_email,
+        kind=kind,
+        subject=subject[:255],
+        body=body,
+        digest=digest,
+        next_attempt_at=timezone.now() + timedelta(seconds=delay),
+    )
+    schedule_delivery(delay)
+    return email
+
+
+def notify(user, subject, body, kind='', digest=False):
+    """Foydalanuvchiga bildirishnoma; email'siz yoki faol bo'lmagan hisobga yuborilmaydi."""
+    if not user.is_active:
+        return None
+    return enqueue(user.email, subject, body, user=user, kind=kind, digest=digest)
+
+
+def retry_delay(attempts):
+    """``attempts``-urinish muvaffaqiyatsiz bo'lgandan keyingi kutish (soniya)."""
+    base = _setting('OUTBOX_RETRY_BASE', 60)
+    return min(base * 2 ** max(attempts - 1, 0), _setting('OUTBOX_RETRY_MAX', 6 * 3600))
+
+
+# ----------------------------------------------------------------
+# Worker
+# ----------------------------------------------------------------
+
+def claim(batch_size=None, now=None):
+    """Muddati kelgan xatlarni band qiladi va qaytaradi.
+
+    Digest xat olinganda shu qabul qiluvchining hali kutayotgan boshqa
+    digest xatlari ham qo'shiladi (birinchi urinish bo'lsa).
+    """
+    now = now or timezone.now()
+    batch_size = batch_size or _setting('OUTBOX_BATCH_SIZE', 100)
+    lease_until = now + timedelta(seconds=_setting('OUTBOX_LEASE_SECONDS', 300))
+
+    with transaction.atomic():
+        due = OutboundEmail.objects.filter(
+            status__in=('pending', 'sending'), next_attempt_at__lte=now
+        ).order_by('next_attempt_at', 'id')
+        if db_connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        rows = list(due.values_list('pk', 'to_email', 'digest')[:batch_size])
+        if not rows:
+            return []
+        pks = [pk for pk, _to_email, _digest in rows]
+        recipients = {to_email for _pk, to_email, digest in rows if digest}
+        if recipients:
+            waiting = OutboundEmail.objects.filter(
+                status='pending', digest=True, attempts=0, to_email__in=recipients
+            ).exclude(pk__in=pks)
+            if db_connection.features.has_select_for_update_skip_locked:
+                waiting = waiting.select_for_update(skip_locked=True)
+            pks += list(waiting.values_list('pk', flat=True))
+        OutboundEmail.objects.filter(pk__in=pks).update(status='sending', next_attempt_at=lease_until)
+
+    return list(OutboundEmail.objects.filter(pk__in=pks).order_by('created_at', 'id'))
+
+
+def _digest_message(emails):
+    if len(emails) == 1:
+        email = emails[0]
+        return EmailMessage(subject=email.subject, body=email.body, to=[email.to_email])
+    sections = [f"== {email.subject} ==\n{email.body}" for email in emails]
+    return EmailMessage(
+        subject=f"{len(emails)} ta yangi bildirishnoma",
+        body='\n\n'.join(sections),
+        to=[emails[0].to_email],
+    )
+
+
+def compose(emails):
+    """[(EmailMessage, [OutboundEmail, ...])] - digest xatlar qabul qiluvchi bo'yicha bitta xatda."""
+    messages, digests = [], OrderedDict()
+    for email in emails:
+        if email.digest:
+            digests.setdefault(email.to_email.lower(), []).append(email)
+        else:
+            messages.append((EmailMessage(subject=email.subject, body=email.body, to=[email.to_email]), [email]))
+    messages += [(_digest_message(group), group) for group in digests.values()]
+    return messages
+
+
+def _failed(emails, error, now):
+    max_attempts = _setting('OUTBOX_MAX_ATTEMPTS', 8)
+    for email in emails:
+        attempts = email.attempts + 1
+        if attempts >= max_attempts:
+            changes = {'status': 'failed'}
+        else:
+            changes = {'status': 'pending', 'next_attempt_at': now + timedelta(seconds=retry_delay(attempts))}
+        OutboundEmail.objects.filter(pk=email.pk).update(attempts=attempts, last_error=error[:1000], **changes)
+
+
+def send_batch(batch_size=None, connection=None, now=None):
+    """Bitta paketni yuboradi. (olingan xatlar, yuborilgan EmailMessage'lar, xatolar) soni."""
+    now = now or timezone.now()
+    emails = claim(batch_size, now)
+    if not emails:
+        return 0, 0, 0
+
+    sent_ids, sent, errors = [], 0, 0
+    connection = connection or get_connection()
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning("Email connection failed: %s", exc)
+        _failed(emails, f"{type(exc).__name__}: {exc}", now)
+        return len(emails), 0, len(emails)
+
+    try:
+        for message, group in compose(emails):
+            try:
+                # Ulanish ochiq - send_messages uni yopmaydi, keyingi xatlar shu ulanishdan ketadi
+                delivered = connection.send_messages([message])
+                if not delivered:
+                    raise RuntimeError("backend xatni qabul qilmadi")
+            except Exception as exc:
+                logger.warning("Outbound email to %s failed: %s", message.to, exc)
+                _failed(group, f"{type(exc).__name__}: {exc}", now)
+                errors += 1
+                # Uzilgan SMTP sessiyasi keyingi xatlarga ta'sir qilmasin
+                connection.close()
+                try:
+                    connection.open()
+                except Exception:
+                    pass
+            else:
+                sent_ids += [email.pk for email in group]
+                sent += 1
+    finally:
+        connection.close()
+
+    OutboundEmail.objects.filter(pk__in=sent_ids).update(status='sent', sent_at=timezone.now(), last_error='')
+    return len(emails), sent, errors
+
+
+def send_pending(batch_size=None, connection=None, max_batches=None):
+    """Muddati kelgan xatlar tugaguncha paketlab yuboradi. (yuborilgan, xatolar) soni."""
+    sent = errors = batches = 0
+    while max_batches is None or batches < max_batches:
+        claimed, batch_sent, batch_errors = send_batch(batch_size, connection)
+        if not claimed:
+            break
+        sent += batch_sent
+        errors += batch_errors
+        batches += 1
+    return sent, errors
+
+
+def schedule_delivery(delay=0):
+    taskqueue.enqueue(deliver, delay=max(delay, 0), unique_key='outbox.deliver')
+
+
+@taskqueue.task(priority=10)
+def deliver():
+    """Fon vazifasi: muddati kelgan xatlarni yuboradi va keyingi urinishga o'zini rejalashtiradi."""
+    send_pending()
+    next_at = OutboundEmail.objects.filter(status__in=('pending', 'sending')).aggregate(
+        next_at=Min('next_attempt_at')
+    )['next_at']
+    if next_at is not None:
+        schedule_delivery((next_at - timezone.now()).total_seconds())
+
+
+def purge(now=None):
+    """OUTBOX_KEEP_DAYS kundan eski yuborilgan va xato bergan xatlarni o'chiradi."""
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=_setting('OUTBOX_KEEP_DAYS', 30))
+    deleted, _details = OutboundEmail.objects.filter(
+        Q(status='sent', sent_at__lt=cutoff) | Q(status='failed', created_at__lt=cutoff)
+    ).delete()
+    return deleted
@@ -0,0 +1,90 @@
+"""
+Versioned page and object caching for the public job pages.
+
+Barcha kalitlar umumiy versiya raqamini o'z ichiga oladi. Job, EmployerJob,
+Company, CompanyProfile yoki Department saqlansa/o'chirilsa versiya oshiriladi
+(hr_bolim.signals, tranzaksiya commit bo'lgandan keyin) - eski yozuvlar
+o'chirilmaydi, shunchaki boshqa o'qilmaydi va TTL bilan chiqib ketadi.
+
+- ``cache_anonymous_page`` - anonim GET javobini to'liq keshlaydi (CSRF token
+  yoki cookie ishlatgan javoblar keshlanmaydi).
+- ``get_or_set`` - foydalanuvchiga bog'liq bo'lmagan ma'lumotlar (ro'yxat
+  konteksti, vakansiya obyekti) uchun.
+"""
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+VERSION_KEY = 'pagecache:version'
+
+
+def _timeout():
+    return getattr(settings, 'PAGE_CACHE_TIMEOUT', 300)
+
+
+def invalidate():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, None)
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(VERSION_KEY, version, None)
+    return version
+
+
+def make_key(name, *parts):
+    digest = hashlib.md5('\x00'.join(str(part) for part in parts).encode()).hexdigest()
+    return f"pagecache:{_version()}:{name}:{digest}"
+
+
+def get_or_set(name, parts, build):
+    key = make_key(name, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, _timeout())
+    return value
+
+
+def cache_anonymous_page(name, key_func=None):
+    """Anonim foydalanuvchilar uchun GET javobini keshlaydi.
+
+    ``key_func(request)`` - qo'shimcha kalit qismlari (masalan normalize
+    qilingan filtrlar); berilmasa to'liq URL ishlatiladi.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET' or request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+
+            parts = key_func(request) if key_func else (request.get_full_path(),)
+            key = make_key(name, *parts)
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view(request, *args, **kwargs)
+            cacheable = (
+                response.status_code == 200 and
+                not response.streaming and
+                not response.cookies and
+                # get_token() chaqirilgan - sahifada shu mijozning CSRF tokeni bor
+                not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+            )
+            if cacheable:
+                if hasattr(response, 'render'):
+                    response.render()
+                cache.set(key, (response.content, response['Content-Type']), _timeout())
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,136 @@
+"""
+Real-time push for chat messages (Server-Sent Events over ASGI).
+
+Har bir foydalanuvchining o'z kanali bor (``user:<id>``). Yangi Message va
+o'qildi belgilari (read receipt) broker orqali shu kanallarga yuboriladi,
+``realtime_events`` view esa ularni SSE oqimi sifatida uzatadi.
+
+Broker almashtiriladigan: ``REALTIME_BROKER`` sozlamasi BaseBroker
+subclass'iga yo'l. Standart InProcessBroker faqat bitta jarayon ichida
+ishlaydi (development va testlar uchun); bir nechta worker bo'lsa, tashqi
+pub/sub ustida BaseBroker implementatsiyasi kerak.
+"""
+import asyncio
+import json
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+DEFAULT_BROKER = 'hr_bolim.realtime.InProcessBroker'
+QUEUE_SIZE = 100
+
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+
+class Subscription:
+    """Bitta obunachining navbati; async iterator sifatida o'qiladi."""
+
+    def __init__(self, broker, channel):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    def deliver(self, event):
+        # Har qanday thread'dan chaqirilishi mumkin
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Sekin mijoz: eng eski hodisa tashlab yuboriladi
+            self.queue.get_nowait()
+            self.queue.put_nowait(event)
+
+    async def get(self, timeout=None):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class BaseBroker:
+
+    def publish(self, channel, event):
+        raise NotImplementedError
+
+    def subscribe(self, channel):
+        """Event loop ichida chaqiriladi, Subscription qaytaradi."""
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError
+
+
+class InProcessBroker(BaseBroker):
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, channel, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.deliver(event)
+            except RuntimeError:
+                # Event loop yopilgan - obunachi allaqachon uzilgan
+                self.unsubscribe(subscription)
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(getattr(settings, 'REALTIME_BROKER', DEFAULT_BROKER))()
+    return _broker
+
+
+# ----------------------------------------------------------------
+# Events
+# ----------------------------------------------------------------
+
+def publish_message(payload):
+    """Yangi xabar ikkala ishtirokchiga ham yuboriladi (boshqa tab'lar uchun)."""
+    event = {'type': 'message', 'message': payload}
+    broker = get_broker()
+    broker.publish(user_channel(payload['recipient_id']), event)
+    if payload['sender_id'] != payload['recipient_id']:
+        broker.publish(user_channel(payload['sender_id']), event)
+
+
+def publish_read(reader_id, sender_id, up_to_id):
+    """Xabar yuboruvchiga: ``reader_id`` uning ``up_to_id`` gacha xabarlarini o'qidi."""
+    get_broker().publish(user_channel(sender_id), {
+        'type': 'read',
+        'reader_id': reader_id,
+        'up_to_id': up_to_id,
+    })
+
+
+def format_sse(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
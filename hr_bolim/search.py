@@ -0,0 +1,223 @@
+"""
+Full-text search index for vacancies.
+
+Har bir indeks alohida jadvalda saqlanadi va qatorning id'si manba modelning
+pk'siga teng:
+
+- SQLite: FTS5 virtual table, natijalar bm25() bo'yicha tartiblanadi.
+- PostgreSQL: tsvector ustun + GIN indeks, natijalar ts_rank_cd() bo'yicha.
+
+Vakansiya indekslariga faqat ochiq (Job.status='open') va faol
+(EmployerJob.status='active') vakansiyalar yoziladi: qidiruv LIMIT'i
+SEARCH_RESULT_LIMIT yopiq vakansiyalar bilan to'lib, ochiq mos natijalar
+(va facet sonlari) tushib qolmasin. Vakansiya yopilganda indeksdan olinadi.
+
+Matn indeksga yozilishidan oldin va qidiruv so'rovi ham bir xil normalize
+qilinadi: kirill yozuvidagi o'zbekcha matn lotinchaga o'giriladi, apostroflar
+(o‘, g‘, ʼ ...) olib tashlanadi. Shuning uchun "дастурчи" so'rovi "dasturchi"
+matnini topadi.
+"""
+import re
+import unicodedata
+
+from django.conf import settings
+from django.db import connection as default_connection
+
+
+CYRILLIC_TO_LATIN = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'ғ': 'g', 'д': 'd', 'е': 'e',
+    'ё': 'yo', 'ж': 'j', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'қ': 'q',
+    'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's',
+    'т': 't', 'у': 'u', 'ў': 'o', 'ф': 'f', 'х': 'x', 'ҳ': 'h', 'ц': 'ts',
+    'ч': 'ch', 'ш': 'sh', 'щ': 'sh', 'ъ': '', 'ы': 'i', 'ь': '', 'э': 'e',
+    'ю': 'yu', 'я': 'ya',
+}
+
+# o‘, g‘ va tutuq belgisining barcha ko'rinishlari
+APOSTROPHES = "'`‘’ʻʼ′"
+
+TOKEN_RE = re.compile(r'[0-9a-z]+')
+
+# Indeksga kiritilmaydigan juda qisqa tokenlar (prefix qidiruvni buzadi)
+MIN_TOKEN_LENGTH = 2
+
+
+def normalize_text(text):
+    """Matnni lotin yozuvidagi, kichik harfli, apostrofsiz ko'rinishga keltiradi."""
+    if not text:
+        return ''
+    text = text.lower()
+    # "е" so'z boshida "ye" deb o'qiladi (ер -> yer)
+    text = re.sub(r'(^|[^\w])е', r'\1ye', text)
+    text = ''.join(CYRILLIC_TO_LATIN.get(ch, ch) for ch in text)
+    for ch in APOSTROPHES:
+        text = text.replace(ch, '')
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(normalize_text(text)) if len(t) >= MIN_TOKEN_LENGTH]
+
+
+class SearchIndex:
+    """Bitta modelga tegishli full-text indeks.
+
+    ``fields`` - instance'dan (title, body) juftligini qaytaruvchi funksiya;
+    ``include`` - False qaytarsa instance indeksda bo'lmaydi (yopiq vakansiya).
+    Yozuvchi metodlar ``connection`` oladi - migratsiyalarda
+    ``schema_editor.connection`` uzatiladi.
+    """
+
+    def __init__(self, table, fields, include=None):
+        self.table = table
+        self.fields = fields
+        self.include = include
+
+    # -- schema ---------------------------------------------------------
+
+    def create(self, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'sqlite':
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                f"title, body, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+        elif vendor == 'postgresql':
+            schema_editor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                f"id bigint PRIMARY KEY, title text NOT NULL, body text NOT NULL, "
+                f"document tsvector NOT NULL)"
+            )
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_document_gin "
+                f"ON {self.table} USING gin (document)"
+            )
+
+    def drop(self, schema_editor):
+        if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+            schema_editor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    @property
+    def supported(self):
+        return default_connection.vendor in ('sqlite', 'postgresql')
+
+    # -- writes ---------------------------------------------------------
+
+    def update(self, instance, connection=None):
+        connection = connection or default_connection
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            return
+        if self.include is not None and not self.include(instance):
+            self.remove(instance.pk, connection)
+            return
+        title, body = self.fields(instance)
+        title, body = normalize_text(title), normalize_text(body)
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [instance.pk])
+                cursor.execute(
+                    f"INSERT INTO {self.table} (rowid, title, body) VALUES (%s, %s, %s)",
+                    [instance.pk, title, body],
+                )
+            else:
+                cursor.execute(
+                    f"INSERT INTO {self.table} (id, title, body, document) VALUES "
+                    f"(%s, %s, %s, setweight(to_tsvector('simple', %s), 'A') || "
+                    f"setweight(to_tsvector('simple', %s), 'B')) "
+                    f"ON CONFLICT (id) DO UPDATE SET title = EXCLUDED.title, "
+                    f"body = EXCLUDED.body, document = EXCLUDED.document",
+                    [instance.pk, title, body, title, body],
+                )
+
+    def remove(self, pk, connection=None):
+        connection = connection or default_connection
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            return
+        column = 'rowid' if connection.vendor == 'sqlite' else 'id'
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE {column} = %s", [pk])
+
+    def rebuild(self, queryset, connection=None):
+        connection = connection or default_connection
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+        count = 0
+        for instance in queryset.iterator(chunk_size=500):
+            if self.include is None or self.include(instance):
+                self.update(instance, connection)
+                count += 1
+        return count
+
+    def sync_queryset(self, queryset):
+        """queryset.update() signal yubormaydi - admin action'lardan keyin chaqiriladi."""
+        for instance in queryset.iterator(chunk_size=500):
+            self.update(instance)
+
+    # -- reads ----------------------------------------------------------
+
+    def search(self, query, limit=None):
+        """``[(pk, score), ...]`` ro'yxatini eng mosidan boshlab qaytaradi.
+
+        Backend qo'llab-quvvatlanmasa ``None`` qaytadi - chaqiruvchi oddiy
+        icontains filtriga qaytishi kerak.
+        """
+        if not self.supported:
+            return None
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        limit = limit or getattr(settings, 'SEARCH_RESULT_LIMIT', 500)
+        with default_connection.cursor() as cursor:
+            if default_connection.vendor == 'sqlite':
+                # Har bir token prefix sifatida: "dastur" -> dasturchi, dasturlash
+                match = ' '.join(f'"{t}"*' for t in tokens)
+                # bm25() manfiy qiymat qaytaradi: qanchalik kichik bo'lsa, shuncha mos
+                cursor.execute(
+                    f"SELECT rowid, -bm25({self.table}, 10.0, 1.0) AS score FROM {self.table} "
+                    f"WHERE {self.table} MATCH %s ORDER BY bm25({self.table}, 10.0, 1.0) LIMIT %s",
+                    [match, limit],
+                )
+            else:
+                tsquery = ' & '.join(f'{t}:*' for t in tokens)
+                cursor.execute(
+                    f"SELECT id, ts_rank_cd(document, q) AS score "
+                    f"FROM {self.table}, to_tsquery('simple', %s) q "
+                    f"WHERE document @@ q ORDER BY score DESC LIMIT %s",
+                    [tsquery, limit],
+                )
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+
+def _job_fields(job):
+    department = job.department.name if job.department_id else ''
+    return job.title, ' '.join([job.description or '', department])
+
+
+def _employer_job_fields(job):
+    return job.title, ' '.join([job.requirements or '', job.responsibilities or ''])
+
+
+def _candidate_fields(profile):
+    # user.experiences / user.educations prefetch qilingan bo'lishi kerak (hr_bolim.talent)
+    experiences = list(profile.user.experiences.all())
+    educations = list(profile.user.educations.all())
+    title = ' '.join([profile.profession or '', profile.skills or ''] + [e.position for e in experiences])
+    body = ' '.join(
+        [profile.location or '']
+        + [e.company for e in experiences]
+        + [f"{e.degree} {e.field_of_study or ''}" for e in educations]
+    )
+    return title, body
+
+
+# feed.entry_values bilan bir xil shart: lentada yo'q vakansiya indeksda ham yo'q
+job_index = SearchIndex('hr_bolim_job_fts', _job_fields, include=lambda job: job.status == 'open')
+employer_job_index = SearchIndex(
+    'hr_bolim_employerjob_fts', _employer_job_fields, include=lambda job: job.status == 'active',
+)
+candidate_index = SearchIndex('hr_bolim_candidate_fts', _candidate_fields)
+
+INDEXES = [job_index, employer_job_index, candidate_index]
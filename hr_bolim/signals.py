@@ -1,24 +1,31 @@
 from django.contrib.auth.signals import user_logged_in, user_login_failed
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
-from .models import AuditLog, User
+from django.utils import timezone
+from .models import (
+    User, Department, Job, EmployerJob, JobFeedEntry, Message, Conversation, CandidateApplication,
+    Interview, Company, CompanyProfile, CandidateProfile, Experience, Education, Resume, SavedSearch,
+)
+from .search import job_index, employer_job_index
+from . import feed, facets, chat, realtime, stats, pagecache, db, audit, matching, talent, alerts, notifications
 
+@receiver(connection_created)
+def tune_database_connection(sender, connection, **kwargs):
+    if connection.vendor == 'sqlite':
+        db.apply_sqlite_pragmas(connection)
+
+# Audit yozuvlari navbat orqali partiyalab yoziladi (hr_bolim.audit)
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
-    ip = request.META.get('REMOTE_ADDR')
-    AuditLog.objects.create(
-        user=user,
-        action="Login",
-        ip_address=ip
-    )
+    ip = request.META.get('REMOTE_ADDR') if request is not None else None
+    audit.log("Login", user=user, ip_address=ip)
 
 @receiver(user_login_failed)
-def log_user_login_failed(sender, credentials, request, **kwargs):
-    ip = request.META.get('REMOTE_ADDR')
-    AuditLog.objects.create(
-        action=f"Login Failed: {credentials.get('username')}",
-        ip_address=ip
-    )
+def log_user_login_failed(sender, credentials, request=None, **kwargs):
+    ip = request.META.get('REMOTE_ADDR') if request is not None else None
+    audit.log(f"Login Failed: {credentials.get('username')}", ip_address=ip)
 
 @receiver(post_save, sender=User)
 def set_admin_permissions(sender, instance, created, **kwargs):
@@ -27,3 +34,258 @@ def set_admin_permissions(sender, instance, created, **kwargs):
         instance.is_staff = True
         instance.is_superuser = True
         instance.save(update_fields=['is_staff', 'is_superuser'])
+
+
+# ----------------------------------------------------------------
+# Full-text search index
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, **kwargs):
+    job_index.update(instance)
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    job_index.remove(instance.pk)
+
+
+@receiver(post_save, sender=EmployerJob)
+def index_employer_job(sender, instance, **kwargs):
+    employer_job_index.update(instance)
+
+
+@receiver(post_delete, sender=EmployerJob)
+def unindex_employer_job(sender, instance, **kwargs):
+    employer_job_index.remove(instance.pk)
+
+
+@receiver(post_save, sender=Department)
+def reindex_department_jobs(sender, instance, created, **kwargs):
+    """Bo'lim nomi Job hujjatining bir qismi, shuning uchun qayta indekslanadi"""
+    if created:
+        return
+    for job in Job.objects.filter(department=instance).select_related('department'):
+        job_index.update(job)
+
+
+# ----------------------------------------------------------------
+# Talent search index
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=CandidateProfile)
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+@receiver(post_save, sender=Resume)
+@receiver(post_delete, sender=Resume)
+def index_candidate(sender, instance, raw=False, **kwargs):
+    """Profil hujjati yoki ko'rinishi (ochiq rezyume) o'zgardi"""
+    if not raw:
+        talent.sync_user(instance.user_id)
+
+
+@receiver(post_delete, sender=CandidateProfile)
+def unindex_candidate(sender, instance, **kwargs):
+    talent.remove(instance.pk)
+
+
+# ----------------------------------------------------------------
+# Unified job feed
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=Job)
+def sync_job_feed(sender, instance, **kwargs):
+    feed.sync_job('job', instance)
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_feed(sender, instance, **kwargs):
+    feed.remove_job('job', instance.pk)
+
+
+@receiver(post_save, sender=EmployerJob)
+def sync_employer_job_feed(sender, instance, **kwargs):
+    feed.sync_job('employer_job', instance)
+
+
+@receiver(post_delete, sender=EmployerJob)
+def remove_employer_job_feed(sender, instance, **kwargs):
+    feed.remove_job('employer_job', instance.pk)
+
+
+@receiver(post_save, sender=JobFeedEntry)
+@receiver(post_delete, sender=JobFeedEntry)
+def invalidate_job_facets(sender, **kwargs):
+    facets.invalidate()
+
+
+# ----------------------------------------------------------------
+# Candidate-job matching
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=EmployerJob)
+@receiver(post_delete, sender=EmployerJob)
+def sync_job_skill_vector(sender, instance, raw=False, **kwargs):
+    if not raw:
+        matching.schedule_job(instance.pk)
+
+
+@receiver(post_save, sender=CandidateProfile)
+@receiver(post_delete, sender=CandidateProfile)
+def sync_candidate_skill_vector(sender, instance, raw=False, **kwargs):
+    if not raw:
+        matching.schedule_candidate(instance.pk)
+
+
+# ----------------------------------------------------------------
+# Saved-search alerts
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=SavedSearch)
+def index_saved_search(sender, instance, raw=False, **kwargs):
+    if not raw:
+        alerts.index_search(instance)
+
+
+@receiver(post_save, sender=EmployerJob)
+def match_saved_searches(sender, instance, raw=False, **kwargs):
+    """Faol holatga o'tgan vakansiya saqlangan qidiruvlar bilan solishtiriladi"""
+    if not raw:
+        alerts.job_saved(instance, instance._previous_status)
+
+
+# ----------------------------------------------------------------
+# Page cache
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=EmployerJob)
+@receiver(post_delete, sender=EmployerJob)
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(post_save, sender=CompanyProfile)
+@receiver(post_delete, sender=CompanyProfile)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_page_cache(sender, **kwargs):
+    # Commit'dan keyin: aks holda parallel so'rov eski ma'lumotni yangi versiya ostida keshlab qo'yishi mumkin
+    transaction.on_commit(pagecache.invalidate)
+
+
+# ----------------------------------------------------------------
+# Messaging
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=Message)
+def update_conversation(sender, instance, created, **kwargs):
+    if created:
+        Conversation.record_message(instance)
+        payload = chat.serialize(instance)
+        transaction.on_commit(lambda: realtime.publish_message(payload))
+
+
+# ----------------------------------------------------------------
+# Company statistics rollups
+# ----------------------------------------------------------------
+
+@receiver(pre_save, sender=EmployerJob)
+def remember_previous_status(sender, instance, raw=False, **kwargs):
+    """post_save holat o'zgarganini bilishi uchun bazadagi eski qiymat"""
+    if raw or instance._state.adding:
+        instance._previous_status = None
+    else:
+        instance._previous_status = (
+            sender.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+        )
+
+
+@receiver(pre_save, sender=CandidateApplication)
+def remember_previous_application_status(sender, instance, raw=False, **kwargs):
+    """Eski holat va hired_at; hired_at faqat 'accepted'ga o'tishda qo'yiladi,
+    keyingi tahrirlar (masalan internal_notes) uni o'zgartirmaydi."""
+    if raw or instance._state.adding:
+        instance._previous_status = instance._previous_hired_at = None
+    else:
+        instance._previous_status, instance._previous_hired_at = (
+            sender.objects.filter(pk=instance.pk).values_list('status', 'hired_at').first() or (None, None)
+        )
+    if raw:
+        return
+    if instance.status != 'accepted':
+        instance.hired_at = None
+    elif instance._previous_status != 'accepted' or instance._previous_hired_at is None:
+        instance.hired_at = timezone.now()
+    else:
+        instance.hired_at = instance._previous_hired_at
+
+
+@receiver(post_save, sender=EmployerJob)
+def update_job_stats(sender, instance, raw=False, **kwargs):
+    if not raw:
+        stats.job_saved(instance, instance._previous_status)
+
+
+@receiver(post_delete, sender=EmployerJob)
+def remove_job_stats(sender, instance, **kwargs):
+    stats.job_deleted(instance)
+
+
+@receiver(post_save, sender=CandidateApplication)
+def update_application_stats(sender, instance, raw=False, **kwargs):
+    if not raw:
+        stats.application_saved(instance, instance._previous_status, instance._previous_hired_at)
+
+
+@receiver(post_delete, sender=CandidateApplication)
+def remove_application_stats(sender, instance, **kwargs):
+    stats.application_deleted(instance)
+
+
+@receiver(pre_save, sender=Interview)
+def remember_previous_schedule(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._previous_scheduled_date = None
+    else:
+        instance._previous_scheduled_date = (
+            sender.objects.filter(pk=instance.pk).values_list('scheduled_date', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Interview)
+def update_interview_stats(sender, instance, raw=False, **kwargs):
+    if not raw:
+        stats.interview_saved(instance, instance._previous_scheduled_date)
+
+
+@receiver(post_delete, sender=Interview)
+def remove_interview_stats(sender, instance, **kwargs):
+    stats.interview_deleted(instance)
+
+
+# ----------------------------------------------------------------
+# Email notifications (outbox - biznes o'zgarishi bilan bitta tranzaksiyada)
+# ----------------------------------------------------------------
+
+@receiver(post_save, sender=Interview)
+def notify_interview(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        notifications.interview_scheduled(instance)
+    elif instance._previous_scheduled_date not in (None, instance.scheduled_date):
+        notifications.interview_scheduled(instance, rescheduled=True)
+
+
+@receiver(post_save, sender=CandidateApplication)
+def notify_application_status(sender, instance, raw=False, **kwargs):
+    if not raw:
+        notifications.application_status_changed(instance, instance._previous_status)
+
+
+@receiver(post_save, sender=Message)
+def notify_message(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        notifications.message_received(instance)
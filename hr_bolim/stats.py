@@ -0,0 +1,362 @@
+"""
+Company statistics rollups.
+
+Dashboard sahifalari EmployerJob va CandidateApplication jadvallarini har
+safar sanamaydi: CompanyStats (umumiy), CompanyStatsDaily va JobStatsDaily
+(kunlik) qatorlari signallar orqali F() + n ko'rinishida o'zgartiriladi.
+Ko'rishlar JobStatsDaily'ga hr_bolim.counters buferi yozilganda tushadi. CompanyProfile
+total_jobs_posted / total_applications va EmployerJob.application_count ham
+shu yerda yuritiladi.
+
+queryset.update() signal yubormaydi - bunday joylardan keyin rebuild()
+chaqirilishi kerak (admin action'lar kabi).
+"""
+from django.apps import apps as global_apps
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest, TruncDate
+from django.utils import timezone
+
+from .models import CandidateApplication, CompanyProfile, CompanyStats, CompanyStatsDaily, EmployerJob, JobStatsDaily
+
+
+def _decrement(field, n=1):
+    # PositiveIntegerField: eskirgan qiymat 0 dan pastga tushmasin
+    return Greatest(F(field) - n, 0)
+
+
+def _increments(deltas):
+    return {field: F(field) + n if n > 0 else _decrement(field, -n) for field, n in deltas.items() if n}
+
+
+def bump(model, lookup, defaults=None, **deltas):
+    """``lookup`` qatorini F() + delta bilan yangilaydi; qator yo'q bo'lsa yaratadi.
+
+    Ayirishda qator yaratilmaydi (masalan kaskad o'chirishda qator allaqachon yo'q).
+    """
+    updates = _increments(deltas)
+    if not updates or model.objects.filter(**lookup).update(**updates):
+        return
+    if any(n < 0 for n in deltas.values()):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **(defaults or {}), **deltas)
+    except IntegrityError:
+        # Parallel so'rov qatorni allaqachon yaratgan
+        model.objects.filter(**lookup).update(**updates)
+
+
+def bump_company(company_id, **deltas):
+    """CompanyStats qatorini yangilaydi. Qator yo'q bo'lsa rebuild_totals() qiladi
+    va False qaytaradi - bog'liq hisoblagichlarni alohida oshirish kerak emas.
+    """
+    updates = _increments(deltas)
+    if not updates or CompanyStats.objects.filter(company_id=company_id).update(**updates):
+        return True
+    # Signal jadval yangilangandan keyin keladi, shuning uchun noldan hisoblash
+    # joriy o'zgarishni ham o'z ichiga oladi. Faqat ayirish bo'lsa (masalan
+    # kompaniya kaskad o'chirilayotganda) qator yaratilmaydi.
+    if any(n > 0 for n in deltas.values()):
+        rebuild_totals([company_id])
+        return False
+    return True
+
+
+def bump_daily(company_id, date=None, **deltas):
+    bump(CompanyStatsDaily, {'company_id': company_id, 'date': date or timezone.localdate()}, **deltas)
+
+
+def bump_job_daily(job_id, company_id, date=None, **deltas):
+    lookup = {'job_id': job_id, 'date': date or timezone.localdate()}
+    bump(JobStatsDaily, lookup, defaults={'company_id': company_id}, **deltas)
+
+
+def record_job_views(pks, n):
+    """counters.job_views buferi yozilganda: bugungi ko'rishlar soniga n qo'shiladi."""
+    today = timezone.localdate()
+    jobs = dict(EmployerJob.objects.filter(pk__in=pks).values_list('pk', 'company_id'))
+    if not jobs:
+        return
+    JobStatsDaily.objects.bulk_create(
+        [JobStatsDaily(job_id=pk, company_id=company_id, date=today) for pk, company_id in jobs.items()],
+        ignore_conflicts=True,
+    )
+    JobStatsDaily.objects.filter(job_id__in=list(jobs), date=today).update(views=F('views') + n)
+
+
+def for_company(company):
+    try:
+        return CompanyStats.objects.get(company=company)
+    except CompanyStats.DoesNotExist:
+        rebuild_totals([company.pk])
+        return CompanyStats.objects.get(company=company)
+
+
+# ----------------------------------------------------------------
+# Signal handlers (hr_bolim.signals dan chaqiriladi)
+# ----------------------------------------------------------------
+
+def job_saved(job, previous_status):
+    was_active = previous_status == 'active'
+    is_active = job.status == 'active'
+    if previous_status is None:
+        bump_daily(job.company_id, jobs_posted=1)
+        if bump_company(job.company_id, jobs_total=1, jobs_active=int(is_active)):
+            CompanyProfile.objects.filter(company_id=job.company_id).update(
+                total_jobs_posted=F('total_jobs_posted') + 1
+            )
+    elif was_active != is_active:
+        bump_company(job.company_id, jobs_active=1 if is_active else -1)
+
+
+def job_deleted(job):
+    bump_company(job.company_id, jobs_total=-1, jobs_active=-int(job.status == 'active'))
+    bump_daily(job.company_id, timezone.localdate(job.created_at), jobs_posted=-1)
+    CompanyProfile.objects.filter(company_id=job.company_id).update(
+        total_jobs_posted=_decrement('total_jobs_posted')
+    )
+
+
+def _company_id(application):
+    return EmployerJob.objects.filter(pk=application.job_id).values_list('company_id', flat=True).first()
+
+
+def _hire_seconds(application, hired_at):
+    # Yangi ariza darhol qabul qilinsa hired_at applied_at'dan biroz oldin qo'yilgan bo'ladi
+    return max(int((hired_at - application.applied_at).total_seconds()), 0)
+
+
+def _unhire(application, company_id, hired_at):
+    """Qabul qilingan ariza o'chirildi yoki holati o'zgardi: ishga olingan kundan ayiriladi."""
+    if hired_at is None:
+        return
+    hired_on = timezone.localdate(hired_at)
+    bump_daily(company_id, hired_on, hires=-1)
+    bump_job_daily(
+        application.job_id, company_id, hired_on,
+        hires=-1, hire_seconds=-_hire_seconds(application, hired_at),
+    )
+
+
+def application_saved(application, previous_status, previous_hired_at=None):
+    if previous_status == application.status:
+        return
+    company_id = _company_id(application)
+    if company_id is None:
+        return
+    status_field = f'applications_{application.status}'
+    hired = int(application.status == 'accepted')
+    hire_seconds = _hire_seconds(application, application.hired_at) if hired else 0
+    if previous_status is None:
+        bump_daily(company_id, applications=1, hires=hired)
+        bump_job_daily(application.job_id, company_id, applications=1, hires=hired, hire_seconds=hire_seconds)
+        if bump_company(company_id, applications_total=1, **{status_field: 1}):
+            CompanyProfile.objects.filter(company_id=company_id).update(
+                total_applications=F('total_applications') + 1
+            )
+            EmployerJob.objects.filter(pk=application.job_id).update(
+                application_count=F('application_count') + 1
+            )
+    else:
+        bump_company(company_id, **{status_field: 1, f'applications_{previous_status}': -1})
+        if previous_status == 'accepted':
+            # accepted -> rejected -> accepted ikki marta hisoblanmasin
+            _unhire(application, company_id, previous_hired_at)
+        if hired:
+            bump_daily(company_id, hires=1)
+            bump_job_daily(application.job_id, company_id, hires=1, hire_seconds=hire_seconds)
+
+
+def application_deleted(application):
+    company_id = _company_id(application)
+    if company_id is None:
+        # Vakansiya bilan birga o'chirilgan: job_deleted() va rebuild yetarli
+        return
+    bump_company(company_id, applications_total=-1, **{f'applications_{application.status}': -1})
+    applied_on = timezone.localdate(application.applied_at)
+    bump_daily(company_id, applied_on, applications=-1)
+    bump_job_daily(application.job_id, company_id, applied_on, applications=-1)
+    if application.status == 'accepted':
+        _unhire(application, company_id, application.hired_at)
+    CompanyProfile.objects.filter(company_id=company_id).update(
+        total_applications=_decrement('total_applications')
+    )
+    EmployerJob.objects.filter(pk=application.job_id).update(
+        application_count=_decrement('application_count')
+    )
+
+
+def _interview_date(interview, scheduled_date=None):
+    return timezone.localdate(scheduled_date or interview.scheduled_date)
+
+
+def interview_saved(interview, previous_date):
+    if previous_date is not None and _interview_date(interview, previous_date) == _interview_date(interview):
+        return
+    row = (
+        CandidateApplication.objects.filter(pk=interview.application_id)
+        .values_list('job_id', 'job__company_id').first()
+    )
+    if row is None:
+        return
+    job_id, company_id = row
+    if previous_date is not None:
+        bump_job_daily(job_id, company_id, _interview_date(interview, previous_date), interviews=-1)
+    bump_job_daily(job_id, company_id, _interview_date(interview), interviews=1)
+
+
+def interview_deleted(interview):
+    JobStatsDaily.objects.filter(
+        job__applications=interview.application_id, date=_interview_date(interview),
+    ).update(interviews=_decrement('interviews'))
+
+
+# ----------------------------------------------------------------
+# Rebuild
+# ----------------------------------------------------------------
+
+def _scoped(queryset, field, company_ids):
+    return queryset if company_ids is None else queryset.filter(**{f'{field}__in': company_ids})
+
+
+def rebuild_totals(company_ids=None, apps=global_apps):
+    """CompanyStats, CompanyProfile jamilari va application_count'ni qayta hisoblaydi.
+
+    ``apps`` migratsiyalarda tarixiy modellar bilan ishlash uchun.
+    """
+    Company = apps.get_model('hr_bolim', 'Company')
+    Stats = apps.get_model('hr_bolim', 'CompanyStats')
+    Profile = apps.get_model('hr_bolim', 'CompanyProfile')
+    Job = apps.get_model('hr_bolim', 'EmployerJob')
+    Application = apps.get_model('hr_bolim', 'CandidateApplication')
+
+    rows = {
+        pk: Stats(company_id=pk)
+        for pk in _scoped(Company.objects.all(), 'pk', company_ids).values_list('pk', flat=True)
+    }
+    jobs = _scoped(Job.objects.all(), 'company_id', company_ids)
+    for row in jobs.order_by().values('company_id', 'status').annotate(n=Count('id')):
+        stats = rows[row['company_id']]
+        stats.jobs_total += row['n']
+        if row['status'] == 'active':
+            stats.jobs_active += row['n']
+    applications = _scoped(Application.objects.all(), 'job__company_id', company_ids)
+    for row in applications.order_by().values('job__company_id', 'status').annotate(n=Count('id')):
+        stats = rows[row['job__company_id']]
+        stats.applications_total += row['n']
+        field = f"applications_{row['status']}"
+        setattr(stats, field, getattr(stats, field) + row['n'])
+
+    per_job = (
+        Application.objects.filter(job=OuterRef('pk')).order_by()
+        .values('job').annotate(n=Count('id')).values('n')
+    )
+    with transaction.atomic():
+        _scoped(Stats.objects.all(), 'company_id', company_ids).delete()
+        Stats.objects.bulk_create(rows.values(), batch_size=500)
+        for stats in rows.values():
+            Profile.objects.filter(company_id=stats.company_id).update(
+                total_jobs_posted=stats.jobs_total, total_applications=stats.applications_total,
+            )
+        jobs.update(application_count=Coalesce(Subquery(per_job), 0))
+    return len(rows)
+
+
+def _hired_field(Application):
+    # hired_at qo'shilishidan oldingi migratsiyalardagi tarixiy model uchun
+    return 'hired_at' if any(field.name == 'hired_at' for field in Application._meta.fields) else 'updated_at'
+
+
+def rebuild_daily(company_ids=None, apps=global_apps):
+    """Kunlik qatorlarni mavjud yozuvlardan qayta tiklaydi.
+
+    O'chirilgan vakansiya/arizalar endi hisobga olinmaydi; ishga olingan sana -
+    arizaning hired_at qiymati.
+    """
+    Daily = apps.get_model('hr_bolim', 'CompanyStatsDaily')
+    Job = apps.get_model('hr_bolim', 'EmployerJob')
+    Application = apps.get_model('hr_bolim', 'CandidateApplication')
+
+    rows = {}
+
+    def add(company_id, date, field, n):
+        key = (company_id, date)
+        if key not in rows:
+            rows[key] = Daily(company_id=company_id, date=date)
+        setattr(rows[key], field, getattr(rows[key], field) + n)
+
+    jobs = _scoped(Job.objects.all(), 'company_id', company_ids)
+    for row in jobs.order_by().annotate(day=TruncDate('created_at')).values('company_id', 'day').annotate(n=Count('id')):
+        add(row['company_id'], row['day'], 'jobs_posted', row['n'])
+    applications = _scoped(Application.objects.all(), 'job__company_id', company_ids).order_by()
+    for row in applications.annotate(day=TruncDate('applied_at')).values('job__company_id', 'day').annotate(n=Count('id')):
+        add(row['job__company_id'], row['day'], 'applications', row['n'])
+    hired_field = _hired_field(Application)
+    hires = applications.filter(status='accepted', **{f'{hired_field}__isnull': False}).annotate(
+        day=TruncDate(hired_field),
+    )
+    for row in hires.values('job__company_id', 'day').annotate(n=Count('id')):
+        add(row['job__company_id'], row['day'], 'hires', row['n'])
+
+    with transaction.atomic():
+        _scoped(Daily.objects.all(), 'company_id', company_ids).delete()
+        Daily.objects.bulk_create(rows.values(), batch_size=500)
+    return len(rows)
+
+
+def rebuild_job_daily(company_ids=None, apps=global_apps):
+    """JobStatsDaily'ni qayta hisoblaydi.
+
+    Ko'rishlar faqat hisoblagich buferidan keladi va qayta tiklab bo'lmaydi,
+    shuning uchun mavjud ``views`` qiymatlari saqlab qolinadi.
+    """
+    Daily = apps.get_model('hr_bolim', 'JobStatsDaily')
+    Application = apps.get_model('hr_bolim', 'CandidateApplication')
+    Interview = apps.get_model('hr_bolim', 'Interview')
+
+    rows = {}
+
+    def row_for(job_id, company_id, date):
+        key = (job_id, date)
+        if key not in rows:
+            rows[key] = Daily(job_id=job_id, company_id=company_id, date=date)
+        return rows[key]
+
+    existing = _scoped(Daily.objects.filter(views__gt=0), 'company_id', company_ids)
+    for job_id, company_id, date, views in existing.values_list('job_id', 'company_id', 'date', 'views'):
+        row_for(job_id, company_id, date).views = views
+
+    applications = _scoped(Application.objects.all(), 'job__company_id', company_ids).order_by()
+    per_day = applications.annotate(day=TruncDate('applied_at')).values('job_id', 'job__company_id', 'day')
+    for row in per_day.annotate(n=Count('id')):
+        row_for(row['job_id'], row['job__company_id'], row['day']).applications += row['n']
+
+    hired_field = _hired_field(Application)
+    hires = applications.filter(status='accepted', **{f'{hired_field}__isnull': False}).values_list(
+        'job_id', 'job__company_id', 'applied_at', hired_field,
+    )
+    for job_id, company_id, applied_at, hired_at in hires.iterator(chunk_size=500):
+        row = row_for(job_id, company_id, timezone.localdate(hired_at))
+        row.hires += 1
+        row.hire_seconds += int((hired_at - applied_at).total_seconds())
+
+    interviews = _scoped(Interview.objects.all(), 'application__job__company_id', company_ids).order_by()
+    per_day = interviews.annotate(day=TruncDate('scheduled_date')).values(
+        'application__job_id', 'application__job__company_id', 'day',
+    )
+    for row in per_day.annotate(n=Count('id')):
+        row_for(row['application__job_id'], row['application__job__company_id'], row['day']).interviews += row['n']
+
+    with transaction.atomic():
+        _scoped(Daily.objects.all(), 'company_id', company_ids).delete()
+        Daily.objects.bulk_create(rows.values(), batch_size=500)
+    return len(rows)
+
+
+def rebuild(company_ids=None, apps=global_apps):
+    return (
+        rebuild_totals(company_ids, apps),
+        rebuild_daily(company_ids, apps),
+        rebuild_job_daily(company_ids, apps),
+    )
@@ -0,0 +1,169 @@
+"""
+Employer talent search over candidate profiles.
+
+Qidiruv hujjati (search.candidate_index, bitta qator = CandidateProfile):
+
+- sarlavha: kasb, ko'nikmalar, tajribadagi lavozimlar;
+- matn: joylashuv, tajribadagi kompaniyalar, ta'lim darajasi va yo'nalishi.
+
+Ish beruvchilarga faqat quyidagi nomzodlar ko'rinadi (``visible()``):
+ishlov berish cheklanmagan, hisobi faol va kamida bitta ochiq
+(Resume.is_public) rezyumesi bor. Shartga mos kelmay qolgan profil
+indeksdan o'chiriladi; so'rov vaqtida ham xuddi shu filtr qo'llanadi.
+
+Natijalar sahifasi so'rovlar soni sahifa hajmiga bog'liq emas: id'lar
+bitta so'rovda, profillar, tajriba, ta'lim va ochiq rezyumelar esa
+prefetch bilan olinadi.
+"""
+import base64
+from datetime import datetime
+
+from django.apps import apps as global_apps
+from django.db.models import Exists, OuterRef, Prefetch, Q
+
+from .models import CandidateProfile, Education, Experience, Resume
+from .search import candidate_index
+
+PAGE_SIZE = 20
+
+
+def visible(queryset=None, apps=global_apps):
+    Profile = apps.get_model('hr_bolim', 'CandidateProfile')
+    PublicResume = apps.get_model('hr_bolim', 'Resume')
+    queryset = Profile.objects.all() if queryset is None else queryset
+    return queryset.filter(
+        Exists(PublicResume.objects.filter(user=OuterRef('user'), is_public=True)),
+        is_processing_restricted=False,
+        user__is_active=True,
+    )
+
+
+def _with_documents(queryset):
+    return queryset.select_related('user').prefetch_related('user__experiences', 'user__educations')
+
+
+def sync_user(user_id):
+    """Foydalanuvchi profilini indeksga yozadi yoki (ko'rinmasa) o'chiradi."""
+    profile_id = CandidateProfile.objects.filter(user_id=user_id).values_list('pk', flat=True).first()
+    if profile_id is None:
+        return
+    profile = _with_documents(visible(CandidateProfile.objects.filter(pk=profile_id))).first()
+    if profile is None:
+        candidate_index.remove(profile_id)
+    else:
+        candidate_index.update(profile)
+
+
+def remove(profile_id):
+    candidate_index.remove(profile_id)
+
+
+def rebuild(apps=global_apps, connection=None):
+    return candidate_index.rebuild(_with_documents(visible(apps=apps)), connection)
+
+
+# ----------------------------------------------------------------
+# Queries
+# ----------------------------------------------------------------
+
+def _int(value):
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def filter_profiles(queryset, location=None, min_experience=None, max_experience=None, degree=None):
+    if location:
+        queryset = queryset.filter(location__icontains=location)
+    min_experience, max_experience = _int(min_experience), _int(max_experience)
+    if min_experience is not None:
+        queryset = queryset.filter(experience_years__gte=min_experience)
+    if max_experience is not None:
+        queryset = queryset.filter(experience_years__lte=max_experience)
+    if degree:
+        queryset = queryset.filter(
+            Exists(Education.objects.filter(user=OuterRef('user'), degree__icontains=degree))
+        )
+    return queryset
+
+
+def _fallback_filter(queryset, query):
+    """Full-text indeks bo'lmagan backend'lar uchun icontains qidiruv."""
+    experience = Experience.objects.filter(
+        Q(position__icontains=query) | Q(company__icontains=query), user=OuterRef('user')
+    )
+    education = Education.objects.filter(
+        Q(degree__icontains=query) | Q(field_of_study__icontains=query), user=OuterRef('user')
+    )
+    return queryset.filter(
+        Q(profession__icontains=query) | Q(skills__icontains=query) | Q(location__icontains=query)
+        | Exists(experience) | Exists(education)
+    )
+
+
+def _encode_cursor(updated_at, pk):
+    return base64.urlsafe_b64encode(f"{updated_at.isoformat()}|{pk}".encode()).decode()
+
+
+def _decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        updated_at, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(updated_at), int(pk)
+    except (ValueError, UnicodeError):
+        return None
+
+
+def _page_ids(queryset, cursor, size):
+    """Qidiruvsiz: yaqinda yangilangan profillar birinchi, keyset cursor bilan."""
+    queryset = queryset.order_by('-updated_at', '-id')
+    position = _decode_cursor(cursor) if cursor else None
+    if position:
+        updated_at, pk = position
+        queryset = queryset.filter(Q(updated_at__lt=updated_at) | Q(updated_at=updated_at, id__lt=pk))
+    rows = list(queryset.values_list('id', 'updated_at')[:size + 1])
+    next_cursor = None
+    if len(rows) > size:
+        pk, updated_at = rows[size - 1]
+        next_cursor = _encode_cursor(updated_at, pk)
+    return [pk for pk, _updated_at in rows[:size]], next_cursor
+
+
+def _ranked_page_ids(queryset, scores, cursor, size):
+    """Qidiruv: bm25 / ts_rank_cd bo'yicha; natijalar SEARCH_RESULT_LIMIT bilan cheklangan."""
+    offset = _int(cursor) or 0
+    ids = list(queryset.filter(pk__in=list(scores)).values_list('id', flat=True))
+    ids.sort(key=lambda pk: (scores[pk], pk), reverse=True)
+    next_cursor = str(offset + size) if len(ids) > offset + size else None
+    return ids[offset:offset + size], next_cursor
+
+
+def hydrate(ids):
+    profiles = CandidateProfile.objects.select_related('user').prefetch_related(
+        Prefetch('user__experiences', queryset=Experience.objects.order_by('-start_date')),
+        Prefetch('user__educations', queryset=Education.objects.order_by('-start_date')),
+        Prefetch('user__resumes', queryset=Resume.objects.filter(is_public=True).order_by('-created_at'),
+                 to_attr='public_resumes'),
+    ).in_bulk(ids)
+    return [profiles[pk] for pk in ids if pk in profiles]
+
+
+def search(params, cursor=None, size=PAGE_SIZE):
+    """(profillar, next_cursor). ``params`` - request.GET."""
+    queryset = filter_profiles(
+        visible(),
+        location=params.get('location'),
+        min_experience=params.get('experience_min'),
+        max_experience=params.get('experience_max'),
+        degree=params.get('degree'),
+    )
+    query = (params.get('q') or '').strip()
+    results = candidate_index.search(query) if query else None
+    if results is not None:
+        ids, next_cursor = _ranked_page_ids(queryset, dict(results), cursor, size)
+    else:
+        if query:
+            queryset = _fallback_filter(queryset, query)
+        ids, next_cursor = _page_ids(queryset, cursor, size)
+    return hydrate(ids), next_cursor
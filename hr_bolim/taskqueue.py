@@ -0,0 +1,288 @@
+"""
+Database-backed background task queue.
+
+Vazifa - ro'yxatdan o'tgan funksiya va JSON kwargs::
+
+    @taskqueue.task(priority=5, max_attempts=5)
+    def match_job(job_id): ...
+
+    taskqueue.enqueue(match_job, job_id=job.pk)
+
+``enqueue()`` Task qatorini joriy tranzaksiyada yozadi (rollback bo'lsa
+vazifa ham yo'qoladi). ``runworker`` buyrug'i vazifalarni band qiladi va
+thread yoki process pool'da bajaradi:
+
+- PostgreSQL: ``SELECT ... FOR UPDATE SKIP LOCKED`` - parallel worker'lar
+  bir-birini kutmaydi;
+- SQLite (va SKIP LOCKED'siz backend'lar): har bir qator uchun
+  compare-and-swap ``UPDATE ... WHERE <hali band qilinmagan>`` - faqat
+  bitta worker yutadi.
+
+Band qilingan vazifaning lease_until'i heartbeat bilan uzaytiriladi;
+worker to'xtab qolsa, lease tugagach vazifa qayta olinadi (bajarilish
+"kamida bir marta" - vazifalar idempotent bo'lishi kerak). Xato bergan
+vazifa TASKS_RETRY_BASE * 2^(urinish-1) soniyadan keyin qayta uriniladi;
+navbatda shu unique_key'li nusxa bo'lsa, u ``superseded`` bo'lib yopiladi.
+
+TASKS_EAGER = True bo'lsa vazifa navbatga qo'yilmaydi, tranzaksiya
+commit bo'lgach shu jarayonda bajariladi (worker'siz ishlab chiqish uchun);
+kechiktirilgan (delay > 0) vazifalar bu rejimda tashlab yuboriladi.
+"""
+import logging
+import time
+import traceback
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Min, Q
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+TaskType = namedtuple('TaskType', 'func priority max_attempts')
+
+REGISTRY = {}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def task(name=None, priority=0, max_attempts=3):
+    """Funksiyani vazifa sifatida ro'yxatga oladi. Nomi standart bo'yicha ``<modul>.<funksiya>``."""
+    def decorator(func):
+        task_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        REGISTRY[task_name] = TaskType(func, priority, max_attempts)
+        func.task_name = task_name
+        return func
+    return decorator
+
+
+def enqueue(func, priority=None, delay=0, unique_key=None, **kwargs):
+    """Vazifani navbatga qo'yadi va Task qatorini qaytaradi.
+
+    ``unique_key`` bilan navbatda shu kalitli vazifa bo'lsa yangisi
+    yaratilmaydi, mavjudi esa kerak bo'lsa oldinroqqa suriladi; bu holda
+    (va TASKS_EAGER'da) None qaytariladi.
+    """
+    name = getattr(func, 'task_name', func)
+    spec = REGISTRY[name]
+    if _setting('TASKS_EAGER', False):
+        if not delay:
+            transaction.on_commit(lambda: spec.func(**kwargs))
+        return None
+
+    scheduled_at = timezone.now() + timedelta(seconds=delay)
+    row = Task(
+        name=name,
+        kwargs=kwargs,
+        priority=spec.priority if priority is None else priority,
+        max_attempts=spec.max_attempts,
+        unique_key=unique_key,
+        scheduled_at=scheduled_at,
+    )
+    if unique_key is None:
+        row.save()
+        return row
+    queued = Task.objects.filter(unique_key=unique_key, status='queued')
+    if not queued.filter(scheduled_at__gt=scheduled_at).update(scheduled_at=scheduled_at) and not queued.exists():
+        # Parallel enqueue: qisman unique indeks ikkinchi qatorni rad etadi
+        Task.objects.bulk_create([row], ignore_conflicts=True)
+    return None
+
+
+def retry_delay(attempts):
+    base = _setting('TASKS_RETRY_BASE', 30)
+    return min(base * 2 ** max(attempts - 1, 0), _setting('TASKS_RETRY_MAX', 3600))
+
+
+# ----------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------
+
+def _claimable(now):
+    return Q(status='queued', scheduled_at__lte=now) | Q(status='running', lease_until__lt=now)
+
+
+def claim(worker, limit, names=None, now=None):
+    """``limit`` tagacha vazifani ``worker`` uchun band qiladi va qaytaradi."""
+    now = now or timezone.now()
+    candidates = Task.objects.filter(_claimable(now)).order_by('-priority', 'scheduled_at', 'id')
+    if names:
+        candidates = candidates.filter(name__in=names)
+    changes = {
+        'status': 'running',
+        'locked_by': worker,
+        'lease_until': now + timedelta(seconds=_setting('TASKS_LEASE_SECONDS', 60)),
+        'heartbeat_at': now,
+        'started_at': now,
+        'attempts': F('attempts') + 1,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            pks = list(candidates.select_for_update(skip_locked=True).values_list('pk', flat=True)[:limit])
+            Task.objects.filter(pk__in=pks).update(**changes)
+    else:
+        pks = [
+            pk for pk in candidates.values_list('pk', flat=True)[:limit]
+            # Boshqa worker oldinroq band qilgan bo'lsa shart bajarilmaydi - 0 qator
+            if Task.objects.filter(_claimable(now), pk=pk).update(**changes)
+        ]
+    if not pks:
+        return []
+    return list(Task.objects.filter(pk__in=pks, locked_by=worker).order_by('-priority', 'scheduled_at', 'id'))
+
+
+def heartbeat(worker, pks):
+    """Bajarilayotgan vazifalarning lease'ini uzaytiradi."""
+    if not pks:
+        return 0
+    now = timezone.now()
+    return Task.objects.filter(pk__in=pks, locked_by=worker, status='running').update(
+        heartbeat_at=now, lease_until=now + timedelta(seconds=_setting('TASKS_LEASE_SECONDS', 60)),
+    )
+
+
+def _requeue(queryset, unique_key, scheduled_at, **changes):
+    """Vazifani qayta navbatga qo'yadi. Shu unique_key bilan boshqa nusxa
+    navbatda bo'lsa (vazifa bajarilayotganda enqueue qilingan) - bu qator
+    ``superseded`` bo'ladi, nusxa esa kerak bo'lsa oldinroqqa suriladi.
+    True - qayta navbatga qo'yildi."""
+    try:
+        with transaction.atomic():
+            return bool(queryset.update(status='queued', scheduled_at=scheduled_at, lease_until=None, **changes))
+    except IntegrityError:
+        pass
+    Task.objects.filter(unique_key=unique_key, status='queued', scheduled_at__gt=scheduled_at).update(
+        scheduled_at=scheduled_at,
+    )
+    queryset.update(status='superseded', finished_at=timezone.now(), lease_until=None, **changes)
+    return False
+
+
+def _finish(task_row, worker, error=None):
+    now = timezone.now()
+    mine = Task.objects.filter(pk=task_row.pk, locked_by=worker, status='running')
+    if error is None:
+        mine.update(status='done', finished_at=now, lease_until=None, last_error='')
+    elif task_row.attempts >= task_row.max_attempts:
+        mine.update(status='failed', finished_at=now, lease_until=None, last_error=error)
+    else:
+        _requeue(mine, task_row.unique_key, now + timedelta(seconds=retry_delay(task_row.attempts)),
+                 last_error=error)
+
+
+def retry(task_row):
+    """Xato bergan vazifani darhol qayta navbatga qo'yadi (admin)."""
+    return _requeue(
+        Task.objects.filter(pk=task_row.pk, status='failed'), task_row.unique_key, timezone.now(),
+        attempts=0, locked_by='',
+    )
+
+
+def execute(task_id, worker):
+    """Bitta vazifani bajaradi (pool thread'i yoki process'i ichida). (nomi, muvaffaqiyatli, soniyalar)."""
+    close_old_connections()
+    started = time.monotonic()
+    try:
+        task_row = Task.objects.filter(pk=task_id, locked_by=worker, status='running').first()
+        if task_row is None:
+            return None, False, 0.0
+        spec = REGISTRY.get(task_row.name)
+        try:
+            if spec is None:
+                raise LookupError(f"Ro'yxatdan o'tmagan vazifa: {task_row.name}")
+            if task_row.attempts > task_row.max_attempts:
+                raise RuntimeError("Lease bir necha marta tugadi (worker to'xtab qolgan)")
+            spec.func(**task_row.kwargs)
+        except Exception:
+            logger.exception("Task %s #%s failed", task_row.name, task_row.pk)
+            _finish(task_row, worker, traceback.format_exc(limit=5)[-2000:])
+            return task_row.name, False, time.monotonic() - started
+        _finish(task_row, worker)
+        return task_row.name, True, time.monotonic() - started
+    finally:
+        close_old_connections()
+
+
+def purge(now=None):
+    """TASKS_KEEP_DAYS kundan eski tugagan vazifalarni o'chiradi."""
+    now = now or timezone.now()
+    cutoff = now - timedelta(days=_setting('TASKS_KEEP_DAYS', 7))
+    deleted, _details = Task.objects.filter(
+        status__in=('done', 'failed', 'superseded'), finished_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+# ----------------------------------------------------------------
+# Metrics
+# ----------------------------------------------------------------
+
+class WorkerMetrics:
+    """Worker ichidagi vazifa turi bo'yicha hisoblagichlar (runworker loglaydi)."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.monotonic()
+        self.counts = {}
+
+    def record(self, name, ok, seconds):
+        done, failed, total = self.counts.get(name, (0, 0, 0.0))
+        self.counts[name] = (done + ok, failed + (not ok), total + seconds)
+
+    def snapshot(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return {
+            name: {
+                'done': done,
+                'failed': failed,
+                'per_second': round((done + failed) / elapsed, 2),
+                'avg_ms': round(total / (done + failed) * 1000, 1),
+            }
+            for name, (done, failed, total) in sorted(self.counts.items())
+        }
+
+
+def stats(since=None):
+    """Vazifa turi bo'yicha bazadagi metrikalar: oxirgi oraliqdagi throughput, navbat va kechikish."""
+    now = timezone.now()
+    since = since or now - timedelta(hours=1)
+    window = max((now - since).total_seconds(), 1)
+    result = {}
+
+    finished = (
+        Task.objects.filter(status__in=('done', 'failed'), finished_at__gte=since)
+        .values('name', 'status')
+        .annotate(
+            n=Count('id'),
+            runtime=Avg(ExpressionWrapper(F('finished_at') - F('started_at'), output_field=DurationField())),
+        )
+    )
+    for row in finished:
+        entry = result.setdefault(row['name'], {'done': 0, 'failed': 0, 'queued': 0, 'running': 0})
+        entry[row['status']] = row['n']
+        if row['status'] == 'done' and row['runtime'] is not None:
+            entry['avg_ms'] = round(row['runtime'].total_seconds() * 1000, 1)
+
+    pending = (
+        Task.objects.filter(status__in=('queued', 'running'))
+        .values('name', 'status')
+        .annotate(n=Count('id'), oldest=Min('scheduled_at'))
+    )
+    for row in pending:
+        entry = result.setdefault(row['name'], {'done': 0, 'failed': 0, 'queued': 0, 'running': 0})
+        entry[row['status']] = row['n']
+        if row['status'] == 'queued' and row['oldest'] <= now:
+            entry['max_wait_s'] = round((now - row['oldest']).total_seconds())
+
+    for entry in result.values():
+        entry['per_minute'] = round((entry['done'] + entry['failed']) / window * 60, 2)
+    return dict(sorted(result.items()))
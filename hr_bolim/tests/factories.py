@@ -0,0 +1,43 @@
+"""Testlar uchun minimal obyektlar."""
+from datetime import timedelta
+from itertools import count
+
+from django.utils import timezone
+
+from hr_bolim.models import CandidateApplication, Company, EmployerJob, User
+
+_ids = count(1)
+
+
+def user(role='candidate', **fields):
+    n = next(_ids)
+    fields.setdefault('username', f'{role}-{n}')
+    fields.setdefault('email', f'{role}-{n}@example.com')
+    return User.objects.create(role=role, **fields)
+
+
+def company(**fields):
+    owner = fields.pop('user', None) or user('employer')
+    n = next(_ids)
+    fields.setdefault('company_name', f'Kompaniya {n}')
+    fields.setdefault('stir', f'test-{n}')
+    return Company.objects.create(
+        user=owner, email=owner.email, responsible_person="Mas'ul", phone='+998900000000', **fields
+    )
+
+
+def employer_job(company=None, **fields):
+    fields.setdefault('title', 'Backend dasturchi')
+    fields.setdefault('employment_type', 'full-time')
+    fields.setdefault('requirements', 'Python, Django')
+    fields.setdefault('responsibilities', 'API')
+    fields.setdefault('location', 'Toshkent')
+    fields.setdefault('status', 'active')
+    fields.setdefault('deadline', timezone.now() + timedelta(days=30))
+    return EmployerJob.objects.create(company=company or globals()['company'](), **fields)
+
+
+def application(job=None, candidate=None, **fields):
+    return CandidateApplication.objects.create(
+        job=job or employer_job(), candidate=candidate or user(), resume_file='applications/resumes/cv.pdf', **fields
+    )
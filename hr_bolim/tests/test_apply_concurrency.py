@@ -0,0 +1,105 @@
+"""
+Bitta vakansiyaga parallel ariza topshirish (takroriy urinishlar bilan).
+
+Thread'lar o'z ulanishlaridan ishlaydi, shuning uchun TransactionTestCase:
+ma'lumotlar commit qilinadi va test oxirida jadvallar tozalanadi.
+"""
+import threading
+
+from django.db import IntegrityError, close_old_connections, connection
+from django.test import Client, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from hr_bolim import counters
+from hr_bolim.models import CandidateApplication, CandidateProfile, CompanyProfile, EmployerJob
+
+from . import factories
+
+
+def run_parallel(target, args_list):
+    """Har bir argument uchun bitta thread; hammasi barrier'da bir vaqtda boshlanadi."""
+    barrier = threading.Barrier(len(args_list))
+    results, lock = [], threading.Lock()
+
+    def worker(*args):
+        try:
+            barrier.wait()
+            result = target(*args)
+        except Exception as exc:
+            result = exc
+        finally:
+            connection.close()
+        with lock:
+            results.append(result)
+
+    threads = [threading.Thread(target=worker, args=args) for args in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+# force_login audit yozuvi sinxron yozilsin - test oxirida jadvallar tozalanadi
+@override_settings(AUDIT_LOG_ASYNC=False)
+class ConcurrentApplyTests(TransactionTestCase):
+
+    def setUp(self):
+        # Oldingi testlardan buferda qolgan ko'rishlar (vakansiya id'lari qayta ishlatiladi)
+        counters.flush_all()
+        self.job = factories.employer_job()
+        CompanyProfile.objects.create(company=self.job.company, description='', address='')
+        self.url = reverse('apply_employer_job', args=[self.job.pk])
+
+    def candidate(self):
+        user = factories.user()
+        # Rezyume profildan olinadi - fayl yuklash kerak emas
+        CandidateProfile.objects.create(user=user, resume_file='candidates/resumes/cv.pdf')
+        return user
+
+    def post_application(self, user, attempts=1):
+        client = Client()
+        client.force_login(user)
+        return [client.post(self.url, {'cover_letter': 'Salom'}).status_code for _ in range(attempts)]
+
+    def assert_totals(self, expected):
+        job = EmployerJob.objects.select_related('company__profile', 'company__stats').get(pk=self.job.pk)
+        self.assertEqual(CandidateApplication.objects.filter(job=job).count(), expected)
+        self.assertEqual(job.application_count, expected)
+        self.assertEqual(job.company.profile.total_applications, expected)
+        self.assertEqual(job.company.stats.applications_total, expected)
+        self.assertEqual(job.company.stats.applications_new, expected)
+
+    def test_unique_constraint_allows_one_application(self):
+        user = self.candidate()
+
+        def create():
+            close_old_connections()
+            return CandidateApplication.objects.create(
+                job_id=self.job.pk, candidate_id=user.pk, resume_file='applications/resumes/cv.pdf',
+            )
+
+        results = run_parallel(create, [()] * 8)
+        created = [result for result in results if isinstance(result, CandidateApplication)]
+        self.assertEqual(len(created), 1, results)
+        self.assertTrue(all(isinstance(result, IntegrityError) for result in results if result not in created))
+        self.assert_totals(1)
+
+    def test_duplicate_posts_create_one_application(self):
+        user = self.candidate()
+        results = run_parallel(self.post_application, [(user,)] * 8)
+        # Takroriy ariza IntegrityError orqali ushlanadi va jobs_list'ga qaytaradi
+        self.assertEqual(results, [[302]] * 8)
+        self.assert_totals(1)
+
+    def test_counters_match_applications(self):
+        candidates = [self.candidate() for _ in range(10)]
+        results = run_parallel(lambda user: self.post_application(user, attempts=3), [(user,) for user in candidates])
+        self.assertEqual(results, [[302, 302, 302]] * len(candidates))
+
+        views = run_parallel(lambda: [counters.job_views.incr(self.job.pk) for _ in range(50)], [()] * 4)
+        self.assertFalse([result for result in views if isinstance(result, Exception)])
+        counters.flush_all()
+
+        self.assert_totals(len(candidates))
+        self.assertEqual(EmployerJob.objects.get(pk=self.job.pk).view_count, 200)
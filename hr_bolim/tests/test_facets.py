@@ -0,0 +1,34 @@
+from django.test import TestCase
+
+from hr_bolim import facets
+from hr_bolim.models import JobFeedEntry
+
+from . import factories
+
+
+class DisjunctiveFacetTests(TestCase):
+    """Har bir facet o'z filtrisiz, qolgan filtrlar bilan sanaladi."""
+
+    def setUp(self):
+        self.first, self.second = factories.company(), factories.company()
+        for employment_type in ('full-time', 'full-time', 'part-time', 'remote'):
+            factories.employer_job(self.first, employment_type=employment_type)
+        factories.employer_job(self.second, employment_type='part-time')
+
+    def counts(self, result, facet):
+        return {bucket['value']: bucket['count'] for bucket in result[facet] if bucket['count']}
+
+    def test_selected_facet_keeps_other_options(self):
+        result = facets.compute(JobFeedEntry.objects.all(), {'emp_type': 'full-time'})
+        self.assertEqual(result['total'], 2)
+        self.assertEqual(self.counts(result, 'employment_type'), {'full-time': 2, 'part-time': 2, 'remote': 1})
+        # Boshqa facetlar tanlangan ish turi bilan cheklanadi
+        self.assertEqual(self.counts(result, 'company'), {self.first.pk: 2})
+
+    def test_facets_apply_the_other_filters(self):
+        result = facets.compute(
+            JobFeedEntry.objects.all(), {'emp_type': 'part-time', 'company_id': str(self.second.pk)},
+        )
+        self.assertEqual(result['total'], 1)
+        self.assertEqual(self.counts(result, 'employment_type'), {'part-time': 1})
+        self.assertEqual(self.counts(result, 'company'), {self.first.pk: 1, self.second.pk: 1})
@@ -0,0 +1,27 @@
+from django.test import TestCase
+
+from hr_bolim import deletion, gdpr
+from hr_bolim.models import DataDeletionRequest, SavedSearch, SavedSearchKey, SavedSearchMatch
+
+from . import factories
+
+
+class SavedSearchPersonalDataTests(TestCase):
+    """Saqlangan qidiruvlar shaxsiy ma'lumot: eksport qilinadi va hisob bilan o'chiriladi."""
+
+    def setUp(self):
+        self.user = factories.user()
+        self.search = SavedSearch.objects.create(user=self.user, query='python', location='Toshkent', salary_min=5)
+        SavedSearchMatch.objects.create(search=self.search, job=factories.employer_job())
+
+    def test_export_includes_saved_searches(self):
+        exported = {name: list(rows) for name, rows, _files in gdpr.datasets(self.user)}
+        self.assertEqual([row['query'] for row in exported['saved_searches']], ['python'])
+        self.assertEqual(len(exported['saved_search_matches']), 1)
+
+    def test_deletion_removes_saved_searches(self):
+        request = DataDeletionRequest.objects.create(user=self.user)
+        self.assertTrue(deletion.process(request))
+        self.assertFalse(SavedSearch.objects.filter(user=self.user).exists())
+        self.assertFalse(SavedSearchMatch.objects.filter(search__user=self.user).exists())
+        self.assertFalse(SavedSearchKey.objects.filter(search__user=self.user).exists())
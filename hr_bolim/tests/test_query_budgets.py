@@ -0,0 +1,239 @@
+"""
+Sahifalar uchun SQL so'rovlar budjeti (performance regression).
+
+Har bir sahifa sovuq kesh bilan (pagecache va facets versiyasi oshirilgan)
+o'lchanadi - kesh qizib qolgan holda 0 so'rov ko'rinib, N+1 yashirinmasin.
+"""
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from hr_bolim import facets, feed, matching, pagecache, stats, talent
+from hr_bolim.models import (
+    CandidateApplication, CandidateProfile, Company, CompanyProfile, ConsentLog, Contact, DataDeletionRequest,
+    Department, Education, EmployerJob, Experience, Interview, Job, Message, Resume, SavedSearch, SavedSearchMatch,
+    User,
+)
+from hr_bolim.search import employer_job_index, job_index
+
+# URL nomi -> maksimal so'rovlar soni. So'rovlar soni ma'lumotlar hajmiga bog'liq
+# bo'lmasligi kerak: scale=2 bilan ham shu chegaralar ichida qolishi N+1 yo'qligini bildiradi.
+BUDGETS = {
+    'home': 3,
+    'jobs_list': 6,
+    'jobs_list:search': 8,
+    'job_detail': 8,
+    'candidate_dashboard': 10,
+    'my_applications': 10,
+    'candidate_interviews': 7,
+    'saved_searches': 6,
+    'inbox': 8,
+    'chat_detail': 10,
+    'employer_dashboard': 10,
+    'employer_jobs': 8,
+    'job_matches': 7,
+    'employer_applications': 8,
+    'talent_search': 8,
+    'talent_search:query': 8,
+    'application_detail': 10,
+    'employer_statistics': 11,
+    'employer_messages': 8,
+    'employer_chat_detail': 10,
+    'employer_interviews': 7,
+    'admin_dashboard': 10,
+    'admin_companies': 6,
+    'admin_gdpr_logs': 6,
+}
+
+
+class Seed:
+    """Bitta tranzaksiya ichida yaratiladigan sinov ma'lumotlari."""
+
+    def __init__(self, scale):
+        now = timezone.now()
+        n_companies = 20 * scale
+        n_candidates = 200 * scale
+
+        self.admin = User.objects.create(username='budget-admin', email='budget-admin@example.com', role='admin')
+
+        User.objects.bulk_create([
+            User(username=f'budget-employer-{i}', email=f'budget-employer-{i}@example.com', role='employer')
+            for i in range(n_companies)
+        ] + [
+            User(username=f'budget-candidate-{i}', email=f'budget-candidate-{i}@example.com', role='candidate',
+                 first_name='Nomzod', last_name=str(i))
+            for i in range(n_candidates)
+        ])
+        employers = list(User.objects.filter(username__startswith='budget-employer-').order_by('id'))
+        candidates = list(User.objects.filter(username__startswith='budget-candidate-').order_by('id'))
+        CandidateProfile.objects.bulk_create([
+            CandidateProfile(user=user, profession='Python dasturchi', location='Toshkent', skills='Python, Django',
+                             experience_years=i % 8)
+            for i, user in enumerate(candidates)
+        ])
+        # Nomzodlar qidiruvida faqat ochiq rezyumesi borlar ko'rinadi
+        Resume.objects.bulk_create([
+            Resume(user=user, title='CV', file='resumes/user_uploads/cv.pdf', is_public=i % 4 != 0)
+            for i, user in enumerate(candidates)
+        ])
+        Experience.objects.bulk_create([
+            Experience(user=user, company=f'Kompaniya {k}', position='Backend dasturchi',
+                       start_date=now.date() - timedelta(days=365 * (k + 1)))
+            for user in candidates for k in range(2)
+        ])
+        Education.objects.bulk_create([
+            Education(user=user, institution='TATU', degree='Bakalavr', field_of_study='Dasturiy injiniring',
+                      start_date=now.date() - timedelta(days=365 * 6))
+            for user in candidates
+        ])
+
+        Company.objects.bulk_create([
+            Company(user=user, company_name=f'Kompaniya {i}', stir=f'budget-{i}', email=user.email,
+                    responsible_person='Mas\'ul', phone='+998900000000')
+            for i, user in enumerate(employers)
+        ])
+        companies = list(Company.objects.filter(stir__startswith='budget-').order_by('id'))
+        CompanyProfile.objects.bulk_create([
+            CompanyProfile(company=company, description='Tavsif', address='Toshkent') for company in companies
+        ])
+
+        departments = Department.objects.bulk_create([
+            Department(name=f"Bo'lim {i}", description='') for i in range(5)
+        ])
+        Job.objects.bulk_create([
+            Job(title=f'Dasturchi {i}', department=departments[i % 5], employment_type='full-time',
+                loaction='Toshkent', description='Python Django', requirements='SQL',
+                posted_by=employers[0], salary_min=5_000_000 + i * 10_000, experience_required='1-3')
+            for i in range(100 * scale)
+        ])
+        EmployerJob.objects.bulk_create([
+            EmployerJob(company=company, title=f'Backend dasturchi {i}', employment_type='full-time',
+                        requirements='Python, Django', responsibilities='API', location='Toshkent',
+                        deadline=now + timedelta(days=30), status='active',
+                        salary_min=8_000_000, salary_max=12_000_000)
+            for company in companies for i in range(10)
+        ])
+        jobs = list(EmployerJob.objects.filter(company__in=companies).order_by('id'))
+
+        # Har bir nomzod birinchi kompaniyaning bitta vakansiyasiga va yana to'rttasiga
+        applications = []
+        for i, candidate in enumerate(candidates):
+            targets = {jobs[i % 10].pk} | {jobs[(i * 7 + k) % len(jobs)].pk for k in range(4)}
+            applications.extend(
+                CandidateApplication(job_id=job_id, candidate=candidate,
+                                     resume_file='applications/resumes/cv.pdf', cover_letter='Salom')
+                for job_id in targets
+            )
+        CandidateApplication.objects.bulk_create(applications, batch_size=500)
+        first_company_apps = CandidateApplication.objects.filter(job__company=companies[0]).order_by('id')
+        Interview.objects.bulk_create([
+            Interview(application=application, scheduled_date=now + timedelta(days=i % 14))
+            for i, application in enumerate(first_company_apps) if i % 3 == 0
+        ])
+
+        ConsentLog.objects.bulk_create([
+            ConsentLog(user=candidates[i % len(candidates)], consent_type='privacy', policy_version='1.0')
+            for i in range(500 * scale)
+        ], batch_size=500)
+        Contact.objects.bulk_create([
+            Contact(name='Shikoyatchi', email='c@example.com', subject='Mavzu', message='Matn')
+            for _ in range(50)
+        ])
+        DataDeletionRequest.objects.bulk_create([DataDeletionRequest(user=user) for user in candidates[-20:]])
+
+        # Xabarlar signal orqali Conversation'larni ham to'ldiradi
+        self.employer, self.candidate = employers[0], candidates[0]
+        for other in candidates[:60]:
+            for k in range(5):
+                sender, recipient = (other, self.employer) if k % 2 else (self.employer, other)
+                Message.objects.create(sender=sender, recipient=recipient, content=f'Xabar {k}')
+        for other in employers[1:41]:
+            for k in range(5):
+                sender, recipient = (other, self.candidate) if k % 2 else (self.candidate, other)
+                Message.objects.create(sender=sender, recipient=recipient, content=f'Xabar {k}')
+
+        feed.rebuild()
+        stats.rebuild()
+        job_index.rebuild(Job.objects.select_related('department'))
+        employer_job_index.rebuild(EmployerJob.objects.all())
+        matching.rebuild()
+        talent.rebuild()
+
+        # Signal orqali teskari indeks ham to'ldiriladi
+        for k in range(5):
+            SavedSearch.objects.create(user=self.candidate, query=f'dasturchi {k}', location='Toshkent',
+                                       company=companies[k])
+        SavedSearchMatch.objects.bulk_create([
+            SavedSearchMatch(search=search, job=job)
+            for search in SavedSearch.objects.filter(user=self.candidate) for job in jobs[:10]
+        ])
+
+        self.job = jobs[0]
+        self.application = first_company_apps.first()
+        self.chat_peer = employers[1]
+
+    def cases(self):
+        """(budget kaliti, foydalanuvchi, URL) ro'yxati."""
+        candidate, employer, admin = self.candidate, self.employer, self.admin
+        return [
+            ('home', None, reverse('home')),
+            ('jobs_list', None, reverse('jobs_list')),
+            ('jobs_list:search', None, reverse('jobs_list') + '?q=dasturchi&type=full-time'),
+            ('job_detail', candidate, reverse('job_detail', args=[self.job.pk])),
+            ('candidate_dashboard', candidate, reverse('candidate_dashboard')),
+            ('my_applications', candidate, reverse('my_applications')),
+            ('candidate_interviews', candidate, reverse('candidate_interviews')),
+            ('saved_searches', candidate, reverse('saved_searches')),
+            ('inbox', candidate, reverse('inbox')),
+            ('chat_detail', candidate, reverse('chat_detail', args=[self.chat_peer.pk])),
+            ('employer_dashboard', employer, reverse('employer_dashboard')),
+            ('employer_jobs', employer, reverse('employer_jobs')),
+            ('job_matches', employer, reverse('job_matches', args=[self.job.pk])),
+            ('employer_applications', employer, reverse('employer_applications')),
+            ('talent_search', employer, reverse('talent_search')),
+            ('talent_search:query', employer, reverse('talent_search') + '?q=python&location=toshkent&experience_min=1'),
+            ('application_detail', employer, reverse('application_detail', args=[self.application.pk])),
+            ('employer_statistics', employer, reverse('employer_statistics')),
+            ('employer_messages', employer, reverse('employer_messages')),
+            ('employer_chat_detail', employer, reverse('employer_chat_detail', args=[self.candidate.pk])),
+            ('employer_interviews', employer, reverse('employer_interviews')),
+            ('admin_dashboard', admin, reverse('admin_dashboard')),
+            ('admin_companies', admin, reverse('admin_companies')),
+            ('admin_gdpr_logs', admin, reverse('admin_gdpr_logs')),
+        ]
+
+
+# force_login audit yozuvi sinxron yozilsin (fon thread'i test tranzaksiyasini ko'rmaydi)
+@override_settings(AUDIT_LOG_ASYNC=False)
+class QueryBudgetTests(TestCase):
+    scale = 1
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed = Seed(cls.scale)
+
+    def test_pages_within_query_budget(self):
+        for key, user, url in self.seed.cases():
+            with self.subTest(key):
+                if user is None:
+                    self.client.logout()
+                else:
+                    self.client.force_login(user)
+                # Birinchi so'rov shablonlarni yuklaydi; keyin sovuq kesh bilan o'lchanadi
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200, url)
+                pagecache.invalidate()
+                facets.invalidate()
+                with CaptureQueriesContext(connection) as queries:
+                    self.client.get(url)
+                sql = '\n'.join(query['sql'] for query in queries.captured_queries)
+                self.assertLessEqual(len(queries), BUDGETS[key], f"{key}: {len(queries)} so'rov\n{sql}")
+
+
+class QueryBudgetScaleTests(QueryBudgetTests):
+    """Ikki barobar ko'p ma'lumot bilan ham so'rovlar soni o'zgarmasligi kerak (N+1 yo'q)."""
+    scale = 2
@@ -0,0 +1,85 @@
+"""
+Asosiy so'rovlarning EXPLAIN rejasi: kutilgan indekslar ishlatilishi kerak.
+
+Har bir so'rov uchun indeks guruhlari beriladi - har bir guruhdan kamida
+bittasi rejada bo'lishi shart (bir jadval uchun bir nechta mos indeks bo'lsa,
+planner ulardan birini tanlashi mumkin). Nomsiz ForeignKey indekslari Django
+yaratgan nom prefiksi bilan tekshiriladi.
+"""
+import re
+import unittest
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+
+from hr_bolim.models import (
+    CandidateApplication, ConsentLog, Conversation, EmployerJob, Interview, Job, JobFeedEntry, Message,
+)
+
+# SQLite: "SCAN hr_bolim_xxx" (USING INDEX'siz) - to'liq jadval skani
+SQLITE_FULL_SCAN = re.compile(r'\bSCAN (\w+)(?! USING)(?:\s|$)')
+POSTGRES_FULL_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+COMPANY_JOBS = ('employerjob_company_views_idx', 'employerjob_company_recent_idx')
+APPLICATION_BY_JOB = (
+    'application_job_applied_idx', 'application_job_status_idx', 'hr_bolim_candidateapplication_job_id_',
+)
+INTERVIEW_BY_APPLICATION = ('hr_bolim_interview_application_id', 'sqlite_autoindex_hr_bolim_interview_')
+
+
+def hot_queries():
+    """views.py dagi eng ko'p ishlatiladigan so'rovlar (id qiymatlari ahamiyatsiz) va kutilgan indekslar."""
+    return [
+        ("home: ochiq Job'lar", Job.objects.filter(status='open').order_by('-posted_at')[:5],
+         [('job_status_posted_idx',)]),
+        ("jobs_list: lenta sahifasi", JobFeedEntry.objects.order_by('-published_at', '-id')[:21],
+         [('feed_published_idx',)]),
+        ("faol EmployerJob'lar", EmployerJob.objects.filter(status='active').order_by('-created_at'),
+         [('employerjob_status_recent_idx',)]),
+        ("employer_jobs", EmployerJob.objects.filter(company_id=1).order_by('-created_at'),
+         [('employerjob_company_recent_idx',)]),
+        ("employer_dashboard: popular_jobs", EmployerJob.objects.filter(company_id=1).order_by('-view_count')[:5],
+         [('employerjob_company_views_idx',)]),
+        ("employer_applications", CandidateApplication.objects.filter(job__company_id=1).order_by('-applied_at'),
+         [COMPANY_JOBS, APPLICATION_BY_JOB]),
+        ("employer_applications: status filtri",
+         CandidateApplication.objects.filter(job__company_id=1, status='new').order_by('-applied_at'),
+         [COMPANY_JOBS, ('application_job_status_idx',)]),
+        ("my_applications", CandidateApplication.objects.filter(candidate_id=1).order_by('-applied_at'),
+         [('application_candidate_idx',)]),
+        ("o'qilmagan xabarlar", Message.objects.filter(recipient_id=1, is_read=False),
+         [('message_unread_idx',)]),
+        ("chat tarixi", Message.objects.filter(
+            Q(sender_id=1, recipient_id=2) | Q(sender_id=2, recipient_id=1)).order_by('-id')[:51],
+         [('message_thread_idx',)]),
+        ("inbox", Conversation.objects.for_user(1),
+         [('hr_bolim_conversation_user_low_id_',), ('hr_bolim_conversation_user_high_id_',)]),
+        ("candidate_interviews",
+         Interview.objects.filter(application__candidate_id=1).order_by('-scheduled_date'),
+         [('application_candidate_idx', 'application_cand_status_idx', 'hr_bolim_candidateapplication_candidate_id_'),
+          INTERVIEW_BY_APPLICATION]),
+        ("employer_interviews",
+         Interview.objects.filter(application__job__company_id=1).order_by('-scheduled_date'),
+         [COMPANY_JOBS, APPLICATION_BY_JOB, INTERVIEW_BY_APPLICATION]),
+        ("admin_gdpr_logs", ConsentLog.objects.order_by('-given_at'), [('consentlog_given_idx',)]),
+    ]
+
+
+@unittest.skipUnless(connection.vendor in ('sqlite', 'postgresql'), "Reja tahlili faqat SQLite/PostgreSQL uchun")
+class QueryPlanTests(TestCase):
+
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            # Bo'sh test jadvallarida ham indeks tanlanishini tekshirish uchun
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_hot_queries_use_expected_indexes(self):
+        full_scan = SQLITE_FULL_SCAN if connection.vendor == 'sqlite' else POSTGRES_FULL_SCAN
+        for label, queryset, expected in hot_queries():
+            with self.subTest(label):
+                plan = queryset.explain()
+                self.assertEqual(full_scan.findall(plan), [], plan)
+                for names in expected:
+                    self.assertTrue(any(name in plan for name in names), f"{' / '.join(names)} yo'q:\n{plan}")
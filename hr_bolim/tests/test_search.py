@@ -0,0 +1,26 @@
+from django.test import TestCase, override_settings
+
+from hr_bolim.search import employer_job_index
+
+from . import factories
+
+
+class ClosedJobsSearchTests(TestCase):
+    """Yopiq vakansiyalar indeksda yo'q - qidiruv LIMIT'ini egallamaydi."""
+
+    @override_settings(SEARCH_RESULT_LIMIT=3)
+    def test_closed_jobs_do_not_use_up_the_limit(self):
+        company = factories.company()
+        for _ in range(5):
+            factories.employer_job(company, title='Python dasturchi', status='closed')
+        active = {factories.employer_job(company, title='Python dasturchi').pk for _ in range(3)}
+
+        self.assertEqual({pk for pk, _score in employer_job_index.search('python')}, active)
+
+    def test_closing_a_job_removes_it_from_the_index(self):
+        job = factories.employer_job(title='Python dasturchi')
+        self.assertEqual([pk for pk, _score in employer_job_index.search('python')], [job.pk])
+
+        job.status = 'closed'
+        job.save()
+        self.assertEqual(employer_job_index.search('python'), [])
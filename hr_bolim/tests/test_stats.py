@@ -0,0 +1,70 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from hr_bolim import stats
+from hr_bolim.models import CompanyStatsDaily, JobStatsDaily
+
+from . import factories
+
+
+class HireStatsTests(TestCase):
+    """Ishga olish statistikasi hired_at bo'yicha: keyingi tahrirlar sanani surmaydi."""
+
+    def setUp(self):
+        self.start = timezone.now().replace(hour=12)
+
+    def at(self, days):
+        return mock.patch('django.utils.timezone.now', return_value=self.start + timedelta(days=days))
+
+    def day(self, days):
+        return timezone.localdate(self.start + timedelta(days=days))
+
+    def hires(self, job):
+        company_rows = dict(
+            CompanyStatsDaily.objects.filter(company_id=job.company_id, hires__gt=0).values_list('date', 'hires')
+        )
+        job_rows = {
+            date: (hires, seconds)
+            for date, hires, seconds in JobStatsDaily.objects.filter(job=job, hires__gt=0).values_list(
+                'date', 'hires', 'hire_seconds',
+            )
+        }
+        return company_rows, job_rows
+
+    def test_edit_after_accept_keeps_hire_day(self):
+        with self.at(0):
+            application = factories.application()
+        job = application.job
+        with self.at(1):
+            application.status = 'accepted'
+            application.save()
+        with self.at(3):
+            application.internal_notes = 'Yaxshi nomzod'
+            application.save()
+
+        expected = ({self.day(1): 1}, {self.day(1): (1, 86400)})
+        self.assertEqual(self.hires(job), expected)
+        stats.rebuild([job.company_id])
+        self.assertEqual(self.hires(job), expected)
+
+    def test_accept_edit_reject_removes_hire(self):
+        with self.at(0):
+            application = factories.application()
+        job = application.job
+        with self.at(1):
+            application.status = 'accepted'
+            application.save()
+        with self.at(3):
+            application.internal_notes = 'Yaxshi nomzod'
+            application.save()
+        with self.at(5):
+            application.status = 'rejected'
+            application.save()
+
+        self.assertIsNone(application.hired_at)
+        self.assertEqual(self.hires(job), ({}, {}))
+        stats.rebuild([job.company_id])
+        self.assertEqual(self.hires(job), ({}, {}))
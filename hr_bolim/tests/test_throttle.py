@@ -0,0 +1,52 @@
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from hr_bolim import throttle
+
+PROXY = '10.0.0.5'
+
+
+@override_settings(
+    THROTTLE_TRUSTED_PROXIES=['10.0.0.0/24'],
+    THROTTLE_RATES={'login': {'ip': (2, 300)}},
+)
+class ClientIpTests(SimpleTestCase):
+    """Ishonchli proxy ortida mijoz IP'si X-Forwarded-For'dan olinadi."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def request(self, remote, forwarded=None):
+        extra = {'REMOTE_ADDR': remote}
+        if forwarded is not None:
+            extra['HTTP_X_FORWARDED_FOR'] = forwarded
+        return self.factory.post('/login/', **extra)
+
+    def test_trusted_proxy_uses_rightmost_untrusted_address(self):
+        request = self.request(PROXY, '1.1.1.1, 203.0.113.7, 10.0.0.9')
+        self.assertEqual(throttle.client_ip(request), '203.0.113.7')
+
+    def test_untrusted_remote_ignores_header(self):
+        request = self.request('198.51.100.2', '203.0.113.7')
+        self.assertEqual(throttle.client_ip(request), '198.51.100.2')
+
+    @override_settings(THROTTLE_TRUSTED_PROXIES=[])
+    def test_no_trusted_proxies_ignores_header(self):
+        self.assertEqual(throttle.client_ip(self.request(PROXY, '203.0.113.7')), PROXY)
+
+    def test_clients_behind_proxy_have_separate_limits(self):
+        for _ in range(2):
+            _, retry_after = throttle.reserve('login', self.request(PROXY, '203.0.113.7'))
+            self.assertIsNone(retry_after)
+        _, retry_after = throttle.reserve('login', self.request(PROXY, '203.0.113.7'))
+        self.assertIsNotNone(retry_after)
+        # Boshqa mijoz xuddi shu proxy orqali kelsa ham o'z limitiga ega
+        _, retry_after = throttle.reserve('login', self.request(PROXY, '203.0.113.8'))
+        self.assertIsNone(retry_after)
+
+    def test_spoofed_header_does_not_bypass_limit(self):
+        for forwarded in ('203.0.113.1', '203.0.113.2'):
+            throttle.reserve('login', self.request('198.51.100.2', forwarded))
+        _, retry_after = throttle.reserve('login', self.request('198.51.100.2', '203.0.113.3'))
+        self.assertIsNotNone(retry_after)
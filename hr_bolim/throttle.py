@@ -0,0 +1,170 @@
+"""
+Sliding-window request throttling.
+
+Har bir endpoint (scope) uchun THROTTLE_RATES da kalit turlari bo'yicha
+``(limit, oyna soniyalarda)`` beriladi:
+
+- ``ip`` - mijoz IP'si (``client_ip``: ishonchli proxy ortida X-Forwarded-For),
+- ``username`` - POST'dagi login nomi (kichik harf, hash),
+- ``user`` - tizimga kirgan foydalanuvchi id'si.
+
+Hisoblagichlar keshda (barcha worker'lar uchun umumiy backend bo'lsa -
+umumiy) ikkita qat'iy oyna bilan saqlanadi: joriy oyna to'liq, oldingisi
+o'tgan vaqtga mutanosib ulush bilan qo'shiladi (sliding window counter).
+
+``limit`` dekoratori view'dan (ya'ni login uchun ``authenticate()`` va
+parol xeshlashdan) oldin o'rinni atomar band qiladi (``cache.add`` +
+``incr``): parallel so'rovlarning har biri o'z tartib raqamini oladi,
+limitdan oshgani 429 bilan qaytariladi va o'rni bo'shatiladi. Tekshiruv
+va yozuv alohida bo'lganda bir vaqtdagi N ta so'rov hammasi tekshiruvdan
+o'tib ketardi. (Atomarlik keshning incr'iga bog'liq: locmem va redis'da
+atomar.)
+"""
+import hashlib
+import ipaddress
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.shortcuts import render
+
+
+def _rates(scope):
+    return getattr(settings, 'THROTTLE_RATES', {}).get(scope, {})
+
+
+def _trusted(address, proxies):
+    try:
+        ip = ipaddress.ip_address(address.strip())
+    except ValueError:
+        return False
+    return any(ip in ipaddress.ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def client_ip(request):
+    """So'rov yuborgan mijozning IP manzili.
+
+    REMOTE_ADDR THROTTLE_TRUSTED_PROXIES'dan biri bo'lsa, X-Forwarded-For
+    o'ngdan chapga o'qiladi va ishonchli proxy bo'lmagan birinchi manzil
+    qaytariladi. Chap tomondagi qiymatlarni mijozning o'zi yozishi mumkin,
+    shuning uchun ular hisobga olinmaydi.
+    """
+    remote = request.META.get('REMOTE_ADDR')
+    proxies = getattr(settings, 'THROTTLE_TRUSTED_PROXIES', [])
+    if not remote or not proxies or not _trusted(remote, proxies):
+        return remote
+    forwarded = [a.strip() for a in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if a.strip()]
+    for address in reversed(forwarded):
+        if not _trusted(address, proxies):
+            return address
+    return forwarded[0] if forwarded else remote
+
+
+def _idents(request, kinds, username_field):
+    for kind in kinds:
+        if kind == 'ip':
+            value = client_ip(request)
+        elif kind == 'username':
+            value = (request.POST.get(username_field) or '').strip().lower() if username_field else ''
+        elif kind == 'user':
+            value = request.user.pk if request.user.is_authenticated else None
+        else:
+            raise ValueError(f"Unknown throttle key kind: {kind}")
+        if value:
+            yield kind, hashlib.md5(str(value).encode()).hexdigest()
+
+
+def _keys(scope, kind, ident, window, now):
+    current = int(now // window)
+    base = f"throttle:{scope}:{kind}:{ident}"
+    return f"{base}:{current}", f"{base}:{current - 1}"
+
+
+def _retry_after(limit, window, now, current, previous):
+    """Og'irlangan son limitdan pastga tushguncha qolgan soniyalar."""
+    until_next = window - now % window
+    if current >= limit or not previous:
+        return math.ceil(until_next)
+    # previous * (1 - t / window) + current < limit  =>  t > window * (1 - (limit - current) / previous)
+    elapsed = window * (1 - (limit - current) / previous)
+    return max(1, min(math.ceil(elapsed - now % window), math.ceil(until_next)))
+
+
+def _weighted(limit, window, now, current, previous):
+    """Sliding window bo'yicha limitdan oshgan bo'lsa qolgan soniyalar, aks holda None."""
+    weight = 1 - (now % window) / window
+    if previous * weight + current > limit:
+        return _retry_after(limit, window, now, current - 1, previous)
+    return None
+
+
+def reserve(scope, request, username_field=None):
+    """Har bir kalit bo'yicha o'rinni band qiladi.
+
+    (band qilingan kalitlar, retry_after) - limitdan oshgan bo'lsa
+    retry_after soniyalar bo'ladi va band qilinganlar bo'shatiladi.
+    """
+    rates = _rates(scope)
+    now = time.time()
+    reserved, retry_after = [], None
+    for kind, ident in _idents(request, rates, username_field):
+        limit, window = rates[kind]
+        current_key, previous_key = _keys(scope, kind, ident, window, now)
+        # Oldingi oyna ham kerak bo'lgani uchun ikki oyna davomida saqlanadi
+        cache.add(current_key, 0, window * 2)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            cache.set(current_key, 1, window * 2)
+            current = 1
+        reserved.append(current_key)
+        wait = _weighted(limit, window, now, current, cache.get(previous_key) or 0)
+        if wait is not None:
+            retry_after = max(retry_after or 0, wait)
+    if retry_after is not None:
+        release(reserved)
+        reserved = []
+    return reserved, retry_after
+
+
+def release(keys):
+    """reserve() band qilgan o'rinlarni qaytaradi."""
+    for key in keys:
+        try:
+            cache.decr(key)
+        except ValueError:
+            pass
+
+
+def rejected(request, retry_after):
+    response = render(request, 'hr_bolim/throttled.html', {
+        'retry_after': retry_after,
+        'retry_minutes': math.ceil(retry_after / 60),
+    }, status=429)
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def limit(scope, username_field=None, failures_only=False):
+    """POST so'rovlarini THROTTLE_RATES[scope] bo'yicha cheklaydi.
+
+    ``failures_only`` - faqat muvaffaqiyatsiz urinishlar sanaladi (login:
+    muvaffaqiyatli kirish redirect qaytaradi, xato forma esa 200).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'POST' or not _rates(scope):
+                return view(request, *args, **kwargs)
+            reserved, retry_after = reserve(scope, request, username_field)
+            if retry_after is not None:
+                return rejected(request, retry_after)
+            response = view(request, *args, **kwargs)
+            if failures_only and response.status_code in (301, 302):
+                # Muvaffaqiyatli urinish sanalmaydi
+                release(reserved)
+            return response
+        return wrapper
+    return decorator
@@ -1,13 +1,13 @@
 from django.urls import path
 from .views import (
     home_view, submit_complaint, jobs_list_view, register_view, CustomLoginView, dashboard_view, candidate_dashboard, candidate_profile, candidate_cv, 
-    add_experience, add_education, delete_item, candidate_gdpr, add_resume, apply_job, my_applications, inbox, chat_detail, candidate_interviews,
+    add_experience, add_education, delete_item, candidate_gdpr, add_resume, apply_job, my_applications, inbox, chat_detail, chat_messages_api, realtime_events, candidate_interviews, saved_searches,
     edit_resume, edit_experience, edit_education, apply_employer_job, job_detail,
     # Employer views
-    employer_dashboard, employer_register, employer_register_public, employer_profile, employer_jobs, create_job, edit_job, delete_job,
+    employer_dashboard, employer_register, employer_register_public, employer_profile, employer_jobs, create_job, edit_job, job_matches, talent_search, delete_job,
     employer_applications, application_detail, schedule_interview, employer_statistics, employer_messages, employer_chat_detail, employer_interviews,
     # Admin views
-    admin_dashboard, admin_companies, admin_gdpr_logs, admin_data_requests, admin_complaints
+    admin_dashboard, admin_companies, admin_approve_company, admin_gdpr_logs, admin_data_requests, admin_complaints
 )
 from django.contrib.auth.views import LogoutView
 
@@ -43,10 +43,13 @@ urlpatterns = [
     path('candidate/apply_employer/<int:job_id>/', apply_employer_job, name='apply_employer_job'),
     path('candidate/my-applications/', my_applications, name='my_applications'),
     path('candidate/interviews/', candidate_interviews, name='candidate_interviews'),
+    path('candidate/saved-searches/', saved_searches, name='saved_searches'),
 
     # Messaging
     path('candidate/inbox/', inbox, name='inbox'),
     path('candidate/chat/<int:user_id>/', chat_detail, name='chat_detail'),
+    path('chat/<int:user_id>/messages/', chat_messages_api, name='chat_messages_api'),
+    path('events/', realtime_events, name='realtime_events'),
 
     # GDPR
     path('candidate/gdpr/', candidate_gdpr, name='candidate_gdpr'),
@@ -60,10 +63,12 @@ urlpatterns = [
     path('employer/jobs/', employer_jobs, name='employer_jobs'),
     path('employer/jobs/create/', create_job, name='create_job'),
     path('employer/jobs/edit/<int:job_id>/', edit_job, name='edit_job'),
+    path('employer/jobs/<int:job_id>/matches/', job_matches, name='job_matches'),
     path('employer/jobs/delete/<int:job_id>/', delete_job, name='delete_job'),
     
     # Employer Applications
     path('employer/applications/', employer_applications, name='employer_applications'),
+    path('employer/candidates/', talent_search, name='talent_search'),
     path('employer/applications/<int:application_id>/', application_detail, name='application_detail'),
     path('employer/applications/<int:application_id>/interview/', schedule_interview, name='schedule_interview'),
     
@@ -83,6 +88,7 @@ urlpatterns = [
     # Admin Views (use different prefix to avoid conflict with Django admin site)
     path('admin-panel/dashboard/', admin_dashboard, name='admin_dashboard'),
     path('admin-panel/companies/', admin_companies, name='admin_companies'),
+    path('admin-panel/companies/<int:company_id>/approve/', admin_approve_company, name='admin_approve_company'),
     path('admin-panel/gdpr-logs/', admin_gdpr_logs, name='admin_gdpr_logs'),
     path('admin-panel/data-requests/', admin_data_requests, name='admin_data_requests'),
     path('admin-panel/complaints/', admin_complaints, name='admin_complaints'),
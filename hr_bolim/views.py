@@ -1,17 +1,23 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from .models import User, Job, Department, CandidateProfile, Application, SavedJob, Experience, Education, Resume, PrivacyPolicy, DataDeletionRequest, Message, Company, CompanyProfile, EmployerJob, CandidateApplication, Interview, Contact, ConsentLog
+from .models import User, Job, Department, CandidateProfile, Application, SavedJob, Experience, Education, Resume, PrivacyPolicy, DataDeletionRequest, Message, Company, CompanyProfile, EmployerJob, CandidateApplication, Interview, Contact, ConsentLog, JobFeedEntry, Conversation, SavedSearch
 from django.contrib.auth import login, authenticate
 from .forms import CustomUserCreationForm, CustomAuthenticationForm, CompanyRegistrationForm, CompanyProfileForm, EmployerJobForm, CandidateApplicationForm, InterviewForm
 from django.contrib.auth.views import LoginView
+from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required
+from django.db import IntegrityError, transaction
 from django.db.models import Q, Count, Avg
 from types import SimpleNamespace
 from django.utils import timezone
 from django.contrib import messages
-from django.http import JsonResponse
-from django.core.mail import send_mail
+from django.http import JsonResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.core.paginator import Paginator
 from django.conf import settings
+from .search import job_index, employer_job_index
+from . import feed, facets, counters, chat, realtime, stats, analytics, pagecache, throttle, audit, gdpr, matching, talent, alerts
 
+import asyncio
 from functools import wraps
 
 
@@ -38,11 +44,13 @@ def employer_required(view_func):
         return view_func(request, *args, **kwargs)
     return _wrapped
 
+@pagecache.cache_anonymous_page('home')
 def home_view(request):
     # So‘nggi 5 ta ochiq ishlarni olish
     latest_jobs = Job.objects.filter(status='open').order_by('-posted_at')[:5]
     return render(request, 'hr_bolim/home.html', {'latest_jobs': latest_jobs})
 
+@throttle.limit('complaint')
 def submit_complaint(request):
     """Submit a complaint form"""
     if request.method == 'POST':
@@ -71,80 +79,92 @@ def submit_complaint(request):
     
     return render(request, 'hr_bolim/complaint_form.html')
 
+def _search_scores(index, query):
+    results = index.search(query)
+    if results is None:
+        return None
+    return dict(results)
+
 def jobs_list_view(request):
-    # Legacy jobs
-    legacy_jobs = Job.objects.filter(status='open').order_by('-posted_at')
-    
-    # Employer jobs
-    employer_jobs = EmployerJob.objects.filter(status='active').order_by('-created_at')
+    # Kontekst foydalanuvchiga bog'liq emas: filtrlar (facets.query_key) va
+    # cursor bo'yicha keshlanadi (hr_bolim.pagecache)
+    context = pagecache.get_or_set(
+        'jobs_list',
+        (facets.query_key(request.GET), request.GET.get('cursor') or ''),
+        lambda: _jobs_list_context(request),
+    )
+    return render(request, 'hr_bolim/jobs_list.html', context)
 
-    # Filters
-    query = request.GET.get('q')
-    location = request.GET.get('location')
+def _jobs_list_context(request):
+    # Job va EmployerJob umumiy lentasi (JobFeedEntry)
+    entries = JobFeedEntry.objects.all()
+
+    # Filters (q va location kesh kalitidagi qiymat bilan bir xil - facets.clean_text)
+    query = facets.clean_text(request.GET.get('q'))
+    location = facets.clean_text(request.GET.get('location'))
     department_id = request.GET.get('department')
+    company_id = request.GET.get('company')
     emp_type = request.GET.get('type')
     salary_min = request.GET.get('salary_min')
     salary_max = request.GET.get('salary_max')
     experience = request.GET.get('experience')
+    cursor = request.GET.get('cursor')
+
+    filters = {
+        'location': location,
+        'department_id': department_id,
+        'company_id': company_id,
+        'emp_type': emp_type,
+        'salary_min': salary_min,
+        'salary_max': salary_max,
+        'experience': experience,
+    }
 
-    # Apply filters to legacy jobs
-    if query:
-        legacy_jobs = legacy_jobs.filter(Q(title__icontains=query) | Q(description__icontains=query) | Q(department__name__icontains=query))
-
-    if location:
-        legacy_jobs = legacy_jobs.filter(loaction__icontains=location)
-
-    if department_id:
-        legacy_jobs = legacy_jobs.filter(department_id=department_id)
-
-    if emp_type:
-        jobs = jobs.filter(employment_type=emp_type)
-        
-    if salary_min:
-        legacy_jobs = legacy_jobs.filter(salary_max__gte=salary_min)
-
-    if salary_max:
-        legacy_jobs = legacy_jobs.filter(salary_min__lte=salary_max)
-
-    if experience and experience != 'all':
-        if experience == '0':
-            legacy_jobs = legacy_jobs.filter(experience_required='0')
-        elif experience == '1-3':
-            legacy_jobs = legacy_jobs.filter(experience_required='1-3')
-        elif experience == '3-5':
-            legacy_jobs = legacy_jobs.filter(experience_required='3-5')
-        elif experience == '5+':
-            legacy_jobs = legacy_jobs.filter(experience_required='5+')
-
-    # Apply filters to employer jobs
+    # Full-text qidiruv: {pk: score}, backend qo'llab-quvvatlamasa None
+    legacy_scores = employer_scores = None
     if query:
-        employer_jobs = employer_jobs.filter(Q(title__icontains=query) | Q(requirements__icontains=query) | Q(responsibilities__icontains=query))
-
-    if location:
-        employer_jobs = employer_jobs.filter(location__icontains=location)
-
-    if emp_type:
-        employer_jobs = employer_jobs.filter(employment_type=emp_type)
-
-    if salary_min:
-        employer_jobs = employer_jobs.filter(salary_max__gte=salary_min)
-
-    if salary_max:
-        employer_jobs = employer_jobs.filter(salary_min__lte=salary_max)
-
-    # Combine and sort
-    combined_jobs = list(legacy_jobs) + list(employer_jobs)
-    # Simple sort by date-like attribute; for production, use a more sophisticated approach
-    combined_jobs.sort(key=lambda x: getattr(x, 'posted_at', None) or getattr(x, 'created_at', None) or timezone.now(), reverse=True)
+        legacy_scores = _search_scores(job_index, query)
+        employer_scores = _search_scores(employer_job_index, query)
+
+    ranked = query and legacy_scores is not None and employer_scores is not None
+    if ranked:
+        entries = feed.restrict_to(entries, legacy_scores, employer_scores)
+    elif query:
+        entries = entries.filter(
+            Q(kind='job', object_id__in=Job.objects.filter(
+                Q(title__icontains=query) | Q(description__icontains=query) | Q(department__name__icontains=query)
+            ).values('id')) |
+            Q(kind='employer_job', object_id__in=EmployerJob.objects.filter(
+                Q(title__icontains=query) | Q(requirements__icontains=query) | Q(responsibilities__icontains=query)
+            ).values('id'))
+        )
 
-    departments = Department.objects.all()
+    # Filtrlar paneli uchun facet sonlari: har bir facet o'z filtrisiz (keshlangan)
+    job_facets = facets.get_facets(entries, filters, request.GET)
+    entries = feed.filter_feed(entries, **filters)
 
-    context = {
-        'jobs': combined_jobs,
-        'departments': departments,
+    if ranked:
+        # Qidiruvda eng mos natijalar birinchi (bm25 / ts_rank_cd)
+        scores = {('job', pk): score for pk, score in legacy_scores.items()}
+        scores.update({('employer_job', pk): score for pk, score in employer_scores.items()})
+        keys, next_cursor = feed.ranked_page(entries, scores, cursor)
+    else:
+        page_entries, next_cursor = feed.page(entries, cursor)
+        keys = [(entry.kind, entry.object_id) for entry in page_entries]
+
+    next_query = None
+    if next_cursor:
+        params = request.GET.copy()
+        params['cursor'] = next_cursor
+        next_query = params.urlencode()
+
+    return {
+        'jobs': feed.hydrate(keys),
+        'facets': job_facets,
+        'next_query': next_query,
     }
-    return render(request, 'hr_bolim/jobs_list.html', context)
 
+@throttle.limit('register')
 def register_view(request):
     if request.method == 'POST':
         form = CustomUserCreationForm(request.POST)
@@ -160,6 +180,8 @@ def register_view(request):
         form = CustomUserCreationForm()
     return render(request, 'hr_bolim/register.html', {'form': form})
 
+# Limit authenticate() (parol xeshlash) dan oldin tekshiriladi; faqat xato urinishlar sanaladi
+@method_decorator(throttle.limit('login', username_field='username', failures_only=True), name='post')
 class CustomLoginView(LoginView):
     template_name = 'hr_bolim/login.html'
     authentication_form = CustomAuthenticationForm
@@ -198,6 +220,7 @@ def candidate_dashboard(request):
         'saved_count': saved_count,
         'interview_count': interview_count,
         'unread_messages': unread_messages,
+        'recommended_jobs': matching.recommended_jobs(profile),
     }
     return render(request, 'hr_bolim/candidate/dashboard.html', context)
 
@@ -363,9 +386,7 @@ def delete_item(request, model_name, id):
 # GDPR view
 
 from django.http import HttpResponse, JsonResponse
-from django.core import serializers
 from .models import PrivacyPolicy, DataDeletionRequest
-import json
 from django.shortcuts import render
 
 @candidate_required
@@ -420,14 +441,10 @@ def apply_employer_job(request, job_id):
         messages.error(request, "Vakansiya topilmadi.")
         return redirect('jobs_list')
 
-    # Check duplicate
-    if CandidateApplication.objects.filter(job=emp_job, candidate=request.user).exists():
-        messages.warning(request, "Siz bu vakansiyaga allaqachon topshirgansiz.")
-        return redirect('jobs_list')
-
     if request.method == 'POST':
         # Similar resume selection logic as apply_job
         resume_id = request.POST.get('resume_id')
+        uploaded = False
         if resume_id:
             try:
                 resume = Resume.objects.get(id=resume_id, user=request.user)
@@ -438,11 +455,12 @@ def apply_employer_job(request, job_id):
             resume_file = request.user.candidate_profile.resume_file
         elif 'resume_file' in request.FILES:
             resume_file = request.FILES['resume_file']
+            uploaded = True
         else:
             messages.error(request, "Rezyume yuklang yoki tanlang.")
             return redirect('jobs_list')
 
-        ca = CandidateApplication.objects.create(
+        application = CandidateApplication(
             job=emp_job,
             candidate=request.user,
             resume_file=resume_file,
@@ -450,10 +468,18 @@ def apply_employer_job(request, job_id):
             consent_given=True,
             consent_date=timezone.now()
         )
-
-        # Update counts
-        emp_job.application_count = emp_job.application_count + 1
-        emp_job.save()
+        # Ariza va hisoblagichlar (application_count, CompanyProfile, CompanyStats -
+        # signal orqali F() bilan, hr_bolim.stats) bitta tranzaksiyada.
+        # Takroriy ariza oldindan tekshirilmaydi: unique_together (job, candidate)
+        # parallel so'rovlarda ham ikkinchisini IntegrityError bilan to'xtatadi.
+        try:
+            with transaction.atomic():
+                application.save()
+        except IntegrityError:
+            if uploaded:
+                application.resume_file.delete(save=False)
+            messages.warning(request, "Siz bu vakansiyaga allaqachon topshirgansiz.")
+            return redirect('jobs_list')
 
         messages.success(request, "Arizangiz muvaffaqiyatli yuborildi!")
         return redirect('my_applications')
@@ -462,8 +488,8 @@ def apply_employer_job(request, job_id):
 
 @candidate_required
 def my_applications(request):
-    legacy_apps = Application.objects.filter(user=request.user).order_by('-applied_at')
-    employer_apps = CandidateApplication.objects.filter(candidate=request.user).order_by('-applied_at')
+    legacy_apps = Application.objects.filter(user=request.user).select_related('job__department').order_by('-applied_at')
+    employer_apps = CandidateApplication.objects.filter(candidate=request.user).select_related('job__company').order_by('-applied_at')
 
     combined = []
     # Legacy applications
@@ -495,43 +521,65 @@ def my_applications(request):
 def candidate_interviews(request):
     """Show all interviews scheduled for the candidate"""
     # Get all interviews for this candidate's applications
-    interviews = Interview.objects.filter(
-        application__candidate=request.user
-    ).order_by('-scheduled_date')
+    interviews = Interview.objects.for_candidate(request.user).for_listing()
+    page_obj = Paginator(interviews, 20).get_page(request.GET.get('page'))
     
     context = {
-        'interviews': interviews
+        'interviews': page_obj,
+        'page_obj': page_obj,
     }
     return render(request, 'hr_bolim/candidate/interviews.html', context)
 
+@candidate_required
+def saved_searches(request):
+    """Saqlangan qidiruvlar: jobs_list filtrlaridan saqlash, xabarnomani yoqish/o'chirish, o'chirish"""
+    if request.method == 'POST':
+        action = request.POST.get('action', 'create')
+        if action == 'create':
+            if alerts.limit_reached(request.user):
+                messages.warning(request, "Saqlangan qidiruvlar soni chegarasiga yetdingiz.")
+            else:
+                alerts.create_from_params(request.user, request.POST, request.POST.get('name', ''))
+                messages.success(request, "Qidiruv saqlandi. Yangi mos vakansiyalar haqida xabar beramiz.")
+        else:
+            search = get_object_or_404(SavedSearch, pk=request.POST.get('search_id'), user=request.user)
+            if action == 'toggle':
+                search.is_active = not search.is_active
+                search.save(update_fields=['is_active'])
+            elif action == 'delete':
+                search.delete()
+                messages.warning(request, "Qidiruv o'chirildi.")
+        return redirect('saved_searches')
+
+    searches = (
+        SavedSearch.objects.filter(user=request.user)
+        .select_related('company', 'department')
+        .annotate(pending=Count('matches', filter=Q(matches__notified_at__isnull=True)))
+        .order_by('-created_at')
+    )
+    return render(request, 'hr_bolim/candidate/saved_searches.html', {'searches': searches})
+
+def _conversation_page(request):
+    """Foydalanuvchining yozishmalari, oxirgi faollik bo'yicha sahifalangan (2 ta so'rov)."""
+    paginator = Paginator(Conversation.objects.for_user(request.user), 30)
+    page_obj = paginator.get_page(request.GET.get('page'))
+    conversations = [
+        {
+            'user': conversation.other_user(request.user),
+            'last_message': conversation.last_message,
+            'unread': conversation.unread_for(request.user),
+        }
+        for conversation in page_obj
+    ]
+    return page_obj, conversations
+
 @login_required
 def inbox(request):
-    # Get all users who have exchanged messages with current user
-    # This is a simple approach, distinct() might be needed database-wise or python-wise
-    sent_to = Message.objects.filter(sender=request.user).values_list('recipient', flat=True)
-    received_from = Message.objects.filter(recipient=request.user).values_list('sender', flat=True)
-    
-    user_ids = set(list(sent_to) + list(received_from))
-    
-    conversations = []
-    for user_id in user_ids:
-        other_user = User.objects.get(id=user_id)
-        last_msg = Message.objects.filter(
-            Q(sender=request.user, recipient=other_user) | 
-            Q(sender=other_user, recipient=request.user)
-        ).order_by('-timestamp').first()
-        
-        conversations.append({
-            'user': other_user,
-            'last_message': last_msg
-        })
-    
-    # Sort by last message timestamp
-    conversations.sort(key=lambda x: x['last_message'].timestamp, reverse=True)
-    
-    return render(request, 'hr_bolim/candidate/inbox.html', {'conversations': conversations})
+    page_obj, conversations = _conversation_page(request)
+    return render(request, 'hr_bolim/candidate/inbox.html', {'conversations': conversations, 'page_obj': page_obj})
 
 @login_required
+@throttle.limit('chat_send')
 def chat_detail(request, user_id):
     other_user = get_object_or_404(User, id=user_id)
     
@@ -541,19 +589,65 @@ def chat_detail(request, user_id):
             Message.objects.create(sender=request.user, recipient=other_user, content=content)
             return redirect('chat_detail', user_id=user_id)
     
-    messages_qs = Message.objects.filter(
-        Q(sender=request.user, recipient=other_user) | 
-        Q(sender=other_user, recipient=request.user)
-    ).order_by('timestamp')
+    # Eng yangi sahifa; ?before=<id> bilan eskiroq xabarlar
+    messages_qs, has_more = chat.history(request.user, other_user, before=chat.parse_cursor(request.GET.get('before')))
     
-    # Mark received as read
-    Message.objects.filter(sender=other_user, recipient=request.user, is_read=False).update(is_read=True)
+    # Mark received as read (faqat ko'rsatilgan xabarlargacha)
+    chat.mark_read_until(request.user, other_user, messages_qs)
     
     return render(request, 'hr_bolim/candidate/chat.html', {
         'other_user': other_user,
-        'messages': messages_qs
+        'chat_messages': messages_qs,
+        'has_more': has_more,
     })
 
+@login_required
+def chat_messages_api(request, user_id):
+    """JSON chat tarixi: ?before=<id> eski xabarlar, ?after=<id> yangi xabarlar (polling)"""
+    other_user = get_object_or_404(User, id=user_id)
+    page, has_more = chat.history(
+        request.user, other_user,
+        before=chat.parse_cursor(request.GET.get('before')),
+        after=chat.parse_cursor(request.GET.get('after')),
+    )
+    chat.mark_read_until(request.user, other_user, page)
+    return JsonResponse({
+        'messages': [chat.serialize(m) for m in page],
+        'has_more': has_more,
+    })
+
+async def realtime_events(request):
+    """SSE oqimi: joriy foydalanuvchiga kelgan xabarlar va o'qildi belgilari.
+
+    Faqat ASGI ostida ishlaydi; WSGI'da 501 qaytadi va sahifa polling'ga o'tadi.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=501)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return HttpResponse(status=401)
+
+    subscription = realtime.get_broker().subscribe(realtime.user_channel(user.id))
+    keepalive = getattr(settings, 'REALTIME_KEEPALIVE', 15)
+
+    async def stream():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await subscription.get(timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield realtime.format_sse(event)
+        finally:
+            subscription.close()
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 @login_required
 def candidate_gdpr(request):
     if request.user.role != 'candidate':
@@ -565,25 +659,15 @@ def candidate_gdpr(request):
         action = request.POST.get('action')
         
         if action == 'export_data':
-            # Collect data
-            user_data = serializers.serialize('json', [request.user])
-            try:
-                prof_qs = [request.user.candidate_profile]
-            except:
-                prof_qs = []
-            profile_data = serializers.serialize('json', prof_qs)
-            exp_data = serializers.serialize('json', request.user.experiences.all())
-            edu_data = serializers.serialize('json', request.user.educations.all())
-            
-            full_data = {
-                "user": json.loads(user_data),
-                "profile": json.loads(profile_data),
-                "experiences": json.loads(exp_data),
-                "educations": json.loads(edu_data),
-            }
-            
-            resp = HttpResponse(json.dumps(full_data, indent=4), content_type='application/json')
-            resp['Content-Disposition'] = 'attachment; filename="my_data_export.json"'
+            # Barcha shaxsiy ma'lumotlar va fayllar ZIP oqimi sifatida (hr_bolim.gdpr)
+            audit.log("GDPR export", user=request.user, ip_address=request.META.get('REMOTE_ADDR'))
+            # ASGI: async iterator - aks holda Django butun ZIP'ni xotirada yig'ib oladi
+            if isinstance(request, ASGIRequest):
+                content = gdpr.export_stream_async(request.user)
+            else:
+                content = gdpr.export_stream(request.user)
+            resp = StreamingHttpResponse(content, content_type='application/zip')
+            resp['Content-Disposition'] = f'attachment; filename="{gdpr.export_filename(request.user)}"'
             return resp
         
         elif action == 'delete_account':
@@ -643,17 +727,14 @@ def employer_dashboard(request):
     except Company.DoesNotExist:
         return redirect('employer_register')
     
-    # Statistics
-    total_jobs = EmployerJob.objects.filter(company=company).count()
-    active_jobs = EmployerJob.objects.filter(company=company, status='active').count()
-    total_applications = CandidateApplication.objects.filter(job__company=company).count()
-    new_applications = CandidateApplication.objects.filter(job__company=company, status='new').count()
+    # Statistics (jamlangan qator, hr_bolim.stats)
+    company_stats = stats.for_company(company)
+    total_jobs, active_jobs = company_stats.jobs_total, company_stats.jobs_active
+    total_applications, new_applications = company_stats.applications_total, company_stats.applications_new
     profile_views = profile.profile_views if profile else 0
     
     # Recent applications
-    recent_applications = CandidateApplication.objects.filter(
-        job__company=company
-    ).order_by('-applied_at')[:5]
+    recent_applications = CandidateApplication.objects.for_company(company).for_employer_listing()[:5]
     
     # Popular jobs
     popular_jobs = EmployerJob.objects.filter(
@@ -673,6 +754,7 @@ def employer_dashboard(request):
     }
     return render(request, 'hr_bolim/employer/dashboard.html', context)
 
+@throttle.limit('employer_register')
 def employer_register_public(request):
     """Public employer registration for new users"""
     if request.method == 'POST':
@@ -704,6 +786,7 @@ def employer_register_public(request):
     return render(request, 'hr_bolim/employer/register.html', {'form': form})
 
 @login_required
+@throttle.limit('employer_register')
 def employer_register(request):
     """For existing employers to complete company registration"""
     if request.user.role != 'employer':
@@ -799,14 +882,6 @@ def create_job(request):
             job.status = 'active'
             job.save()
             
-            # Update profile stats
-            try:
-                profile = CompanyProfile.objects.get(company=company)
-                profile.total_jobs_posted += 1
-                profile.save()
-            except CompanyProfile.DoesNotExist:
-                pass
-            
             messages.success(request, "Vakansiya muvaffaqiyatli joylandi!")
             return redirect('employer_jobs')
     else:
@@ -836,6 +911,43 @@ def edit_job(request, job_id):
     
     return render(request, 'hr_bolim/employer/edit_job.html', {'form': form, 'job': job})
 
+@login_required
+def job_matches(request, job_id):
+    if request.user.role != 'employer':
+        return redirect('home')
+
+    try:
+        company = Company.objects.get(user=request.user)
+        job = EmployerJob.objects.get(id=job_id, company=company)
+    except (Company.DoesNotExist, EmployerJob.DoesNotExist):
+        return redirect('employer_jobs')
+
+    context = {
+        'job': job,
+        'matches': matching.top_candidates(job, limit=20),
+    }
+    return render(request, 'hr_bolim/employer/job_matches.html', context)
+
+@login_required
+def talent_search(request):
+    if request.user.role != 'employer':
+        return redirect('home')
+
+    profiles, next_cursor = talent.search(request.GET, request.GET.get('cursor'))
+
+    next_query = None
+    if next_cursor:
+        params = request.GET.copy()
+        params['cursor'] = next_cursor
+        next_query = params.urlencode()
+
+    context = {
+        'profiles': profiles,
+        'next_query': next_query,
+        'filters': request.GET,
+    }
+    return render(request, 'hr_bolim/employer/talent_search.html', context)
+
 @login_required
 def delete_job(request, job_id):
     if request.user.role != 'employer':
@@ -861,9 +973,7 @@ def employer_applications(request):
     except Company.DoesNotExist:
         return redirect('employer_register')
     
-    applications = CandidateApplication.objects.filter(
-        job__company=company
-    ).order_by('-applied_at')
+    applications = CandidateApplication.objects.for_company(company).for_employer_listing()
     
     # Filter by status
     status_filter = request.GET.get('status')
@@ -876,10 +986,12 @@ def employer_applications(request):
         applications = applications.filter(job_id=job_filter)
     
     jobs = EmployerJob.objects.filter(company=company)
+    page_obj = Paginator(applications, 20).get_page(request.GET.get('page'))
     
     context = {
         'company': company,
-        'applications': applications,
+        'applications': page_obj,
+        'page_obj': page_obj,
         'jobs': jobs,
         'status_filter': status_filter,
         'job_filter': job_filter,
@@ -914,6 +1026,8 @@ def application_detail(request, application_id):
         candidate_profile = application.candidate.candidate_profile
     except:
         candidate_profile = None
+    else:
+        counters.candidate_profile_views.incr(candidate_profile.pk)
     
     context = {
         'company': company,
@@ -948,7 +1062,7 @@ def schedule_interview(request, application_id):
             application.status = 'interview'
             application.save()
             
-            # Send notification to candidate (you can implement email sending here)
+            # Nomzodga xat signal orqali navbatga qo'yiladi (hr_bolim.notifications)
             messages.success(request, "Intervyu muvaffaqiyatli rejalashtirildi!")
             return redirect('application_detail', application_id=application_id)
     else:
@@ -972,15 +1086,14 @@ def employer_statistics(request):
     except CompanyProfile.DoesNotExist:
         profile = CompanyProfile.objects.create(company=company)
     
-    # Basic stats
-    total_jobs = EmployerJob.objects.filter(company=company).count()
-    active_jobs = EmployerJob.objects.filter(company=company, status='active').count()
-    total_applications = CandidateApplication.objects.filter(job__company=company).count()
+    # Basic stats (jamlangan qator, hr_bolim.stats)
+    company_stats = stats.for_company(company)
+    total_jobs, active_jobs = company_stats.jobs_total, company_stats.jobs_active
+    total_applications = company_stats.applications_total
+    accepted_count = company_stats.applications_accepted
     
     # Application stats by status
-    application_stats = CandidateApplication.objects.filter(
-        job__company=company
-    ).values('status').annotate(count=Count('id'))
+    application_stats = company_stats.application_stats()
     
     # Most viewed jobs
     most_viewed = EmployerJob.objects.filter(
@@ -993,9 +1106,7 @@ def employer_statistics(request):
     ).annotate(app_count=Count('applications')).order_by('-app_count')[:10]
     
     # Recent activity
-    recent_applications = CandidateApplication.objects.filter(
-        job__company=company
-    ).order_by('-applied_at')[:10]
+    recent_applications = CandidateApplication.objects.for_company(company).for_employer_listing()[:10]
     
     context = {
         'company': company,
@@ -1007,6 +1118,12 @@ def employer_statistics(request):
         'most_viewed': most_viewed,
         'most_applied': most_applied,
         'recent_applications': recent_applications,
+        'avg_applications': total_applications / total_jobs if total_jobs else 0,
+        'acceptance_rate': accepted_count * 100 / total_applications if total_applications else 0,
+        'active_rate': active_jobs * 100 / total_jobs if total_jobs else 0,
+        # Kunlik jamlangan qatorlardan (hr_bolim.analytics)
+        'funnel': analytics.funnel(company, period=request.GET.get('period', 'week')),
+        'time_to_hire': analytics.time_to_hire(company),
     }
     return render(request, 'hr_bolim/employer/statistics.html', context)
 
@@ -1020,31 +1137,11 @@ def employer_messages(request):
     except Company.DoesNotExist:
         return redirect('employer_register')
     
-    # Get all conversations
-    sent_to = Message.objects.filter(sender=request.user).values_list('recipient', flat=True)
-    received_from = Message.objects.filter(recipient=request.user).values_list('sender', flat=True)
-    
-    user_ids = set(list(sent_to) + list(received_from))
-    
-    conversations = []
-    for user_id in user_ids:
-        other_user = User.objects.get(id=user_id)
-        last_msg = Message.objects.filter(
-            Q(sender=request.user, recipient=other_user) | 
-            Q(sender=other_user, recipient=request.user)
-        ).order_by('-timestamp').first()
-        
-        conversations.append({
-            'user': other_user,
-            'last_message': last_msg
-        })
-    
-    # Sort by last message timestamp
-    conversations.sort(key=lambda x: x['last_message'].timestamp, reverse=True)
-    
-    return render(request, 'hr_bolim/employer/messages.html', {'conversations': conversations})
+    page_obj, conversations = _conversation_page(request)
+    return render(request, 'hr_bolim/employer/messages.html', {'conversations': conversations, 'page_obj': page_obj})
 
 @login_required
+@throttle.limit('chat_send')
 def employer_chat_detail(request, user_id):
     if request.user.role != 'employer':
         return redirect('home')
@@ -1062,32 +1159,39 @@ def employer_chat_detail(request, user_id):
             Message.objects.create(sender=request.user, recipient=other_user, content=content)
             return redirect('employer_chat_detail', user_id=user_id)
     
-    messages_qs = Message.objects.filter(
-        Q(sender=request.user, recipient=other_user) | 
-        Q(sender=other_user, recipient=request.user)
-    ).order_by('timestamp')
+    # Eng yangi sahifa; ?before=<id> bilan eskiroq xabarlar
+    messages_qs, has_more = chat.history(request.user, other_user, before=chat.parse_cursor(request.GET.get('before')))
     
-    # Mark received as read
-    Message.objects.filter(sender=other_user, recipient=request.user, is_read=False).update(is_read=True)
+    # Mark received as read (faqat ko'rsatilgan xabarlargacha)
+    chat.mark_read_until(request.user, other_user, messages_qs)
     
     return render(request, 'hr_bolim/employer/chat.html', {
         'company': company,
         'other_user': other_user,
-        'messages': messages_qs
+        'chat_messages': messages_qs,
+        'has_more': has_more,
     })
 
 @login_required
 def job_detail(request, job_id):
     """Show detailed information about a specific job"""
-    try:
-        job = EmployerJob.objects.get(id=job_id)
-    except EmployerJob.DoesNotExist:
+    # Vakansiya va kompaniya obyekti keshdan (hr_bolim.pagecache); view_count
+    # write-behind bo'lgani kabi keshdagi qiymat ham biroz orqada qolishi mumkin
+    job = pagecache.get_or_set(
+        'job_detail', (job_id,),
+        lambda: EmployerJob.objects.select_related('company__profile').filter(id=job_id).first(),
+    )
+    if job is None:
         messages.error(request, "Vakansiya topilmadi.")
         return redirect('jobs_list')
     
-    # Increment view count
-    job.view_count += 1
-    job.save(update_fields=['view_count'])
+    # Increment view count (write-behind, hr_bolim.counters)
+    counters.job_views.incr(job.pk)
+    job.view_count += counters.job_views.pending(job.pk)
+    try:
+        counters.company_profile_views.incr(job.company.profile.pk)
+    except CompanyProfile.DoesNotExist:
+        pass
     
     # Check if user has already applied
     has_applied = False
@@ -1112,12 +1216,12 @@ def employer_interviews(request):
         return redirect('employer_register')
     
     # Get all interviews for this company's job applications
-    interviews = Interview.objects.filter(
-        application__job__company=company
-    ).order_by('-scheduled_date')
+    interviews = Interview.objects.for_company(company).for_listing()
+    page_obj = Paginator(interviews, 20).get_page(request.GET.get('page'))
     
     context = {
-        'interviews': interviews,
+        'interviews': page_obj,
+        'page_obj': page_obj,
         'company': company,
     }
     return render(request, 'hr_bolim/employer/interviews.html', context)
@@ -1154,20 +1258,32 @@ def admin_companies(request):
     if request.user.role != 'admin' and not request.user.is_superuser:
         return redirect('home')
     
-    companies = Company.objects.all().order_by('-created_at')
+    companies = Company.objects.select_related('profile').order_by('-created_at')
     
     context = {
         'companies': companies,
     }
     return render(request, 'hr_bolim/admin/companies.html', context)
 
+@login_required
+def admin_approve_company(request, company_id):
+    """Kompaniyani tasdiqlash"""
+    if request.user.role != 'admin' and not request.user.is_superuser:
+        return redirect('home')
+    
+    if request.method == 'POST':
+        Company.objects.filter(id=company_id).update(is_verified=True, updated_at=timezone.now())
+        pagecache.invalidate()
+        messages.success(request, "Kompaniya tasdiqlandi.")
+    return redirect('admin_companies')
+
 @login_required
 def admin_gdpr_logs(request):
     """Admin GDPR logs view"""
     if request.user.role != 'admin' and not request.user.is_superuser:
         return redirect('home')
     
-    logs = ConsentLog.objects.all().order_by('-given_at')
+    logs = ConsentLog.objects.select_related('user').order_by('-given_at')
     
     context = {
         'logs': logs,